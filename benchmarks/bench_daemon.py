@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""Compare per-call latency of `grd` in-process vs through `grd serve`.
+
+Reports wall time for a fresh `grd next` process without a daemon, the same
+command forwarded to a running daemon, and direct JSON-RPC calls over the
+daemon socket (no interpreter startup at all).
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+SRC = Path(__file__).resolve().parents[1] / "src"
+sys.path.insert(0, str(SRC))
+
+from get_research_done.grd_client import call, socket_path  # noqa: E402
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--cli-runs", type=int, default=10, help="Process launches per CLI mode.")
+    parser.add_argument("--rpc-calls", type=int, default=500, help="Direct JSON-RPC calls to time.")
+    return parser.parse_args()
+
+
+def _time_process(argv: list[str], env: dict[str, str], runs: int) -> float:
+    samples = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run(argv, env=env, check=True, stdout=subprocess.DEVNULL)
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples) * 1000
+
+
+def main() -> int:
+    args = parse_args()
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, (str(SRC), env.get("PYTHONPATH"))))
+    grd = [sys.executable, "-m", "get_research_done.grd_client"]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        local_env = {**env, "GRD_NO_DAEMON": "1"}
+        # The first run bootstraps `.grd/`; only steady-state calls are timed.
+        _time_process([*grd, "--repo-root", tmp, "next"], local_env, 1)
+        local_ms = _time_process([*grd, "--repo-root", tmp, "next"], local_env, args.cli_runs)
+
+        daemon = subprocess.Popen([*grd, "--repo-root", tmp, "serve"], env=env, stdout=subprocess.DEVNULL)
+        try:
+            deadline = time.monotonic() + 10
+            while not os.path.exists(socket_path(tmp)):
+                if time.monotonic() > deadline:
+                    print("grd serve did not start", file=sys.stderr)
+                    return 1
+                time.sleep(0.05)
+
+            forwarded_ms = _time_process([*grd, "--repo-root", tmp, "next"], env, args.cli_runs)
+
+            call(tmp, "next")
+            samples = []
+            for _ in range(args.rpc_calls):
+                start = time.perf_counter()
+                call(tmp, "next")
+                samples.append(time.perf_counter() - start)
+            rpc_ms = statistics.median(samples) * 1000
+        finally:
+            daemon.terminate()
+            daemon.wait(timeout=10)
+
+    results = {
+        "cli_in_process_ms": round(local_ms, 2),
+        "cli_via_daemon_ms": round(forwarded_ms, 2),
+        "rpc_next_ms": round(rpc_ms, 3),
+    }
+    print(json.dumps(results, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
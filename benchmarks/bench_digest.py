@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""Time the bounded `GrdContext.to_markdown` digest on a large state.
+
+Compares the budgeted renderer against dumping the whole state and slicing,
+and times a repeat call on an unchanged state, which is served from the
+digest cache.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from get_research_done.serialization import safe_dump  # noqa: E402
+from get_research_done.state import ResearchState, load_context  # noqa: E402
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--keys", type=int, default=5000, help="Top-level keys in the synthetic state.")
+    parser.add_argument("--max-chars", type=int, default=2400, help="Digest budget.")
+    return parser.parse_args()
+
+
+def timed(fn) -> tuple[float, object]:
+    start = time.perf_counter()
+    value = fn()
+    return time.perf_counter() - start, value
+
+
+def main() -> int:
+    args = parse_args()
+    state = {"objective": "Reduce validation loss below baseline", "next_action": "Run seed sweep"}
+    for i in range(args.keys):
+        state[f"run_{i:05d}"] = {"metrics": {"loss": round(1.0 / (i + 1), 6)}, "seeds": [i]}
+
+    with tempfile.TemporaryDirectory() as tmp:
+        rs = ResearchState(tmp)
+        rs.update(state)
+        rs.roadmap_path.write_text("# Roadmap\n", encoding="utf-8")
+        context = load_context(tmp)
+
+        full_s, _ = timed(lambda: safe_dump(context.state, sort_keys=False)[: args.max_chars])
+        budgeted_s, digest = timed(lambda: context.to_markdown(max_chars=args.max_chars))
+        reload_s, reloaded = timed(lambda: load_context(tmp))
+        cached_s, _ = timed(lambda: reloaded.to_markdown(max_chars=args.max_chars))
+
+    results = {
+        "keys": args.keys,
+        "max_chars": args.max_chars,
+        "digest_chars": len(digest),
+        "dump_then_slice_s": round(full_s, 6),
+        "budgeted_s": round(budgeted_s, 6),
+        "reload_context_s": round(reload_s, 6),
+        "cached_s": round(cached_s, 6),
+    }
+    print(json.dumps(results, indent=2))
+    return 0 if len(digest) <= args.max_chars else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
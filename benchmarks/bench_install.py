@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""Time `install_targets` into a fresh destination and re-installs over it.
+
+A re-install over an unchanged tree is served from the install manifest;
+`--touch` bumps every installed file's mtime first to time the hash-compare
+path instead. `--link-mode` compares copy against linked skill trees, also by
+disk usage.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from get_research_done.installer import LINK_MODES, install_targets  # noqa: E402
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--target", action="append", default=[], help="Install target (repeatable; default: all).")
+    parser.add_argument("--repeat", type=int, default=5, help="Re-installs to time.")
+    parser.add_argument("--touch", action="store_true", help="Bump installed mtimes before each re-install.")
+    parser.add_argument("--link-mode", choices=LINK_MODES, default="copy", help="How skill targets share files.")
+    return parser.parse_args()
+
+
+def _touch_all(root: Path) -> None:
+    for dirpath, _, names in os.walk(root):
+        for name in names:
+            os.utime(Path(dirpath) / name)
+
+
+def _disk_bytes(root: Path) -> int:
+    """Allocated bytes under `root`, counting each hard-linked inode once and symlinks as links."""
+    seen: set[tuple[int, int]] = set()
+    total = 0
+    for dirpath, _, names in os.walk(root):
+        for name in names:
+            stat = os.lstat(Path(dirpath) / name)
+            if (stat.st_dev, stat.st_ino) in seen:
+                continue
+            seen.add((stat.st_dev, stat.st_ino))
+            total += getattr(stat, "st_blocks", 0) * 512 or stat.st_size
+    return total
+
+
+def main() -> int:
+    args = parse_args()
+    targets = args.target or ["all"]
+    with tempfile.TemporaryDirectory() as tmp:
+        start = time.perf_counter()
+        first = install_targets(tmp, targets, link_mode=args.link_mode)
+        fresh_s = time.perf_counter() - start
+        disk_bytes = _disk_bytes(Path(tmp))
+
+        reinstall_s: list[float] = []
+        for _ in range(args.repeat):
+            if args.touch:
+                _touch_all(Path(tmp))
+            start = time.perf_counter()
+            again = install_targets(tmp, targets, link_mode=args.link_mode)
+            reinstall_s.append(time.perf_counter() - start)
+
+    results = {
+        "targets": list(first.installed_targets),
+        "link_mode": args.link_mode,
+        "copied": first.copied,
+        "linked": first.linked,
+        "disk_bytes": disk_bytes,
+        "fresh_s": round(fresh_s, 6),
+        "reinstall_median_s": round(sorted(reinstall_s)[len(reinstall_s) // 2], 6),
+        "reinstall_copied": again.copied,
+        "reinstall_skipped": again.skipped,
+    }
+    print(json.dumps(results, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""Hammer one `.grd/` from N worker processes and check nothing is lost.
+
+Each worker appends journal entries and increments a STATE counter under
+`ResearchState.lock()`. The run fails if any entry or increment is missing,
+if the journal index disagrees with a full rescan, or if the maintained
+`.grd/counters.json` missed an append.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import multiprocessing
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from get_research_done.entry_index import EntryIndex  # noqa: E402
+from get_research_done.state import ResearchState  # noqa: E402
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--workers", type=int, default=8, help="Concurrent worker processes.")
+    parser.add_argument("--entries", type=int, default=200, help="Journal entries per worker.")
+    parser.add_argument("--updates", type=int, default=20, help="Counter increments per worker.")
+    return parser.parse_args()
+
+
+def worker(root: str, worker_id: int, entries: int, updates: int) -> None:
+    rs = ResearchState(root, lock_timeout=60)
+    for i in range(entries):
+        rs.append_journal({"what": f"worker {worker_id} entry {i}", "happened": "ok", "why": "contention"})
+        if i < updates:
+            with rs.lock():
+                counter = int(rs.load().get("counter", 0))
+                rs.update({"counter": counter + 1})
+
+
+def main() -> int:
+    args = parse_args()
+    with tempfile.TemporaryDirectory() as tmp:
+        rs = ResearchState(tmp)
+        rs.update({"counter": 0})
+        rs.counts()
+
+        start = time.perf_counter()
+        procs = [
+            multiprocessing.Process(target=worker, args=(tmp, n, args.entries, args.updates))
+            for n in range(args.workers)
+        ]
+        for proc in procs:
+            proc.start()
+        for proc in procs:
+            proc.join()
+        elapsed = time.perf_counter() - start
+
+        expected_entries = args.workers * args.entries
+        expected_counter = args.workers * min(args.updates, args.entries)
+        rs.render()
+        journal_text = rs.journal_path.read_text(encoding="utf-8")
+        found_entries = sum(1 for line in journal_text.splitlines() if line.startswith("## "))
+        distinct = len({line for line in journal_text.splitlines() if line.startswith("- what: ")})
+        index = EntryIndex(rs.journal_path)
+        index_matches_rescan = index.entries() == index.rebuild()
+        counter = int(rs.load().get("counter", 0))
+        # Read the file directly: `counts()` would silently catch up missed appends.
+        maintained = rs._load_counters() or {}
+
+    results = {
+        "workers": args.workers,
+        "elapsed_s": round(elapsed, 3),
+        "appends_per_s": round(expected_entries / elapsed, 1),
+        "expected_entries": expected_entries,
+        "found_entries": found_entries,
+        "distinct_entries": distinct,
+        "index_matches_rescan": index_matches_rescan,
+        "expected_counter": expected_counter,
+        "counter": counter,
+        "maintained_journal_count": maintained.get("journal"),
+    }
+    print(json.dumps(results, indent=2))
+    ok = (
+        found_entries == distinct == expected_entries
+        and index_matches_rescan
+        and counter == expected_counter
+        and maintained.get("journal") == expected_entries
+    )
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
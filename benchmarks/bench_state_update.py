@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""Time `ResearchState.update` on a STATE.md with a large markdown body.
+
+Compares the current atomic, body-streaming update against the previous
+read-split-rewrite approach and checks both leave the body intact.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import yaml
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from get_research_done.state import ResearchState  # noqa: E402
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--body-mb", type=int, default=20, help="Size of the synthetic markdown body.")
+    parser.add_argument("--repeat", type=int, default=5, help="Timed updates per approach (best is reported).")
+    return parser.parse_args()
+
+
+def write_state(path: Path, body_mb: int) -> str:
+    row = "| R-20260101-01 | 2026-01-01 | abc1234 | train.py | cfg.yaml | 0,1,2 | loss=0.12 | out/ | ok |\n"
+    body = "# STATE\n\n## Run registry (executed evidence)\n" + row * (body_mb * 1024 * 1024 // len(row))
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text("---\nobjective: bench\ncounter: 0\n---\n" + body, encoding="utf-8")
+    return body
+
+
+def legacy_update(path: Path, patches: dict[str, object]) -> None:
+    content = path.read_text(encoding="utf-8")
+    parts = content.split("---", 2)
+    state = yaml.safe_load(parts[1]) or {}
+    state.update(patches)
+    with path.open("w", encoding="utf-8") as handle:
+        handle.write("---\n")
+        handle.write(yaml.safe_dump(state, sort_keys=False, default_flow_style=False))
+        handle.write("---")
+        handle.write(parts[2])
+
+
+def best_of(repeat: int, fn) -> float:
+    best = float("inf")
+    for i in range(repeat):
+        start = time.perf_counter()
+        fn(i)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> int:
+    args = parse_args()
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        state_path = root / ".grd" / "STATE.md"
+        body = write_state(state_path, args.body_mb)
+
+        legacy_s = best_of(args.repeat, lambda i: legacy_update(state_path, {"counter": i}))
+        rs = ResearchState(root)
+        atomic_s = best_of(args.repeat, lambda i: rs.update({"counter": i}))
+
+        if not state_path.read_text(encoding="utf-8").endswith(body):
+            print("update did not preserve the markdown body", file=sys.stderr)
+            return 1
+
+    print(
+        json.dumps(
+            {
+                "body_mb": args.body_mb,
+                "legacy_update_s": legacy_s,
+                "atomic_update_s": atomic_s,
+                "speedup": round(legacy_s / atomic_s, 2),
+            },
+            indent=2,
+        )
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
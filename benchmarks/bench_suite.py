@@ -0,0 +1,235 @@
+#!/usr/bin/env python3
+"""Time and measure peak RSS of `grd` subcommands and `ResearchState` methods.
+
+Every case runs in a fresh child process against a synthetic `.grd/` tree (see
+`synthetic_tree.py`), so timings include a cold import where a CLI invocation
+would. Results are printed as JSON and can be compared against a stored
+baseline to catch scaling regressions.
+
+Linux carries a parent's peak RSS over into a forked child, so this driver
+stays import-light (the tree is generated in a subprocess too); otherwise
+every case would report the driver's own high-water mark.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+BENCH_DIR = Path(__file__).resolve().parent
+SRC_DIR = BENCH_DIR.parent / "src"
+DEFAULT_BASELINE = BENCH_DIR / "baselines" / "suite.json"
+SIZE_FLAGS = ("journal", "hypotheses", "runs", "state_mb")
+
+CLI_CASES = {
+    "info": ["info", "--json"],
+    "run": ["run", "--skill", "grd-bench", "--json", "--no-cache"],
+    "next": ["next", "--json"],
+    "log": ["log", "--what", "bench", "--happened", "ok", "--why", "suite", "--json"],
+    "log_experiment": ["log", "--what", "bench", "--happened", "ok", "--why", "suite", "--outcome", "acc=1", "--json"],
+    "promote": ["promote", "--title", "Bench", "--what", "bench", "--happened", "ok", "--why", "suite", "--json"],
+    "query": ["query", "sweep", "--limit", "20", "--json"],
+    "render": ["render", "--json"],
+    "doctor": ["doctor", "--json"],
+}
+
+_ENTRY = {"what": "bench", "happened": "ok", "why": "suite"}
+METHOD_CASES = {
+    "load": lambda rs: rs.load(),
+    "update": lambda rs: rs.update({"next_action": "Benchmark suite"}),
+    "append_journal": lambda rs: rs.append_journal(_ENTRY),
+    "append_experiment": lambda rs: rs.append_experiment({**_ENTRY, "outcome": "acc=1"}),
+    "promote_hypothesis": lambda rs: rs.promote_hypothesis({**_ENTRY, "title": "Bench"}),
+    "render": lambda rs: rs.render(),
+    "counts": lambda rs: rs.counts(),
+    "count_hypotheses": lambda rs: rs.count_hypotheses(),
+    "list_hypotheses": lambda rs: rs.list_hypotheses(),
+    "list_runs": lambda rs: rs.list_runs(),
+    "recount": lambda rs: rs.recount(),
+    "load_context": lambda rs: _load_context(rs),
+}
+
+
+def _load_context(rs) -> str:
+    from get_research_done.state import load_context
+
+    return load_context(rs.root_dir).to_markdown()
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--tree", type=Path, help="Reuse an existing synthetic tree instead of generating one.")
+    parser.add_argument("--journal", type=int, help="Journal entries (generator default: 10000).")
+    parser.add_argument("--hypotheses", type=int, help="Hypothesis files (generator default: 5000).")
+    parser.add_argument("--runs", type=int, help="Run index files (generator default: 1000).")
+    parser.add_argument("--state-mb", type=int, help="STATE.md body size in MB (generator default: 4).")
+    parser.add_argument("--repeat", type=int, default=3, help="Child processes per case.")
+    parser.add_argument("--only", action="append", default=[], help="Run only this case, e.g. cli:info (repeatable).")
+    parser.add_argument("--output", type=Path, help="Also write the JSON results to this path.")
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE, help="Baseline results to compare against.")
+    parser.add_argument("--write-baseline", action="store_true", help="Store these results as the baseline.")
+    parser.add_argument("--tolerance", type=float, default=1.5, help="Allowed median time ratio over the baseline.")
+    parser.add_argument("--rss-tolerance", type=float, default=1.25, help="Allowed peak RSS ratio over the baseline.")
+    parser.add_argument(
+        "--min-delta-s",
+        type=float,
+        default=0.05,
+        help="Ignore time regressions smaller than this many seconds (process noise).",
+    )
+    parser.add_argument("--_run-method", dest="run_method", help=argparse.SUPPRESS)
+    return parser.parse_args()
+
+
+def _rss_kb(rusage) -> int:
+    # ru_maxrss is in bytes on macOS and kilobytes elsewhere.
+    if sys.platform == "darwin":
+        return rusage.ru_maxrss // 1024
+    return rusage.ru_maxrss
+
+
+def _spawn(argv: list[str]) -> tuple[float, int, str]:
+    """Run `argv`, returning (wall seconds, peak RSS KB, stdout)."""
+    env = {**os.environ, "PYTHONPATH": str(SRC_DIR), "GRD_NO_DAEMON": "1"}
+    start = time.perf_counter()
+    proc = subprocess.Popen(argv, stdout=subprocess.PIPE, stderr=subprocess.PIPE, env=env)
+    stdout, stderr = proc.stdout.read(), proc.stderr.read()
+    _, status, rusage = os.wait4(proc.pid, 0)
+    elapsed = time.perf_counter() - start
+    proc.returncode = os.waitstatus_to_exitcode(status)
+    proc.stdout.close()
+    proc.stderr.close()
+    if proc.returncode not in (0, 1):
+        raise RuntimeError(f"{' '.join(argv)} exited {proc.returncode}: {stderr.decode(errors='replace')}")
+    return elapsed, _rss_kb(rusage), stdout.decode("utf-8", errors="replace")
+
+
+def _measure(argv: list[str], repeat: int, *, self_timed: bool) -> dict[str, float | int]:
+    times: list[float] = []
+    rss: list[int] = []
+    for _ in range(repeat):
+        elapsed, peak_kb, stdout = _spawn(argv)
+        if self_timed:
+            # Method cases report the call alone, without interpreter start-up.
+            elapsed = json.loads(stdout)["seconds"]
+        times.append(elapsed)
+        rss.append(peak_kb)
+    return {
+        "first_s": round(times[0], 6),
+        "median_s": round(statistics.median(times), 6),
+        "max_rss_kb": max(rss),
+    }
+
+
+def generate(tree: Path, args: argparse.Namespace) -> dict[str, int]:
+    """Build the synthetic tree in a child process; returns the sizes it used."""
+    command = [sys.executable, str(BENCH_DIR / "synthetic_tree.py"), str(tree)]
+    for flag in SIZE_FLAGS:
+        value = getattr(args, flag)
+        if value is not None:
+            command += [f"--{flag.replace('_', '-')}", str(value)]
+    _, _, stdout = _spawn(command)
+    return json.loads(stdout)["sizes"]
+
+
+def run_method(name: str, tree: Path) -> int:
+    sys.path.insert(0, str(SRC_DIR))
+    from get_research_done.state import ResearchState
+
+    rs = ResearchState(tree)
+    fn = METHOD_CASES[name]
+    start = time.perf_counter()
+    fn(rs)
+    print(json.dumps({"seconds": time.perf_counter() - start}))
+    return 0
+
+
+def _selected(kind: str, name: str, only: list[str]) -> bool:
+    return not only or f"{kind}:{name}" in only
+
+
+def run_suite(tree: Path, args: argparse.Namespace) -> dict[str, dict[str, float | int]]:
+    cases: dict[str, dict[str, float | int]] = {}
+    for name, argv in CLI_CASES.items():
+        if _selected("cli", name, args.only):
+            command = [sys.executable, "-m", "get_research_done.grd_cli", "--repo-root", str(tree), *argv]
+            cases[f"cli:{name}"] = _measure(command, args.repeat, self_timed=False)
+    for name in METHOD_CASES:
+        if _selected("method", name, args.only):
+            command = [sys.executable, __file__, "--_run-method", name, "--tree", str(tree)]
+            cases[f"method:{name}"] = _measure(command, args.repeat, self_timed=True)
+    return cases
+
+
+def compare(results: dict, baseline: dict, args: argparse.Namespace) -> list[str]:
+    """Regressions of `results` against `baseline`, one message per case and metric."""
+    regressions: list[str] = []
+    for name, current in results["cases"].items():
+        previous = baseline.get("cases", {}).get(name)
+        if previous is None:
+            continue
+        old_s, new_s = previous["median_s"], current["median_s"]
+        if new_s > old_s * args.tolerance and new_s - old_s >= args.min_delta_s:
+            regressions.append(f"{name}: median {new_s:.3f}s vs baseline {old_s:.3f}s")
+        old_kb, new_kb = previous["max_rss_kb"], current["max_rss_kb"]
+        if new_kb > old_kb * args.rss_tolerance:
+            regressions.append(f"{name}: peak RSS {new_kb} KB vs baseline {old_kb} KB")
+    return regressions
+
+
+def main() -> int:
+    args = parse_args()
+    if args.run_method:
+        return run_method(args.run_method, args.tree)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        if args.tree is None:
+            start = time.perf_counter()
+            sizes = generate(Path(tmp), args)
+            generate_s = time.perf_counter() - start
+            tree = Path(tmp)
+        else:
+            sizes, generate_s = None, 0.0
+            tree = args.tree
+        cases = run_suite(tree, args)
+
+    results = {
+        "meta": {
+            "python": platform.python_version(),
+            "platform": sys.platform,
+            "repeat": args.repeat,
+            "sizes": sizes,
+            "generate_s": round(generate_s, 3),
+        },
+        "cases": cases,
+    }
+    text = json.dumps(results, indent=2)
+    print(text)
+    if args.output:
+        args.output.write_text(text + "\n", encoding="utf-8")
+    if args.write_baseline:
+        args.baseline.parent.mkdir(parents=True, exist_ok=True)
+        args.baseline.write_text(text + "\n", encoding="utf-8")
+        return 0
+
+    if not args.baseline.exists():
+        return 0
+    baseline = json.loads(args.baseline.read_text(encoding="utf-8"))
+    if baseline.get("meta", {}).get("sizes") != results["meta"]["sizes"]:
+        print("Baseline was recorded for a different tree size; not comparing.", file=sys.stderr)
+        return 0
+    regressions = compare(results, baseline, args)
+    for message in regressions:
+        print(f"REGRESSION {message}", file=sys.stderr)
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""Compare pure-Python and libyaml STATE frontmatter (de)serialization.
+
+Builds a synthetic state with N top-level keys (run-registry style rows) and
+times `yaml.safe_load`/`yaml.safe_dump` against `get_research_done.serialization`.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+import yaml
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from get_research_done import serialization  # noqa: E402
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--keys", type=int, default=5000, help="Top-level keys in the synthetic state.")
+    parser.add_argument("--repeat", type=int, default=3, help="Timed repetitions (best is reported).")
+    return parser.parse_args()
+
+
+def synthetic_state(keys: int) -> dict[str, object]:
+    return {
+        f"run_{i:05d}": {
+            "run_id": f"R-20260101-{i:05d}",
+            "commit": f"{i * 2654435761 % 16**7:07x}",
+            "config": f"configs/sweep/{i % 37}.yaml",
+            "seeds": [i, i + 1, i + 2],
+            "metrics": {"loss": round(1.0 / (i + 1), 6), "acc": round(i % 100 / 100, 2)},
+            "notes": "baseline rerun with curriculum warmup and cosine schedule",
+        }
+        for i in range(keys)
+    }
+
+
+def best_of(repeat: int, fn) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> int:
+    args = parse_args()
+    state = synthetic_state(args.keys)
+    kwargs = {"sort_keys": False, "default_flow_style": False}
+    text = yaml.safe_dump(state, **kwargs)
+
+    if serialization.safe_dump(state, **kwargs) != text:
+        print("serialization.safe_dump output differs from yaml.safe_dump", file=sys.stderr)
+        return 1
+
+    results = {
+        "keys": args.keys,
+        "bytes": len(text.encode("utf-8")),
+        "libyaml": serialization.has_libyaml(),
+        "load_pure_s": best_of(args.repeat, lambda: yaml.safe_load(text)),
+        "load_fast_s": best_of(args.repeat, lambda: serialization.safe_load(text)),
+        "dump_pure_s": best_of(args.repeat, lambda: yaml.safe_dump(state, **kwargs)),
+        "dump_fast_s": best_of(args.repeat, lambda: serialization.safe_dump(state, **kwargs)),
+    }
+    results["load_speedup"] = round(results["load_pure_s"] / results["load_fast_s"], 2)
+    results["dump_speedup"] = round(results["dump_pure_s"] / results["dump_fast_s"], 2)
+    print(json.dumps(results, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
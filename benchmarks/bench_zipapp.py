@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""Compare `grd-install` run from a zipapp against a site-packages install.
+
+Both layouts are built from this checkout: `site/get_research_done/` with the
+assets under `assets/` (as in the wheel), and `grd.pyz` holding the same tree.
+Each install runs in a child process, so timings include interpreter start-up
+and imports; a zipapp reads its assets straight from the archive.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import zipapp
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+PACKAGE_DIR = REPO_ROOT / "src" / "get_research_done"
+ASSET_DIRS = ("skills", "templates", "workflows")
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--target", action="append", default=[], help="Install target (repeatable; default: all).")
+    parser.add_argument("--repeat", type=int, default=5, help="Installs to time per layout and case.")
+    return parser.parse_args()
+
+
+def build_layouts(root: Path) -> tuple[dict[str, list[str]], Path]:
+    """Build both layouts under `root`; returns the `grd-install` command for each and the site dir."""
+    site = root / "site"
+    package = site / "get_research_done"
+    shutil.copytree(PACKAGE_DIR, package, ignore=shutil.ignore_patterns("__pycache__"))
+    for name in ASSET_DIRS:
+        shutil.copytree(REPO_ROOT / name, package / "assets" / name)
+    archive = root / "grd.pyz"
+    zipapp.create_archive(site, archive, main="get_research_done.install_skills:main")
+    return {
+        "site-packages": [sys.executable, "-m", "get_research_done.install_skills"],
+        "zipapp": [sys.executable, str(archive)],
+    }, site
+
+
+def _rss_kb(rusage) -> int:
+    # ru_maxrss is in bytes on macOS and kilobytes elsewhere.
+    if sys.platform == "darwin":
+        return rusage.ru_maxrss // 1024
+    return rusage.ru_maxrss
+
+
+def _spawn(argv: list[str], env: dict[str, str]) -> tuple[float, int]:
+    """Run `argv`, returning (wall seconds, peak RSS KB)."""
+    start = time.perf_counter()
+    proc = subprocess.Popen(argv, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, env=env)
+    stderr = proc.stderr.read()
+    _, status, rusage = os.wait4(proc.pid, 0)
+    elapsed = time.perf_counter() - start
+    proc.stderr.close()
+    if os.waitstatus_to_exitcode(status) != 0:
+        raise RuntimeError(f"{' '.join(argv)} failed: {stderr.decode(errors='replace')}")
+    return elapsed, _rss_kb(rusage)
+
+
+def _summary(samples: list[tuple[float, int]]) -> dict[str, float | int]:
+    return {
+        "median_s": round(statistics.median(seconds for seconds, _ in samples), 6),
+        "max_rss_kb": max(kb for _, kb in samples),
+    }
+
+
+def main() -> int:
+    args = parse_args()
+    target_args = ["--target", ",".join(args.target or ["all"])]
+    results: dict[str, dict[str, dict[str, float | int]]] = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        layouts, site = build_layouts(root)
+        base_env = {key: value for key, value in os.environ.items() if key != "PYTHONPATH"}
+        for layout, command in layouts.items():
+            env = {**base_env, "PYTHONPATH": str(site)} if layout == "site-packages" else base_env
+            # Warm-up: writes the site-packages bytecode cache, as a real install would have.
+            _spawn([*command, str(root / f"warm-{layout}"), *target_args], env)
+            fresh = [_spawn([*command, str(root / f"{layout}-{i}"), *target_args], env) for i in range(args.repeat)]
+            dest = str(root / f"{layout}-0")
+            reinstall = [_spawn([*command, dest, *target_args], env) for _ in range(args.repeat)]
+            results[layout] = {"fresh": _summary(fresh), "reinstall": _summary(reinstall)}
+
+    output = {
+        "python": sys.version.split()[0],
+        "targets": target_args[1],
+        "repeat": args.repeat,
+        "layouts": results,
+    }
+    print(json.dumps(output, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""Generate a synthetic `.grd/` tree for scaling benchmarks.
+
+The tree is written in the formats `ResearchState` produces: events in
+`events.jsonl` (rendered to journal/experiments markdown), hypothesis files
+with frontmatter, run `0_INDEX.md` files, a STATE.md with a multi-MB body and
+a ROADMAP with milestones. Output is deterministic for a given size.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from get_research_done.serialization import safe_dump  # noqa: E402
+from get_research_done.state import ResearchState  # noqa: E402
+
+
+DEFAULT_SIZES = {"journal": 10000, "hypotheses": 5000, "runs": 1000, "state_mb": 4}
+_EPOCH = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+def _ts(i: int) -> str:
+    return (_EPOCH + timedelta(minutes=i)).isoformat().replace("+00:00", "Z")
+
+
+def _write_state(rs: ResearchState, state_mb: int, runs: int) -> None:
+    frontmatter = {
+        "objective": "Reduce validation loss below the tuned baseline",
+        "next_action": "Run seed sweep for curriculum warmup",
+        "active_run_id": f"R-{runs - 1:05d}",
+        "current_phase": "evaluate",
+        "north_star_metric": "val_loss",
+    }
+    frontmatter.update({f"decision_{i:03d}": f"D-{i:03d}: keep cosine schedule" for i in range(200)})
+    row = "| R-{i:05d} | 2026-01-01 | abc1234 | train.py | configs/{i}.yaml | 0,1,2 | loss=0.{i} | runs/{i}/ | ok |\n"
+    body = ["# STATE\n\n## Run registry (executed evidence)\n"]
+    size = 0
+    i = 0
+    while size < state_mb * 1024 * 1024:
+        line = row.format(i=i)
+        body.append(line)
+        size += len(line)
+        i += 1
+    head = "---\n" + safe_dump(frontmatter, sort_keys=False, default_flow_style=False) + "---\n"
+    rs.research_dir.mkdir(parents=True, exist_ok=True)
+    rs.state_path.write_text(head + "".join(body), encoding="utf-8")
+
+
+def _write_roadmap(rs: ResearchState) -> None:
+    lines = ["# ROADMAP", "", "## Objective", "- Beat the tuned baseline", "", "## Milestones"]
+    for i in range(50):
+        status = "done" if i < 40 else "doing" if i == 40 else "todo"
+        lines += [f"{i + 1}. Milestone {i}", f"   - Status: {status}"]
+    lines += ["", "## Immediate Queue (Smallest Next Actions)", "1. Run seed 3", "2. Plot loss curves", ""]
+    rs.roadmap_path.write_text("\n".join(lines), encoding="utf-8")
+
+
+def _write_events(rs: ResearchState, journal: int) -> None:
+    with rs.events_path.open("w", encoding="utf-8") as handle:
+        for i in range(journal):
+            entry = {"what": f"sweep point {i}", "happened": f"loss {1.0 / (i + 1):.6f}", "why": "scaling sweep"}
+            handle.write(json.dumps({"ts": _ts(i), "kind": "journal", "entry": entry}) + "\n")
+            if i % 3 == 0:
+                entry = {**entry, "outcome": f"acc={i % 100}", "artifacts": [f"runs/{i}/metrics.json"]}
+                handle.write(json.dumps({"ts": _ts(i), "kind": "experiment", "entry": entry}) + "\n")
+
+
+def _write_hypotheses(rs: ResearchState, hypotheses: int) -> None:
+    rs.hypotheses_dir.mkdir(parents=True, exist_ok=True)
+    for i in range(hypotheses):
+        created = _ts(i)
+        record = {
+            "title": f"Hypothesis {i}",
+            "created": created,
+            "phase_hint": "evaluate",
+            "source_entry": created,
+            "tags": [f"tag{i % 20}", "synthetic"],
+            "artifacts": [f"runs/{i}/metrics.json"],
+            "what": f"variant {i}",
+            "happened": "improved",
+            "why": "scaling benchmark",
+            "notes": "",
+        }
+        stamp = created.replace("-", "").replace(":", "").replace("T", "-").replace("Z", "")
+        path = rs.hypotheses_dir / f"{stamp}-hypothesis-{i}.md"
+        path.write_text(rs.render_hypothesis_markdown(record), encoding="utf-8")
+
+
+def _write_runs(rs: ResearchState, runs: int) -> None:
+    for i in range(runs):
+        run_id = f"R-{i:05d}"
+        frontmatter = {
+            "run_id": run_id,
+            "artifact_type": "index",
+            "stage": str(i % 5),
+            "title": f"Run {i}",
+            "status": "done" if i < runs - 1 else "active",
+            "created_at": _ts(i)[:10],
+            "tags": [f"tag{i % 20}"],
+            "artifacts": [f"runs/{i}/metrics.json"],
+        }
+        run_dir = rs.runs_dir / run_id
+        run_dir.mkdir(parents=True, exist_ok=True)
+        text = "# INDEX\n\n---\n" + safe_dump(frontmatter, sort_keys=False) + "---\n\n## Run Snapshot\n- Objective:\n"
+        (run_dir / "0_INDEX.md").write_text(text, encoding="utf-8")
+
+
+def generate_tree(
+    root: Path,
+    *,
+    journal: int = DEFAULT_SIZES["journal"],
+    hypotheses: int = DEFAULT_SIZES["hypotheses"],
+    runs: int = DEFAULT_SIZES["runs"],
+    state_mb: int = DEFAULT_SIZES["state_mb"],
+) -> ResearchState:
+    """Write a steady-state `.grd/` under `root` (rendered, catalogued, counted)."""
+    rs = ResearchState(root)
+    _write_state(rs, state_mb, runs)
+    _write_roadmap(rs)
+    _write_events(rs, journal)
+    _write_hypotheses(rs, hypotheses)
+    _write_runs(rs, runs)
+    rs.render()
+    rs.rebuild_hypothesis_catalog()
+    rs.recount()
+    return rs
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("root", help="Directory to create the `.grd/` tree in.")
+    parser.add_argument("--journal", type=int, default=DEFAULT_SIZES["journal"], help="Journal entries.")
+    parser.add_argument("--hypotheses", type=int, default=DEFAULT_SIZES["hypotheses"], help="Hypothesis files.")
+    parser.add_argument("--runs", type=int, default=DEFAULT_SIZES["runs"], help="Run index files.")
+    parser.add_argument("--state-mb", type=int, default=DEFAULT_SIZES["state_mb"], help="STATE.md body size in MB.")
+    return parser.parse_args()
+
+
+def main() -> int:
+    args = parse_args()
+    rs = generate_tree(
+        Path(args.root),
+        journal=args.journal,
+        hypotheses=args.hypotheses,
+        runs=args.runs,
+        state_mb=args.state_mb,
+    )
+    sizes = {"journal": args.journal, "hypotheses": args.hypotheses, "runs": args.runs, "state_mb": args.state_mb}
+    print(json.dumps({"root": str(rs.root_dir), "sizes": sizes, "counts": rs.counts()}, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""Check that `GrdContext.to_markdown(max_chars)` stays within budget and valid.
+
+Sweeps `max_chars` across a state with scalars, long lists, nested mappings
+and non-ASCII text. Every digest must be at most `max_chars` long, and its
+state section must parse as YAML whenever the fixed sections fit.
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+import yaml  # noqa: E402
+
+from get_research_done.roadmap_index import RoadmapIndex  # noqa: E402
+from get_research_done.state import GrdContext  # noqa: E402
+
+STATE = {
+    "objective": "Reduce validation loss below the tuned baseline",
+    "next_action": "Run seed sweep for curriculum warmup",
+    "current_phase": "evaluate",
+    "active_run_id": "R-00042",
+    "decisions": [f"D-{i:03d}: keep cosine schedule (Δ={i / 7:.3f})" for i in range(40)],
+    "runs": {f"R-{i:05d}": {"status": "done", "metric": f"loss=0.{i}"} for i in range(25)},
+    "notes": "multi\nline\nnote with: colons and # hashes",
+    "empty_list": [],
+    260211: "integer key",
+}
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--max", type=int, help="Largest max_chars to try (default: full digest length + 50).")
+    return parser.parse_args()
+
+
+def _state_section(markdown: str) -> str | None:
+    _, sep, rest = markdown.partition("## State\n")
+    body, sep2, _ = rest.partition("\n\n## Roadmap (excerpt)\n")
+    return body if sep and sep2 else None
+
+
+def main() -> int:
+    args = parse_args()
+    roadmap = RoadmapIndex(
+        path=Path("ROADMAP.md"),
+        size=1,
+        first_line="# ROADMAP",
+        next_actions=("Run seed 3",),
+    )
+    context = GrdContext(state=STATE, roadmap=roadmap, repo_root=Path("."))
+    full = context.to_markdown(max_chars=0)
+    fixed = len(full) - len(_state_section(full) or "")
+    failures: list[str] = []
+    for max_chars in range(1, (args.max or len(full) + 50) + 1):
+        output = context.to_markdown(max_chars=max_chars)
+        if len(output) > max_chars:
+            failures.append(f"max_chars={max_chars}: {len(output)} chars")
+            continue
+        if max_chars < fixed:
+            continue
+        section = _state_section(output)
+        if section is None:
+            failures.append(f"max_chars={max_chars}: sections were truncated")
+            continue
+        try:
+            yaml.safe_load(section)
+        except yaml.YAMLError as exc:
+            failures.append(f"max_chars={max_chars}: state is not valid YAML ({exc.__class__.__name__})")
+    if failures:
+        print("Digest budget violations:")
+        print("\n".join(f"- {failure}" for failure in failures[:20]))
+        return 1
+    print(f"Digest budget check passed (max_chars 1..{args.max or len(full) + 50})")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
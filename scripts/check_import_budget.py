@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""Guard the `grd` CLI startup import budget.
+
+Runs `python -X importtime -m get_research_done.grd_cli <command>` against a
+scratch repo and fails if the summed import time exceeds the budget or if a
+YAML-free command imports a heavy optional dependency.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+
+DEFAULT_BUDGET_MS = 150.0
+DEFAULT_RUNS = 5
+# Modules that must stay off the startup path of YAML-free commands.
+FORBIDDEN_MODULES = ("yaml", "sqlite3", "importlib.resources", "get_research_done.installer")
+COMMANDS = (("next",), ("--help",))
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--budget-ms",
+        type=float,
+        default=DEFAULT_BUDGET_MS,
+        help=f"Maximum summed import time per command in ms (default: {DEFAULT_BUDGET_MS:g})",
+    )
+    parser.add_argument(
+        "--runs",
+        type=int,
+        default=DEFAULT_RUNS,
+        help=f"Runs per command; the fastest is compared to the budget (default: {DEFAULT_RUNS})",
+    )
+    return parser.parse_args()
+
+
+def _run(args: list[str], env: dict[str, str]) -> subprocess.CompletedProcess[str]:
+    return subprocess.run(
+        [sys.executable, *args],
+        env=env,
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+
+
+def _import_profile(stderr: str) -> tuple[float, set[str]]:
+    total_us = 0
+    modules: set[str] = set()
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, _, name = line[len("import time:"):].split("|", 2)
+        total_us += int(self_us.strip())
+        modules.add(name.strip())
+    return total_us / 1000, modules
+
+
+def main() -> int:
+    args = parse_args()
+    repo_root = Path(__file__).resolve().parents[1]
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, (str(repo_root / "src"), env.get("PYTHONPATH"))))
+
+    failures: list[str] = []
+    with tempfile.TemporaryDirectory() as tmp:
+        # First call bootstraps `.grd/`; only steady-state startup is measured.
+        warmup = _run(["-m", "get_research_done.grd_cli", "--repo-root", tmp, "next"], env)
+        if warmup.returncode != 0:
+            print(warmup.stderr, file=sys.stderr)
+            return 1
+
+        for command in COMMANDS:
+            best_ms = float("inf")
+            modules: set[str] = set()
+            for _ in range(max(1, args.runs)):
+                result = _run(
+                    ["-X", "importtime", "-m", "get_research_done.grd_cli", "--repo-root", tmp, *command],
+                    env,
+                )
+                total_ms, modules = _import_profile(result.stderr)
+                best_ms = min(best_ms, total_ms)
+
+            label = " ".join(command)
+            leaked = sorted(m for m in modules if m in FORBIDDEN_MODULES)
+            if leaked:
+                failures.append(f"- grd {label}: imports {', '.join(leaked)}")
+            if best_ms > args.budget_ms:
+                failures.append(f"- grd {label}: {best_ms:.1f} ms > {args.budget_ms:g} ms")
+            print(f"grd {label}: {best_ms:.1f} ms import time")
+
+    if failures:
+        print("Import budget violations:")
+        print("\n".join(failures))
+        return 1
+
+    print(f"Import budget check passed (budget={args.budget_ms:g} ms)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
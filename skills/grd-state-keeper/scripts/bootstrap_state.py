@@ -84,6 +84,8 @@ def _resolve_repo_commit(repo_root: Path) -> str | None:
     return commit or None
 
 
+# Twin of `render_template` in src/get_research_done/bootstrap.py (this script must run
+# without the package installed); change both together.
 def render_template(content: str, template_name: str, run_id: str, repo_root: Path) -> str:
     now = datetime.now().astimezone()
     today = now.strftime("%Y-%m-%d")
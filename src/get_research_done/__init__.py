@@ -1,13 +1,40 @@
 """get-research-done package."""
 
-from .installer import install_targets, uninstall_targets
-from .state import GrdContext, ResearchState, StateContractError, load_context
+from __future__ import annotations
+
+from importlib import import_module
+
+# Exports resolve on first access so `grd` subcommands only pay for the
+# modules they use (PyYAML, installer assets, ...).
+_EXPORTS = {
+    "install_targets": ".installer",
+    "uninstall_targets": ".installer",
+    "ResearchState": ".state",
+    "StateContractError": ".state",
+    "StateTransaction": ".state",
+    "GrdContext": ".state",
+    "load_context": ".state",
+}
 
 __all__ = [
     "install_targets",
     "uninstall_targets",
     "ResearchState",
     "StateContractError",
+    "StateTransaction",
     "GrdContext",
     "load_context",
 ]
+
+
+def __getattr__(name: str) -> object:
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
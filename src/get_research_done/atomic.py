@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+import os
+import shutil
+import tempfile
+from contextlib import contextmanager
+from pathlib import Path
+from typing import BinaryIO, Iterator
+
+# The one way `.grd/` files are rewritten: into a `.<name>.*.tmp` sibling that
+# replaces the target with `os.replace`, so readers see the old file or the
+# new one, never a torn write. The temp file is removed if anything fails.
+
+
+@contextmanager
+def atomic_replace(path: Path, *, durable: bool = True) -> Iterator[BinaryIO]:
+    """Yield a binary handle whose contents replace `path` when the block exits cleanly.
+
+    The new file keeps `path`'s permissions (0644 for a new file). `durable`
+    fsyncs it first; pass False for caches and indexes that are rebuilt when lost.
+    """
+    fd, tmp_name = tempfile.mkstemp(prefix=f".{path.name}.", suffix=".tmp", dir=path.parent)
+    try:
+        with os.fdopen(fd, "wb") as handle:
+            yield handle
+            handle.flush()
+            if durable:
+                os.fsync(handle.fileno())
+        if path.exists():
+            shutil.copymode(path, tmp_name)
+        else:
+            os.chmod(tmp_name, 0o644)
+        os.replace(tmp_name, path)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+
+
+def write_atomic(path: Path, data: bytes, *, durable: bool = True) -> None:
+    """Replace `path` with `data` through `atomic_replace`."""
+    with atomic_replace(path, durable=durable) as handle:
+        handle.write(data)
@@ -0,0 +1,206 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from .installer import _copy_resource, _resolve_assets_dir
+
+if TYPE_CHECKING:
+    from importlib.abc import Traversable
+
+
+STATE_FILES = (
+    ("state.md", Path(".grd") / "STATE.md"),
+    ("roadmap.md", Path(".grd") / "ROADMAP.md"),
+)
+
+
+@dataclass(frozen=True)
+class BootstrapAction:
+    action: str
+    path: Path
+
+
+@dataclass(frozen=True)
+class BootstrapResult:
+    repo_root: Path
+    actions: tuple[BootstrapAction, ...]
+
+    def to_dict(self) -> dict[str, object]:
+        return {
+            "repo_root": str(self.repo_root),
+            "actions": [{"action": a.action, "path": str(a.path)} for a in self.actions],
+        }
+
+
+def _find_git_dir(repo_root: Path) -> Path | None:
+    for candidate in (repo_root, *repo_root.parents):
+        dot_git = candidate / ".git"
+        if dot_git.is_dir():
+            return dot_git
+        if dot_git.is_file():
+            content = dot_git.read_text(encoding="utf-8").strip()
+            if content.startswith("gitdir:"):
+                return (candidate / content[len("gitdir:"):].strip()).resolve()
+    return None
+
+
+def _resolve_repo_commit(repo_root: Path) -> str | None:
+    """Read the short HEAD sha straight from `.git` instead of spawning `git`."""
+    git_dir = _find_git_dir(repo_root)
+    if git_dir is None:
+        return None
+    try:
+        head = (git_dir / "HEAD").read_text(encoding="utf-8").strip()
+    except OSError:
+        return None
+    if not head.startswith("ref:"):
+        return head[:7] or None
+
+    ref = head[len("ref:"):].strip()
+    common_dir = git_dir
+    if (git_dir / "commondir").is_file():
+        common_dir = (git_dir / (git_dir / "commondir").read_text(encoding="utf-8").strip()).resolve()
+    for base in (git_dir, common_dir):
+        ref_path = base / ref
+        if ref_path.is_file():
+            return ref_path.read_text(encoding="utf-8").strip()[:7] or None
+    packed = common_dir / "packed-refs"
+    if packed.is_file():
+        for line in packed.read_text(encoding="utf-8").splitlines():
+            sha, _, name = line.partition(" ")
+            if name.strip() == ref:
+                return sha[:7]
+    return None
+
+
+# Twin of `render_template` in skills/grd-state-keeper/scripts/bootstrap_state.py, which
+# stays standalone for skill-only installs; change both together.
+def render_template(content: str, template_name: str, run_id: str, repo_root: Path) -> str:
+    now = datetime.now().astimezone()
+    today = now.strftime("%Y-%m-%d")
+    timestamp = now.strftime("%Y-%m-%d %H:%M")
+    timestamp_with_tz = now.strftime("%Y-%m-%d %H:%M %Z").rstrip()
+
+    if template_name == "state.md":
+        content = content.replace("[YYYY-MM-DD HH:MM]", timestamp)
+        content = content.replace("<YYYY-MM-DD HH:MM TZ>", timestamp_with_tz)
+        if run_id:
+            content = content.replace("[YYMMDD_slug or empty]", run_id)
+            content = content.replace("<R-... or empty>", run_id)
+        commit = _resolve_repo_commit(repo_root)
+        if commit:
+            content = content.replace("<git sha>", commit)
+
+    if template_name == "run-index.md":
+        if run_id:
+            content = content.replace('run_id: "YYMMDD_slug"', f'run_id: "{run_id}"')
+        content = content.replace('"YYYY-MM-DD"', f'"{today}"')
+
+    return content
+
+
+class _Bootstrapper:
+    def __init__(self, repo_root: Path, *, force: bool, dry_run: bool):
+        self.repo_root = repo_root
+        self.force = force
+        self.dry_run = dry_run
+        self.actions: list[BootstrapAction] = []
+
+    def _should_write(self, target: Path) -> str | None:
+        existed = target.exists()
+        if existed and not self.force:
+            self.actions.append(BootstrapAction("skipped", target))
+            return None
+        action = "overwrite" if existed else "create"
+        if self.dry_run:
+            self.actions.append(BootstrapAction(f"would-{action}", target))
+            return None
+        return "overwrote" if existed else "created"
+
+    def copy_dir(self, source_dir: Path | Traversable, target_dir: Path) -> None:
+        for source in sorted(source_dir.iterdir(), key=lambda source: source.name):
+            if not source.is_file():
+                continue
+            target = target_dir / source.name
+            done = self._should_write(target)
+            if done is None:
+                continue
+            target.parent.mkdir(parents=True, exist_ok=True)
+            _copy_resource(source, target)
+            self.actions.append(BootstrapAction(done, target))
+
+    def write_template(self, template: Path | Traversable, target: Path, run_id: str) -> None:
+        done = self._should_write(target)
+        if done is None:
+            return
+        rendered = render_template(template.read_text(encoding="utf-8"), template.name, run_id, self.repo_root)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        target.write_text(rendered, encoding="utf-8")
+        self.actions.append(BootstrapAction(done, target))
+
+    def link_latest(self, run_id: str) -> None:
+        latest = self.repo_root / ".grd" / "research" / "latest"
+        link_target = Path("runs") / run_id
+        if latest.exists() or latest.is_symlink():
+            if not (latest.is_symlink() or latest.is_file()):
+                self.actions.append(BootstrapAction("skipped", latest))
+                return
+            if not self.dry_run:
+                latest.unlink()
+        if self.dry_run:
+            self.actions.append(BootstrapAction("would-symlink", latest))
+            return
+        latest.parent.mkdir(parents=True, exist_ok=True)
+        latest.symlink_to(link_target)
+        self.actions.append(BootstrapAction("symlinked", latest))
+
+
+def bootstrap_state(
+    repo_root: str | Path,
+    *,
+    init_templates: bool = False,
+    init_workflows: bool = False,
+    run_id: str = "",
+    include_notes: bool = False,
+    force: bool = False,
+    dry_run: bool = False,
+) -> BootstrapResult:
+    """Scaffold `.grd/` state files in-process (library form of `bootstrap_state.py`).
+
+    Templates come from the repo's `.grd/templates` when present, otherwise
+    from the packaged assets. Raises FileNotFoundError if a template is missing.
+    """
+    root = Path(repo_root).expanduser().resolve()
+    run_id = run_id.strip()
+    runner = _Bootstrapper(root, force=force, dry_run=dry_run)
+    repo_templates = root / ".grd" / "templates"
+
+    assets_dir = _resolve_assets_dir()
+    if init_templates:
+        runner.copy_dir(assets_dir.joinpath("templates"), repo_templates)
+    if init_workflows:
+        runner.copy_dir(assets_dir.joinpath("workflows"), root / ".grd" / "workflows")
+
+    plan = list(STATE_FILES)
+    if include_notes:
+        plan.append(("research-notes.md", Path(".grd") / "research" / "RESEARCH_NOTES.md"))
+    if run_id:
+        plan.append(("run-index.md", Path(".grd") / "research" / "runs" / run_id / "0_INDEX.md"))
+
+    for template_name, relative_target in plan:
+        template = repo_templates / template_name
+        if not template.is_file():
+            template = assets_dir.joinpath("templates").joinpath(template_name)
+        if not template.is_file():
+            raise FileNotFoundError(
+                f"Missing template '{template_name}' (searched: {repo_templates}, {assets_dir.joinpath('templates')})"
+            )
+        runner.write_template(template, root / relative_target, run_id)
+
+    if run_id:
+        runner.link_latest(run_id)
+
+    return BootstrapResult(repo_root=root, actions=tuple(runner.actions))
@@ -0,0 +1,147 @@
+from __future__ import annotations
+
+import os
+import struct
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+
+from .atomic import write_atomic
+
+
+_MAGIC = b"GRDIDX1\x00"
+# magic, source size, source mtime_ns, entry count
+_HEADER = struct.Struct("<8sQqQ")
+# entry byte offset, entry timestamp (unix seconds, 0 when unparseable)
+_RECORD = struct.Struct("<Qq")
+_ENTRY_PREFIX = b"## "
+
+
+@dataclass(frozen=True)
+class IndexedEntry:
+    offset: int
+    timestamp: int
+
+
+def heading_timestamp(line: bytes) -> int:
+    raw = line[len(_ENTRY_PREFIX):].strip().decode("utf-8", errors="replace")
+    try:
+        return int(datetime.fromisoformat(raw.replace("Z", "+00:00")).timestamp())
+    except ValueError:
+        return 0
+
+
+class EntryIndex:
+    """Binary sidecar index of `## ` entries in an append-only markdown log.
+
+    The header records the size and mtime of the log it was built from, so a
+    log edited outside `ResearchState` is detected and the index rebuilt.
+    """
+
+    def __init__(self, source: Path):
+        self.source = source
+        self.path = source.with_suffix(".idx")
+
+    def _read_header(self) -> tuple[int, int, int] | None:
+        try:
+            with self.path.open("rb") as handle:
+                raw = handle.read(_HEADER.size)
+        except OSError:
+            return None
+        if len(raw) < _HEADER.size:
+            return None
+        magic, size, mtime_ns, count = _HEADER.unpack(raw)
+        if magic != _MAGIC:
+            return None
+        return size, mtime_ns, count
+
+    def _matches(self, stat: os.stat_result | None) -> bool:
+        header = self._read_header()
+        if stat is None:
+            return header is None or header[:2] == (0, 0)
+        return header is not None and header[:2] == (stat.st_size, stat.st_mtime_ns)
+
+    def snapshot(self) -> os.stat_result | None:
+        """Stat the log before an append so `record_append` can detect drift."""
+        try:
+            return self.source.stat()
+        except FileNotFoundError:
+            return None
+
+    def count(self, *, write: bool = True) -> int:
+        """Number of entries; with `write=False` a stale index is not rebuilt on disk."""
+        stat = self.snapshot()
+        if stat is None:
+            return 0
+        header = self._read_header()
+        if header is not None and header[:2] == (stat.st_size, stat.st_mtime_ns):
+            return header[2]
+        if not write:
+            return len(self._scan()[0])
+        return len(self.rebuild())
+
+    def entries(self) -> list[IndexedEntry]:
+        stat = self.snapshot()
+        if stat is None:
+            return []
+        if not self._matches(stat):
+            return self.rebuild()
+        try:
+            with self.path.open("rb") as handle:
+                _, _, _, count = _HEADER.unpack(handle.read(_HEADER.size))
+                raw = handle.read(count * _RECORD.size)
+        except OSError:
+            return self.rebuild()
+        return [IndexedEntry(*fields) for fields in _RECORD.iter_unpack(raw[: count * _RECORD.size])]
+
+    def _scan(self) -> tuple[list[IndexedEntry], os.stat_result | None]:
+        entries: list[IndexedEntry] = []
+        try:
+            with self.source.open("rb") as handle:
+                stat = os.fstat(handle.fileno())
+                offset = 0
+                for line in handle:
+                    if line.startswith(_ENTRY_PREFIX):
+                        entries.append(IndexedEntry(offset, heading_timestamp(line)))
+                    offset += len(line)
+        except FileNotFoundError:
+            return entries, None
+        return entries, stat
+
+    def rebuild(self) -> list[IndexedEntry]:
+        entries, stat = self._scan()
+        if stat is not None:
+            self._write(entries, stat)
+        return entries
+
+    def record_append(self, before: os.stat_result | None, appended: list[IndexedEntry]) -> None:
+        """Extend the index after appending `appended` to a log last seen as `before`."""
+        if not self._matches(before):
+            self.rebuild()
+            return
+        stat = self.snapshot()
+        if stat is None:
+            return
+        header = self._read_header()
+        count = header[2] if header is not None else 0
+        try:
+            if header is None:
+                self._write(appended, stat)
+                return
+            with self.path.open("r+b") as handle:
+                handle.seek(_HEADER.size + count * _RECORD.size)
+                handle.write(b"".join(_RECORD.pack(e.offset, e.timestamp) for e in appended))
+                handle.truncate()
+                handle.seek(0)
+                handle.write(_HEADER.pack(_MAGIC, stat.st_size, stat.st_mtime_ns, count + len(appended)))
+        except OSError:
+            pass
+
+    def _write(self, entries: list[IndexedEntry], stat: os.stat_result) -> None:
+        payload = _HEADER.pack(_MAGIC, stat.st_size, stat.st_mtime_ns, len(entries))
+        payload += b"".join(_RECORD.pack(e.offset, e.timestamp) for e in entries)
+        try:
+            write_atomic(self.path, payload, durable=False)
+        except OSError:
+            # A read-only `.grd/` still gets correct answers, just without reuse.
+            pass
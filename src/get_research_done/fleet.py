@@ -0,0 +1,207 @@
+from __future__ import annotations
+
+import argparse
+import glob
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Iterable
+
+from .installer import (
+    LINK_MODES,
+    _normalize_targets,
+    _normalize_uninstall_targets,
+    _resolve_assets_dir,
+    install_targets,
+    plan_install,
+    plan_uninstall,
+    uninstall_targets,
+)
+from .tracing import span
+
+
+@dataclass(frozen=True)
+class FleetResult:
+    action: str
+    targets: tuple[str, ...]
+    jobs: int
+    seconds: float
+    destinations: tuple[dict[str, Any], ...]
+
+    @property
+    def failed(self) -> int:
+        return sum(1 for item in self.destinations if item["status"] != "ok")
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "action": self.action,
+            "targets": list(self.targets),
+            "jobs": self.jobs,
+            "total": len(self.destinations),
+            "ok": len(self.destinations) - self.failed,
+            "failed": self.failed,
+            "seconds": round(self.seconds, 3),
+            "destinations": list(self.destinations),
+        }
+
+
+def _expand(pattern: str) -> list[str]:
+    pattern = os.path.expanduser(pattern)
+    if glob.has_magic(pattern):
+        return sorted(glob.glob(pattern, recursive=True))
+    return [pattern]
+
+
+def read_dest_list(spec: str) -> list[Path]:
+    """Destinations from a list file (`-` for stdin) or a glob.
+
+    List files hold one destination or glob per line; blank lines and `#`
+    comments are ignored. Duplicates are dropped, keeping the first.
+    """
+    if spec == "-":
+        lines = sys.stdin.read().splitlines()
+    elif not glob.has_magic(spec) and Path(spec).expanduser().is_file():
+        lines = Path(spec).expanduser().read_text(encoding="utf-8").splitlines()
+    else:
+        lines = [spec]
+
+    dests: list[Path] = []
+    seen: set[Path] = set()
+    for line in lines:
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        for match in _expand(line):
+            path = Path(match).resolve()
+            if path not in seen:
+                seen.add(path)
+                dests.append(path)
+    return dests
+
+
+def _run_one(action: str, dest: str, targets: list[str], options: dict[str, Any]) -> dict[str, Any]:
+    start = time.perf_counter()
+    record: dict[str, Any] = {"dest": dest}
+    options = dict(options)
+    dry_run = options.pop("dry_run", False)
+    try:
+        if dry_run:
+            plan = (plan_install if action == "install" else plan_uninstall)(dest, targets, **options)
+            record.update(targets=list(plan.targets), planned=plan.counts())
+        elif action == "install":
+            result = install_targets(dest, targets, **options)
+            record.update(
+                targets=list(result.installed_targets),
+                copied=result.copied,
+                linked=result.linked,
+                skipped=result.skipped,
+            )
+        else:
+            removed = uninstall_targets(dest, targets, **options)
+            record["targets"] = list(removed.removed_targets)
+        record["status"] = "ok"
+    except Exception as exc:  # reported per destination; one bad checkout must not stop the fleet
+        record.update(status="error", error=f"{type(exc).__name__}: {exc}")
+    record["seconds"] = round(time.perf_counter() - start, 4)
+    return record
+
+
+def run_fleet(
+    action: str,
+    dests: Iterable[Path],
+    targets: list[str],
+    *,
+    jobs: int | None = None,
+    on_result: Callable[[dict[str, Any]], None] | None = None,
+    **options: Any,
+) -> FleetResult:
+    """Run `install_targets` or `uninstall_targets` on every destination in a process pool.
+
+    Packaged assets are resolved once and shared with the workers. `options`
+    are passed through (`link_mode`, `remove_runtime`, `dry_run`). `on_result` is called
+    as each destination finishes; the result lists destinations in input order.
+    """
+    # Validate once up front rather than failing identically in every worker.
+    if action == "install":
+        _normalize_targets(list(targets))
+        link_mode = options.get("link_mode", "copy")
+        if link_mode not in LINK_MODES:
+            raise ValueError(f"Unknown link mode '{link_mode}'. Valid modes: {', '.join(LINK_MODES)}")
+    elif action == "uninstall":
+        _normalize_uninstall_targets(list(targets), remove_runtime=options.get("remove_runtime", False))
+    else:
+        raise ValueError(f"Unknown fleet action '{action}'.")
+    dest_list = [str(dest) for dest in dests]
+    jobs = max(1, min(jobs or os.cpu_count() or 1, len(dest_list) or 1))
+    start = time.perf_counter()
+    records: dict[str, dict[str, Any]] = {}
+    with span("fleet", "install", action=action, destinations=len(dest_list), jobs=jobs):
+        assets_dir = _resolve_assets_dir()
+        if isinstance(assets_dir, Path):
+            # A zip-backed asset tree cannot be sent to workers; each reads the archive in place instead.
+            options = {**options, "assets_dir": str(assets_dir)}
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            futures = {pool.submit(_run_one, action, dest, targets, options): dest for dest in dest_list}
+            for future in as_completed(futures):
+                try:
+                    record = future.result()
+                except Exception as exc:  # the worker process itself died
+                    error = f"{type(exc).__name__}: {exc}"
+                    record = {"dest": futures[future], "status": "error", "error": error}
+                records[record["dest"]] = record
+                if on_result is not None:
+                    on_result(record)
+    return FleetResult(
+        action=action,
+        targets=tuple(targets),
+        jobs=jobs,
+        seconds=time.perf_counter() - start,
+        destinations=tuple(records[dest] for dest in dest_list),
+    )
+
+
+def format_record(record: dict[str, Any]) -> str:
+    """One progress line for a finished destination."""
+    seconds = f"{record.get('seconds', 0):.3f}s"
+    if record["status"] != "ok":
+        return f"FAIL {seconds} {record['dest']}: {record['error']}"
+    if "planned" in record:
+        planned = ", ".join(f"{count} {action}" for action, count in sorted(record["planned"].items()))
+        return f"plan {seconds} {record['dest']} ({planned or 'nothing to do'})"
+    if "copied" in record:
+        linked = f", {record['linked']} linked" if record["linked"] else ""
+        return f"ok   {seconds} {record['dest']} ({record['copied']} copied{linked}, {record['skipped']} unchanged)"
+    return f"ok   {seconds} {record['dest']}"
+
+
+def main_for_dest_list(
+    parser: argparse.ArgumentParser,
+    args: argparse.Namespace,
+    action: str,
+    targets: list[str],
+    **options: Any,
+) -> int:
+    """`grd-install`/`grd-uninstall --dest-list`: progress lines or one JSON summary; exit 1 on any failure."""
+    if args.dest != ".":
+        parser.error("--dest-list cannot be combined with a positional destination")
+    dests = read_dest_list(args.dest_list)
+    if not dests:
+        parser.error(f"--dest-list {args.dest_list!r} matched no destinations")
+    on_result = None if args.json else (lambda record: print(format_record(record), flush=True))
+    try:
+        result = run_fleet(action, dests, targets, jobs=args.jobs, on_result=on_result, **options)
+    except ValueError as exc:
+        parser.error(str(exc))
+        return 2
+
+    if args.json:
+        print(json.dumps(result.to_dict(), indent=2))
+    elif options.get("dry_run"):
+        print(f"{len(dests) - result.failed}/{len(dests)} destinations planned in {result.seconds:.2f}s")
+    else:
+        print(f"{len(dests) - result.failed}/{len(dests)} destinations {action}ed in {result.seconds:.2f}s")
+    return 1 if result.failed else 0
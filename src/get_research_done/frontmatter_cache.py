@@ -0,0 +1,154 @@
+from __future__ import annotations
+
+import base64
+import copy
+import json
+import threading
+from collections import OrderedDict
+from datetime import date, datetime
+from pathlib import Path
+from typing import Any, Callable
+
+from .atomic import write_atomic
+
+
+DEFAULT_MAXSIZE = 32
+# Bumped whenever the on-disk encoding changes; other versions are ignored.
+_DISK_VERSION = 2
+
+
+# Tagged encoding of what `yaml.safe_load` can return. Lists and JSON scalars
+# stay as they are; everything else becomes a one-key object, and mappings are
+# stored as [key, value] pairs so int, bool, null and date keys survive.
+def _encode(value: Any) -> Any:
+    if value is None or isinstance(value, (str, bool, int, float)):
+        return value
+    if isinstance(value, list):
+        return [_encode(item) for item in value]
+    if isinstance(value, dict):
+        return {"map": [[_encode(key), _encode(item)] for key, item in value.items()]}
+    if isinstance(value, datetime):
+        return {"datetime": value.isoformat()}
+    if isinstance(value, date):
+        return {"date": value.isoformat()}
+    if isinstance(value, (set, frozenset)):
+        return {"set": [_encode(item) for item in value]}
+    if isinstance(value, bytes):
+        return {"bytes": base64.b64encode(value).decode("ascii")}
+    raise TypeError(f"Unsupported cache value: {type(value).__name__}")
+
+
+def _decode(value: Any) -> Any:
+    if isinstance(value, list):
+        return [_decode(item) for item in value]
+    if not isinstance(value, dict):
+        return value
+    ((tag, payload),) = value.items()
+    if tag == "map":
+        return {_decode(key): _decode(item) for key, item in payload}
+    if tag == "datetime":
+        return datetime.fromisoformat(payload)
+    if tag == "date":
+        return date.fromisoformat(payload)
+    if tag == "set":
+        return {_decode(item) for item in payload}
+    if tag == "bytes":
+        return base64.b64decode(payload)
+    raise ValueError(f"Unknown cache tag: {tag}")
+
+
+class FrontmatterCache:
+    """LRU cache of parsed frontmatter keyed on (path, size, mtime_ns).
+
+    Entries can also be persisted to a JSON file so separate CLI processes
+    skip YAML parsing while the source file is unchanged. The file sits in the
+    repo's working tree, so it is plain data: `_encode` tags every mapping,
+    date and other non-JSON type, and a cache hit equals a fresh parse.
+    """
+
+    def __init__(self, maxsize: int = DEFAULT_MAXSIZE):
+        self.maxsize = maxsize
+        self._entries: OrderedDict[tuple[str, int, int], Any] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, path: Path, parse: Callable[[Path], Any], *, disk_path: Path | None = None) -> Any:
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            return parse(path)
+        key = (str(path), stat.st_size, stat.st_mtime_ns)
+
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                return copy.deepcopy(self._entries[key])
+
+        value = _read_disk(disk_path, key) if disk_path is not None else None
+        if value is None:
+            value = parse(path)
+            try:
+                after = path.stat()
+            except FileNotFoundError:
+                return value
+            if (after.st_size, after.st_mtime_ns) != key[1:]:
+                # The file changed while we parsed it; don't pin a torn read.
+                return value
+            if disk_path is not None:
+                _write_disk(disk_path, key, value, self.maxsize)
+
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return copy.deepcopy(value)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+def _load_disk(disk_path: Path) -> dict[str, Any]:
+    try:
+        with disk_path.open("r", encoding="utf-8") as handle:
+            data = json.load(handle)
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict) or data.get("version") != _DISK_VERSION:
+        return {}
+    entries = data.get("entries")
+    return entries if isinstance(entries, dict) else {}
+
+
+def _read_disk(disk_path: Path, key: tuple[str, int, int]) -> Any:
+    record = _load_disk(disk_path).get(key[0])
+    if not isinstance(record, dict):
+        return None
+    if (record.get("size"), record.get("mtime_ns")) != key[1:]:
+        return None
+    try:
+        return _decode(record.get("value"))
+    except (TypeError, ValueError, AttributeError):
+        # Hand-edited or foreign cache entry: parse the file instead.
+        return None
+
+
+def _write_disk(disk_path: Path, key: tuple[str, int, int], value: Any, maxsize: int) -> None:
+    try:
+        encoded = _encode(value)
+    except TypeError:
+        return
+    data = _load_disk(disk_path)
+    data.pop(key[0], None)
+    data[key[0]] = {"size": key[1], "mtime_ns": key[2], "value": encoded}
+    while len(data) > maxsize:
+        data.pop(next(iter(data)))
+    try:
+        payload = json.dumps({"version": _DISK_VERSION, "entries": data}).encode("utf-8")
+        disk_path.parent.mkdir(parents=True, exist_ok=True)
+        write_atomic(disk_path, payload, durable=False)
+    except (OSError, ValueError):
+        pass
+
+
+FRONTMATTER_CACHE = FrontmatterCache()
@@ -3,53 +3,63 @@ from __future__ import annotations
 import argparse
 import json
 from pathlib import Path
-import subprocess
 import sys
 
-from .state import MODES, ResearchState, StateContractError, load_context
+from typing import TYPE_CHECKING, Any, Iterable, Iterator
 
+from . import tracing
+from .locking import LockTimeout
+from .state import COUNTER_KINDS, MODES, QUERY_KINDS, GrdContext, ResearchState, StateContractError, load_context
 
-def _find_bootstrap_script(repo_root: Path) -> Path | None:
-    candidates = (
-        repo_root / "skills" / "grd-state-keeper" / "scripts" / "bootstrap_state.py",
-        Path(__file__).resolve().parents[2] / "skills" / "grd-state-keeper" / "scripts" / "bootstrap_state.py",
-        Path(__file__).resolve().parent / "assets" / "skills" / "grd-state-keeper" / "scripts" / "bootstrap_state.py",
-    )
-    for candidate in candidates:
-        if candidate.exists():
-            return candidate
-    return None
+if TYPE_CHECKING:
+    from .bootstrap import BootstrapResult
+
+# Subcommand-only dependencies (bootstrap/installer assets, SQLite) are
+# imported inside the handlers that need them; PyYAML loads on first parse.
 
 
-def _bootstrap_if_missing(repo_root: Path) -> None:
+def _bootstrap_if_missing(repo_root: Path) -> BootstrapResult | None:
     state_paths = [repo_root / ".grd" / "STATE.md", repo_root / ".grd" / "state.md"]
     roadmap_paths = [repo_root / ".grd" / "ROADMAP.md", repo_root / ".grd" / "roadmap.md"]
     if any(path.exists() for path in state_paths) and any(path.exists() for path in roadmap_paths):
-        return
-    script = _find_bootstrap_script(repo_root)
-    if script is None:
-        raise FileNotFoundError(
-            "State files are missing and bootstrap script was not found. "
-            "Run `grd-state-keeper mode=kickoff` to initialize `.grd/`."
-        )
-    subprocess.run(
-        [sys.executable, str(script), "--repo-root", str(repo_root), "--init-templates", "--init-workflows"],
-        check=True,
-        capture_output=True,
-        text=True,
-    )
+        return None
+    from .bootstrap import bootstrap_state
+
+    try:
+        with tracing.span("bootstrap", "cli"):
+            return bootstrap_state(repo_root, init_templates=True, init_workflows=True)
+    except OSError as exc:
+        # e.g. an unwritable repo; reported like any other unusable state.
+        raise StateContractError(f"Could not bootstrap .grd/ in {repo_root}: {exc}") from exc
+
+
+class CommandSession:
+    """Resolves `.grd/` state for one command; `grd serve` keeps a warm subclass alive."""
+
+    def __init__(self, repo_root: Path):
+        self.repo_root = repo_root
+
+    def bootstrap_if_missing(self) -> None:
+        _bootstrap_if_missing(self.repo_root)
 
+    def research_state(self) -> ResearchState:
+        return ResearchState(root_dir=self.repo_root)
 
-def _count_entries(path: Path) -> int:
-    if not path.exists():
-        return 0
-    text = path.read_text(encoding="utf-8")
-    return sum(1 for line in text.splitlines() if line.startswith("## "))
+    def context(self) -> GrdContext:
+        return load_context(self.repo_root)
 
 
 def build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(prog="grd", description="GRD runtime CLI.")
     parser.add_argument("--repo-root", default=".", help="Repository root containing `.grd/`.")
+    parser.add_argument(
+        "--trace",
+        action="store_true",
+        help=(
+            f"Record timing spans to `.grd/{tracing.TRACES_DIRNAME}/` as Chrome trace JSON "
+            f"(or set {tracing.TRACE_ENV})."
+        ),
+    )
     subparsers = parser.add_subparsers(dest="command", required=True)
 
     info = subparsers.add_parser("info", help="Render current GRD state digest.")
@@ -60,15 +70,25 @@ def build_parser() -> argparse.ArgumentParser:
     run.add_argument("--skill", required=True, help="Skill identifier for payload metadata.")
     run.add_argument("--json", action="store_true", help="Emit JSON payload.")
     run.add_argument("--max-chars", type=int, default=2400, help="Maximum markdown digest size.")
+    run.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Render from state even if `.grd/cache/payloads/` holds this payload.",
+    )
 
     log = subparsers.add_parser("log", help="Record lightweight exploration findings.")
-    log.add_argument("--what", required=True, help="What you tried.")
-    log.add_argument("--happened", required=True, help="What happened.")
-    log.add_argument("--why", required=True, help="Why this was done.")
+    log.add_argument("--what", help="What you tried.")
+    log.add_argument("--happened", help="What happened.")
+    log.add_argument("--why", help="Why this was done.")
     log.add_argument("--outcome", help="Optional experiment outcome.")
     log.add_argument("--artifact", action="append", default=[], help="Optional artifact path (repeatable).")
     log.add_argument("--source", help="Optional source context.")
     log.add_argument("--notes", help="Optional notes.")
+    log.add_argument(
+        "--from-jsonl",
+        metavar="FILE",
+        help="Log one entry per JSON line of FILE (`-` for stdin) instead of the flags above.",
+    )
     log.add_argument("--json", action="store_true", help="Emit JSON payload.")
 
     promote = subparsers.add_parser("promote", help="Promote evidence into a formal hypothesis artifact.")
@@ -82,17 +102,62 @@ def build_parser() -> argparse.ArgumentParser:
     promote.add_argument("--tag", action="append", default=[], help="Optional tag (repeatable).")
     promote.add_argument("--json", action="store_true", help="Emit JSON payload.")
 
+    query = subparsers.add_parser("query", help="Search journal, experiments, hypotheses and run indexes.")
+    query.add_argument("text", nargs="?", default="", help="Full-text search terms (all must match).")
+    query.add_argument("--kind", choices=QUERY_KINDS, help="Restrict to one record kind.")
+    query.add_argument("--tag", help="Only records carrying this tag.")
+    query.add_argument("--artifact", help="Only records referencing an artifact path containing this value.")
+    query.add_argument("--phase", help="Only records with this phase hint (hypotheses) or stage (runs).")
+    query.add_argument("--since", help="Only records created since 7d/12h/2w or an ISO date.")
+    query.add_argument("--limit", type=int, default=20, help="Maximum results.")
+    query.add_argument("--json", action="store_true", help="Emit JSON payload.")
+
+    render = subparsers.add_parser("render", help="Render pending events into journal.md/experiments.md.")
+    render.add_argument("--json", action="store_true", help="Emit JSON payload.")
+
     nxt = subparsers.add_parser("next", help="Suggest next actions from current state.")
     nxt.add_argument("--mode", choices=MODES, help="Mode hint: explore/plan/implement/evaluate/synthesize/promote.")
     nxt.add_argument("--max-actions", type=int, default=3, help="Maximum actions to suggest.")
     nxt.add_argument("--json", action="store_true", help="Emit JSON payload.")
 
+    doctor = subparsers.add_parser("doctor", help="Check maintained `.grd/` counters and catalogs for drift.")
+    doctor.add_argument(
+        "--recount",
+        action="store_true",
+        help="Rebuild counters and the hypothesis catalog from the files on disk.",
+    )
+    doctor.add_argument("--json", action="store_true", help="Emit JSON payload.")
+
+    serve = subparsers.add_parser("serve", help="Keep state warm and answer commands over a local socket.")
+    serve.add_argument(
+        "--idle-timeout",
+        type=float,
+        default=0,
+        help="Exit after this many idle seconds (default: 0, never).",
+    )
+    serve.add_argument("--stop", action="store_true", help="Stop the daemon serving this repo.")
+
     return parser
 
 
-def _emit_info(repo_root: Path, as_json: bool, max_chars: int) -> int:
-    _bootstrap_if_missing(repo_root)
-    context = load_context(repo_root)
+def parse_args(parser: argparse.ArgumentParser, argv: list[str] | None = None) -> argparse.Namespace:
+    args = parser.parse_args(argv)
+    if args.command == "log":
+        single = ("what", "happened", "why", "outcome", "artifact", "source", "notes")
+        if args.from_jsonl is not None:
+            given = [f"--{name}" for name in single if getattr(args, name)]
+            if given:
+                parser.error(f"--from-jsonl cannot be combined with {', '.join(given)}")
+        else:
+            missing = [f"--{name}" for name in ("what", "happened", "why") if getattr(args, name) is None]
+            if missing:
+                parser.error(f"the following arguments are required: {', '.join(missing)}")
+    return args
+
+
+def _emit_info(session: CommandSession, as_json: bool, max_chars: int) -> int:
+    session.bootstrap_if_missing()
+    context = session.context()
     if as_json:
         print(json.dumps(context.to_dict(include_markdown=True, max_chars=max_chars), indent=2))
     else:
@@ -100,30 +165,38 @@ def _emit_info(repo_root: Path, as_json: bool, max_chars: int) -> int:
     return 0
 
 
-def _emit_run(repo_root: Path, skill: str, as_json: bool, max_chars: int) -> int:
-    _bootstrap_if_missing(repo_root)
-    context = load_context(repo_root)
-    if as_json:
-        print(
-            json.dumps(
-                {
-                    "mode": "payload-only",
-                    "skill": skill,
-                    "context": context.to_dict(include_markdown=True, max_chars=max_chars),
-                },
-                indent=2,
+def _emit_run(session: CommandSession, skill: str, as_json: bool, max_chars: int, use_cache: bool) -> int:
+    from .payload_cache import PayloadCache
+
+    session.bootstrap_if_missing()
+    rs = session.research_state()
+    cache = PayloadCache(rs.cache_dir / "payloads")
+    key = cache.key(rs, skill=skill, max_chars=max_chars, as_json=as_json) if use_cache else None
+    output = cache.get(key) if key is not None else None
+    if output is None:
+        context = session.context()
+        if as_json:
+            payload = {
+                "mode": "payload-only",
+                "skill": skill,
+                "context": context.to_dict(include_markdown=True, max_chars=max_chars),
+            }
+            output = json.dumps(payload, indent=2) + "\n"
+        else:
+            output = (
+                "# GRD Skill Payload\n\n"
+                f"- Skill: {skill}\n"
+                "- Mode: payload-only\n\n"
+                + context.to_markdown(max_chars=max_chars)
             )
-        )
-    else:
-        print("# GRD Skill Payload\n")
-        print(f"- Skill: {skill}")
-        print("- Mode: payload-only\n")
-        print(context.to_markdown(max_chars=max_chars), end="")
+        if key is not None:
+            cache.put(key, output)
+    print(output, end="")
     return 0
 
 
 def _emit_log(
-    repo_root: Path,
+    session: CommandSession,
     what: str,
     happened: str,
     why: str,
@@ -133,22 +206,24 @@ def _emit_log(
     notes: str | None,
     as_json: bool,
 ) -> int:
-    _bootstrap_if_missing(repo_root)
-    rs = ResearchState(root_dir=repo_root)
+    session.bootstrap_if_missing()
+    rs = session.research_state()
     journal_entry: dict[str, object] = {"what": what, "happened": happened, "why": why}
     if source:
         journal_entry["source"] = source
     if notes:
         journal_entry["notes"] = notes
-    rs.append_journal(journal_entry)
 
     experiment_payload: dict[str, object] | None = None
-    if outcome:
-        experiment_payload = dict(journal_entry)
-        experiment_payload["outcome"] = outcome
-        if artifacts:
-            experiment_payload["artifacts"] = artifacts
-        rs.append_experiment(experiment_payload)
+    with rs.transaction() as tx:
+        tx.append_journal(journal_entry)
+        if outcome:
+            experiment_payload = dict(journal_entry)
+            experiment_payload["outcome"] = outcome
+            if artifacts:
+                experiment_payload["artifacts"] = artifacts
+            tx.append_experiment(experiment_payload)
+    rs.render()
 
     if as_json:
         print(
@@ -165,8 +240,87 @@ def _emit_log(
     return 0
 
 
+def _log_records(lines: Iterable[str]) -> Iterator[tuple[int, dict[str, Any] | None, str | None]]:
+    for line_no, line in enumerate(lines, start=1):
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except ValueError as exc:
+            yield line_no, None, f"Invalid JSON: {exc}"
+            continue
+        if not isinstance(record, dict):
+            yield line_no, None, "Record must be a JSON object."
+            continue
+        yield line_no, record, None
+
+
+def _emit_log_batch(session: CommandSession, source: str, as_json: bool) -> int:
+    # Open the input before touching state, so an unreadable file is an input error rather than missing state.
+    try:
+        handle = sys.stdin if source == "-" else open(source, encoding="utf-8")
+    except OSError as exc:
+        message = f"Cannot read --from-jsonl {source}: {exc.strerror or exc}"
+        if as_json:
+            print(json.dumps({"status": "error", "command": "log", "error": message}, indent=2))
+        else:
+            print(message, file=sys.stderr)
+        return 2
+
+    errors: list[dict[str, object]] = []
+    logged = 0
+    experiments = 0
+    try:
+        session.bootstrap_if_missing()
+        rs = session.research_state()
+        with rs.transaction() as tx:
+            for line_no, record, error in _log_records(handle):
+                if record is None:
+                    errors.append({"line": line_no, "error": error})
+                    continue
+                journal_entry = {k: record[k] for k in ("what", "happened", "why", "source", "notes") if k in record}
+                # The transaction validates each entry as it is staged; the experiment
+                # twin has the same required fields, so it cannot fail once this passed.
+                try:
+                    tx.append_journal(journal_entry)
+                except StateContractError as exc:
+                    errors.append({"line": line_no, "error": str(exc)})
+                    continue
+                logged += 1
+                if str(record.get("outcome") or "").strip():
+                    experiment_entry = {**journal_entry, "outcome": record["outcome"]}
+                    artifacts = record.get("artifacts", record.get("artifact"))
+                    if artifacts:
+                        experiment_entry["artifacts"] = artifacts
+                    tx.append_experiment(experiment_entry)
+                    experiments += 1
+    finally:
+        if handle is not sys.stdin:
+            handle.close()
+    rs.render()
+
+    if as_json:
+        print(
+            json.dumps(
+                {
+                    "status": "ok" if not errors else "partial" if logged else "error",
+                    "command": "log",
+                    "logged": logged,
+                    "experiments": experiments,
+                    "errors": errors,
+                },
+                indent=2,
+            )
+        )
+    else:
+        print(f"Logged {logged} entries ({experiments} with outcomes) -> journal: {rs.journal_path}")
+        for error in errors:
+            print(f"line {error['line']}: {error['error']}", file=sys.stderr)
+    return 1 if errors else 0
+
+
 def _emit_promote(
-    repo_root: Path,
+    session: CommandSession,
     title: str,
     what: str,
     happened: str,
@@ -177,8 +331,8 @@ def _emit_promote(
     tags: list[str],
     as_json: bool,
 ) -> int:
-    _bootstrap_if_missing(repo_root)
-    rs = ResearchState(root_dir=repo_root)
+    session.bootstrap_if_missing()
+    rs = session.research_state()
     payload: dict[str, object] = {"title": title, "what": what, "happened": happened, "why": why}
     if source_entry:
         payload["source_entry"] = source_entry
@@ -197,6 +351,46 @@ def _emit_promote(
     return 0
 
 
+def _emit_query(
+    session: CommandSession,
+    text: str,
+    kind: str | None,
+    tag: str | None,
+    artifact: str | None,
+    phase: str | None,
+    since: str | None,
+    limit: int,
+    as_json: bool,
+) -> int:
+    from .query_index import QueryIndex
+
+    rs = session.research_state()
+    with QueryIndex(rs) as index:
+        index.refresh()
+        results = index.search(text, kind=kind, tag=tag, artifact=artifact, phase=phase, since=since, limit=limit)
+    if as_json:
+        print(json.dumps({"status": "ok", "command": "query", "results": results}, indent=2))
+    else:
+        if not results:
+            print("No matching records.")
+        for result in results:
+            print(f"[{result['kind']}] {result['created']} {result['title']} -> {result['source']}")
+    return 0
+
+
+def _emit_render(session: CommandSession, as_json: bool) -> int:
+    rs = session.research_state()
+    rendered = rs.render()
+    if as_json:
+        print(json.dumps({"status": "ok", "command": "render", "rendered": rendered}, indent=2))
+    else:
+        print(
+            f"Rendered {rendered['journal']} journal and {rendered['experiment']} experiment entries "
+            f"from {rs.events_path}"
+        )
+    return 0
+
+
 def _infer_mode(journal_entries: int, experiment_entries: int, hypothesis_entries: int) -> str:
     if journal_entries == 0:
         return "explore"
@@ -245,12 +439,14 @@ def _mode_actions(mode: str, rs: ResearchState) -> list[str]:
     ]
 
 
-def _emit_next(repo_root: Path, mode: str | None, max_actions: int, as_json: bool) -> int:
-    _bootstrap_if_missing(repo_root)
-    rs = ResearchState(root_dir=repo_root)
-    journal_entries = _count_entries(rs.journal_path)
-    experiment_entries = _count_entries(rs.experiments_path)
-    hypothesis_entries = len(list(rs.hypotheses_dir.glob("*.md"))) if rs.hypotheses_dir.exists() else 0
+def _emit_next(session: CommandSession, mode: str | None, max_actions: int, as_json: bool) -> int:
+    session.bootstrap_if_missing()
+    rs = session.research_state()
+    rs.render()
+    counts = rs.counts()
+    journal_entries = counts["journal"]
+    experiment_entries = counts["experiment"]
+    hypothesis_entries = counts["hypothesis"]
 
     selected_mode = mode or _infer_mode(journal_entries, experiment_entries, hypothesis_entries)
     actions = _mode_actions(selected_mode, rs)[: max(1, max_actions)]
@@ -276,19 +472,60 @@ def _emit_next(repo_root: Path, mode: str | None, max_actions: int, as_json: boo
     return 0
 
 
-def main() -> int:
-    parser = build_parser()
-    args = parser.parse_args()
-    repo_root = Path(args.repo_root).expanduser().resolve()
+def _emit_doctor(session: CommandSession, recount: bool, as_json: bool) -> int:
+    rs = session.research_state()
+    with rs.lock():
+        # Caught up over appends made behind their back, so only real drift is reported.
+        maintained = rs.maintained_counts()
+        if recount:
+            rs.rebuild_hypothesis_catalog()
+            actual = rs.recount()
+        else:
+            # Report only: nothing is rendered or written.
+            actual = rs.count_on_disk()
+    drift = [k for k in COUNTER_KINDS if maintained is not None and maintained[k] != actual[k]]
+    if maintained is None:
+        status = "initialized" if recount else "missing"
+    elif drift:
+        status = "repaired" if recount else "drift"
+    else:
+        status = "ok"
 
+    if as_json:
+        print(
+            json.dumps(
+                {"status": status, "command": "doctor", "counters": maintained, "actual": actual, "drift": drift},
+                indent=2,
+            )
+        )
+    else:
+        for kind in COUNTER_KINDS:
+            recorded = maintained[kind] if maintained is not None else "missing"
+            print(f"{kind}: counters={recorded} actual={actual[kind]}")
+        if status == "initialized":
+            print(f"Created {rs.counters_path}")
+        elif status == "missing":
+            print(f"No usable {rs.counters_path}; `grd next` or `grd doctor --recount` will create it.")
+        elif status == "repaired":
+            print(f"Repaired drift in: {', '.join(drift)}")
+        elif status == "drift":
+            print(f"Drift in: {', '.join(drift)}. Run `grd doctor --recount` to repair.")
+        else:
+            print("Counters match the files on disk.")
+    return 1 if status == "drift" else 0
+
+
+def run_command(args: argparse.Namespace, session: CommandSession) -> int:
     try:
         if args.command == "info":
-            return _emit_info(repo_root, args.json, args.max_chars)
+            return _emit_info(session, args.json, args.max_chars)
         if args.command == "run":
-            return _emit_run(repo_root, args.skill, args.json, args.max_chars)
+            return _emit_run(session, args.skill, args.json, args.max_chars, not args.no_cache)
+        if args.command == "log" and args.from_jsonl is not None:
+            return _emit_log_batch(session, args.from_jsonl, args.json)
         if args.command == "log":
             return _emit_log(
-                repo_root,
+                session,
                 args.what,
                 args.happened,
                 args.why,
@@ -300,7 +537,7 @@ def main() -> int:
             )
         if args.command == "promote":
             return _emit_promote(
-                repo_root,
+                session,
                 args.title,
                 args.what,
                 args.happened,
@@ -311,15 +548,46 @@ def main() -> int:
                 args.tag,
                 args.json,
             )
+        if args.command == "query":
+            return _emit_query(
+                session,
+                args.text,
+                args.kind,
+                args.tag,
+                args.artifact,
+                args.phase,
+                args.since,
+                args.limit,
+                args.json,
+            )
+        if args.command == "render":
+            return _emit_render(session, args.json)
         if args.command == "next":
-            return _emit_next(repo_root, args.mode, args.max_actions, args.json)
-        parser.error(f"Unknown command: {args.command}")
+            return _emit_next(session, args.mode, args.max_actions, args.json)
+        if args.command == "doctor":
+            return _emit_doctor(session, args.recount, args.json)
+        print(f"Unknown command: {args.command}", file=sys.stderr)
         return 2
-    except (FileNotFoundError, StateContractError, subprocess.CalledProcessError) as exc:
+    except (FileNotFoundError, LockTimeout, StateContractError) as exc:
         print(str(exc), file=sys.stderr)
         print("If state is missing/corrupt, run `grd-state-keeper mode=kickoff`.", file=sys.stderr)
         return 2
 
 
+def main(argv: list[str] | None = None) -> int:
+    parser = build_parser()
+    args = parse_args(parser, argv)
+    repo_root = Path(args.repo_root).expanduser().resolve()
+    if args.command == "serve":
+        from .grd_server import serve, stop
+
+        return stop(repo_root) if args.stop else serve(repo_root, idle_timeout=args.idle_timeout)
+    if args.trace:
+        tracing.enable()
+    tracing.set_default_dir(repo_root / ".grd" / tracing.TRACES_DIRNAME)
+    with tracing.span(f"grd {args.command}", "cli"):
+        return run_command(args, CommandSession(repo_root))
+
+
 if __name__ == "__main__":
     sys.exit(main())
@@ -0,0 +1,196 @@
+from __future__ import annotations
+
+import json
+import os
+import socket
+import sys
+from typing import Any
+
+# This module is the `grd` entry point, so it sticks to cheap imports: the
+# full CLI (state, YAML, ...) is only loaded when no daemon answers.
+
+FORWARDED_COMMANDS = ("info", "run", "log", "next", "promote")
+SOCKET_NAME = "grd.sock"
+CONNECT_TIMEOUT = 1.0
+# sockaddr_un.sun_path is 104-108 bytes depending on the platform.
+_MAX_SOCKET_PATH = 100
+
+# JSON-RPC 2.0 error codes; -32000..-32099 are reserved for the server.
+PARSE_ERROR = -32700
+INVALID_REQUEST = -32600
+METHOD_NOT_FOUND = -32601
+INVALID_PARAMS = -32602
+COMMAND_FAILED = -32001
+WRONG_REPO = -32002
+
+
+class DaemonError(RuntimeError):
+    """Raised when the `grd serve` daemon answers with a JSON-RPC error."""
+
+    def __init__(self, code: int, message: str):
+        super().__init__(message)
+        self.code = code
+
+
+def _resolve_root(repo_root: str | os.PathLike[str]) -> str:
+    return os.path.realpath(os.path.expanduser(os.fspath(repo_root)))
+
+
+def runtime_dir() -> str:
+    """Per-user directory for sockets that don't fit under `.grd/`: `$XDG_RUNTIME_DIR` or `<tmp>/grd-<uid>`."""
+    xdg = os.environ.get("XDG_RUNTIME_DIR", "")
+    if xdg and os.path.isabs(xdg):
+        return os.path.join(xdg, "grd")
+    import tempfile
+
+    return os.path.join(tempfile.gettempdir(), f"grd-{os.getuid()}")
+
+
+def ensure_runtime_dir(path: str) -> None:
+    """Create `path` with mode 0700, refusing one that another user owns or can write to."""
+    import stat
+
+    try:
+        os.mkdir(path, 0o700)
+    except FileExistsError:
+        pass
+    info = os.lstat(path)
+    if not stat.S_ISDIR(info.st_mode) or info.st_uid != os.getuid() or info.st_mode & 0o077:
+        raise PermissionError(f"Refusing to use {path}: it must be a directory owned by you with mode 0700.")
+
+
+def socket_path(repo_root: str | os.PathLike[str]) -> str:
+    """Socket of the daemon serving `repo_root`: `.grd/grd.sock`, or under `runtime_dir()` when that is too long."""
+    root = _resolve_root(repo_root)
+    path = os.path.join(root, ".grd", SOCKET_NAME)
+    if len(path.encode("utf-8")) <= _MAX_SOCKET_PATH:
+        return path
+    import hashlib
+
+    digest = hashlib.sha256(root.encode("utf-8")).hexdigest()[:16]
+    return os.path.join(runtime_dir(), f"{digest}.sock")
+
+
+def owned_by_user(path: str) -> bool:
+    """Whether `path` (not followed) belongs to this user; a socket anyone else made could be a spoofed daemon."""
+    try:
+        return os.lstat(path).st_uid == os.getuid()
+    except FileNotFoundError:
+        return False
+
+
+def _connect(path: str, timeout: float | None) -> socket.socket:
+    if not owned_by_user(path):
+        raise PermissionError(f"{path} is missing or not owned by the current user.")
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.settimeout(CONNECT_TIMEOUT)
+        sock.connect(path)
+        sock.settimeout(timeout)
+    except BaseException:
+        sock.close()
+        raise
+    return sock
+
+
+def _exchange(sock: socket.socket, method: str, params: dict[str, Any]) -> Any:
+    request = {"jsonrpc": "2.0", "id": 1, "method": method, "params": params}
+    sock.sendall(json.dumps(request, ensure_ascii=False).encode("utf-8") + b"\n")
+    with sock.makefile("rb") as reader:
+        line = reader.readline()
+    if not line:
+        raise ConnectionError("grd serve closed the connection without answering.")
+    response = json.loads(line)
+    error = response.get("error")
+    if error:
+        raise DaemonError(int(error.get("code", COMMAND_FAILED)), str(error.get("message", "")))
+    return response.get("result")
+
+
+def call(
+    repo_root: str | os.PathLike[str],
+    method: str,
+    params: dict[str, Any] | None = None,
+    *,
+    timeout: float | None = None,
+) -> Any:
+    """Send one JSON-RPC request to the `grd serve` daemon for `repo_root`.
+
+    Raises OSError when no daemon is listening and DaemonError when the
+    request fails on the daemon side.
+    """
+    with _connect(socket_path(repo_root), timeout) as sock:
+        return _exchange(sock, method, params or {})
+
+
+def _split_argv(argv: list[str]) -> tuple[str, str | None]:
+    """Return (`--repo-root` value, subcommand) without importing argparse."""
+    repo_root = "."
+    i = 0
+    while i < len(argv):
+        arg = argv[i]
+        if arg == "--repo-root" and i + 1 < len(argv):
+            repo_root = argv[i + 1]
+            i += 2
+            continue
+        if arg.startswith("--repo-root="):
+            repo_root = arg.split("=", 1)[1]
+            i += 1
+            continue
+        if arg.startswith("-"):
+            return repo_root, None
+        return repo_root, arg
+    return repo_root, None
+
+
+def forward(argv: list[str]) -> int | None:
+    """Run `grd <argv>` on this repo's daemon; None when it should run in-process instead."""
+    if os.environ.get("GRD_NO_DAEMON") == "1" or not hasattr(socket, "AF_UNIX") or not hasattr(os, "getuid"):
+        return None
+    repo_root, command = _split_argv(argv)
+    if command not in FORWARDED_COMMANDS:
+        return None
+    if any(arg.startswith("--from-jsonl") for arg in argv):
+        # Batch input is read from this process's stdin/cwd; one process is already the cheap path.
+        return None
+    if "--trace" in argv or os.environ.get("GRD_TRACE", "") not in ("", "0"):
+        # Spans are recorded by the process running the command, so trace in-process.
+        return None
+    path = socket_path(repo_root)
+    if not os.path.exists(path):
+        return None
+    try:
+        sock = _connect(path, None)
+    except OSError:
+        # Stale socket from a daemon that died (`grd serve` cleans it up on
+        # start), or one another user planted; either way run in-process.
+        return None
+
+    with sock:
+        try:
+            result = _exchange(sock, "cli", {"argv": argv, "cwd": os.getcwd()})
+        except DaemonError as exc:
+            if exc.code == WRONG_REPO:
+                return None
+            print(f"grd serve: {exc}", file=sys.stderr)
+            return 2
+        except (OSError, ValueError) as exc:
+            # The request may already have been applied, so don't retry it locally.
+            print(f"grd serve: {exc}", file=sys.stderr)
+            return 2
+    sys.stdout.write(result["stdout"])
+    sys.stderr.write(result["stderr"])
+    return int(result["exit_code"])
+
+
+def main() -> int:
+    code = forward(sys.argv[1:])
+    if code is not None:
+        return code
+    from .grd_cli import main as cli_main
+
+    return cli_main()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
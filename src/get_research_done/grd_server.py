@@ -0,0 +1,279 @@
+from __future__ import annotations
+
+import io
+import json
+import os
+import signal
+import socket
+import sys
+import threading
+import time
+import traceback
+from contextlib import redirect_stderr, redirect_stdout
+from pathlib import Path
+from typing import Any
+
+from . import tracing
+from .grd_cli import CommandSession, build_parser, parse_args, run_command
+from .grd_client import (
+    COMMAND_FAILED,
+    FORWARDED_COMMANDS,
+    INVALID_PARAMS,
+    INVALID_REQUEST,
+    METHOD_NOT_FOUND,
+    PARSE_ERROR,
+    WRONG_REPO,
+    call,
+    ensure_runtime_dir,
+    owned_by_user,
+    runtime_dir,
+    socket_path,
+)
+from .state import GrdContext, ResearchState, load_context
+
+
+_ACCEPT_POLL = 0.5
+# With tracing on, write the recorded spans out this often (or once this many
+# are pending) so a long-running daemon neither grows nor loses them.
+_TRACE_FLUSH_INTERVAL = 60.0
+_TRACE_FLUSH_EVENTS = 10_000
+
+
+class _RpcError(Exception):
+    def __init__(self, code: int, message: str):
+        super().__init__(message)
+        self.code = code
+        self.message = message
+
+
+def _signature(path: Path) -> tuple[int, int, int] | None:
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        return None
+    return stat.st_ino, stat.st_size, stat.st_mtime_ns
+
+
+class WarmSession(CommandSession):
+    """Session that reuses `ResearchState` and `GrdContext` until `.grd/` changes.
+
+    Every request re-stats what the cached objects were built from, so edits
+    made by other processes are picked up without a file watcher.
+    """
+
+    def __init__(self, repo_root: Path):
+        super().__init__(repo_root)
+        self._research_state: ResearchState | None = None
+        self._research_state_key: tuple[int, int, int] | None = None
+        self._context: GrdContext | None = None
+        self._context_key: tuple[Any, ...] | None = None
+
+    def research_state(self) -> ResearchState:
+        # state.md vs STATE.md is resolved from the directory listing.
+        key = _signature(self.repo_root / ".grd")
+        if self._research_state is None or key != self._research_state_key:
+            self._research_state = ResearchState(root_dir=self.repo_root)
+            self._research_state_key = key
+        return self._research_state
+
+    def context(self) -> GrdContext:
+        rs = self.research_state()
+        # Taken before loading, so a write that races the load forces a reload next time.
+        key = (rs.state_path, _signature(rs.state_path), rs.roadmap_path, _signature(rs.roadmap_path))
+        if self._context is None or key != self._context_key:
+            self._context = load_context(self.repo_root)
+            self._context_key = key
+        return self._context
+
+
+def _params_to_argv(params: dict[str, Any]) -> list[str]:
+    argv: list[str] = []
+    for key, value in params.items():
+        flag = "--" + key.replace("_", "-")
+        if flag in ("--repo-root", "--json"):
+            raise _RpcError(INVALID_PARAMS, f"Parameter not allowed: {key}")
+        if value is None or value is False:
+            continue
+        if value is True:
+            argv.append(flag)
+        elif isinstance(value, list):
+            for item in value:
+                argv.extend([flag, str(item)])
+        else:
+            argv.extend([flag, str(value)])
+    return argv
+
+
+class _Daemon:
+    def __init__(self, repo_root: Path):
+        self.repo_root = repo_root
+        self.session = WarmSession(repo_root)
+        self.parser = build_parser()
+        # Commands write to the process-wide stdout, so they run one at a time.
+        self.dispatch_lock = threading.Lock()
+        self.stopping = threading.Event()
+        self.last_activity = time.monotonic()
+        self.last_trace_flush = time.monotonic()
+
+    def run(self, listener: socket.socket, idle_timeout: float) -> None:
+        listener.settimeout(_ACCEPT_POLL)
+        while not self.stopping.is_set():
+            self._flush_trace()
+            try:
+                conn, _ = listener.accept()
+            except socket.timeout:
+                if idle_timeout and time.monotonic() - self.last_activity > idle_timeout:
+                    return
+                continue
+            threading.Thread(target=self._serve_connection, args=(conn,), daemon=True).start()
+
+    def _flush_trace(self) -> None:
+        pending = tracing.pending()
+        if not pending:
+            return
+        if pending < _TRACE_FLUSH_EVENTS and time.monotonic() - self.last_trace_flush < _TRACE_FLUSH_INTERVAL:
+            return
+        tracing.flush()
+        self.last_trace_flush = time.monotonic()
+
+    def _serve_connection(self, conn: socket.socket) -> None:
+        conn.settimeout(None)
+        with conn, conn.makefile("rb") as reader:
+            for line in reader:
+                response = self.handle(line)
+                try:
+                    conn.sendall(json.dumps(response, ensure_ascii=False).encode("utf-8") + b"\n")
+                except OSError:
+                    return
+
+    def handle(self, line: bytes) -> dict[str, Any]:
+        self.last_activity = time.monotonic()
+        try:
+            request = json.loads(line)
+        except ValueError:
+            return _error(None, PARSE_ERROR, "Parse error.")
+        if not isinstance(request, dict) or not isinstance(request.get("method"), str):
+            return _error(None, INVALID_REQUEST, "Invalid request.")
+
+        request_id = request.get("id")
+        method = request["method"]
+        params = request.get("params") or {}
+        try:
+            if not isinstance(params, dict):
+                raise _RpcError(INVALID_PARAMS, "params must be an object.")
+            if method == "ping":
+                result: Any = {"repo_root": str(self.repo_root), "pid": os.getpid()}
+            elif method == "shutdown":
+                self.stopping.set()
+                result = {"status": "stopping"}
+            elif method == "cli":
+                argv = params.get("argv")
+                if not isinstance(argv, list):
+                    raise _RpcError(INVALID_PARAMS, "cli expects an argv list.")
+                result = self._run_cli([str(arg) for arg in argv], str(params.get("cwd") or os.getcwd()))
+            elif method in FORWARDED_COMMANDS:
+                result = self._run_method(method, params)
+            else:
+                raise _RpcError(METHOD_NOT_FOUND, f"Unknown method: {method}")
+        except _RpcError as exc:
+            return _error(request_id, exc.code, exc.message)
+        return {"jsonrpc": "2.0", "id": request_id, "result": result}
+
+    def _run_method(self, method: str, params: dict[str, Any]) -> Any:
+        argv = ["--repo-root", str(self.repo_root), method, *_params_to_argv(params), "--json"]
+        outcome = self._run_cli(argv, str(self.repo_root))
+        if outcome["exit_code"] != 0 and not outcome["stdout"].strip():
+            raise _RpcError(COMMAND_FAILED, outcome["stderr"].strip() or f"{method} failed.")
+        return json.loads(outcome["stdout"])
+
+    def _run_cli(self, argv: list[str], cwd: str) -> dict[str, Any]:
+        stdout, stderr = io.StringIO(), io.StringIO()
+        with self.dispatch_lock, redirect_stdout(stdout), redirect_stderr(stderr):
+            try:
+                args = parse_args(self.parser, argv)
+                repo_root = (Path(cwd) / Path(args.repo_root).expanduser()).resolve()
+                if repo_root != self.repo_root:
+                    raise _RpcError(WRONG_REPO, f"This daemon serves {self.repo_root}, not {repo_root}.")
+                if args.command not in FORWARDED_COMMANDS:
+                    raise _RpcError(INVALID_PARAMS, f"`grd {args.command}` is not served by the daemon.")
+                if getattr(args, "from_jsonl", None) == "-":
+                    raise _RpcError(INVALID_PARAMS, "--from-jsonl - reads stdin, which the daemon does not have.")
+                if getattr(args, "from_jsonl", None):
+                    args.from_jsonl = str(Path(cwd) / args.from_jsonl)
+                exit_code = run_command(args, self.session)
+            except SystemExit as exc:
+                exit_code = exc.code if isinstance(exc.code, int) else int(exc.code is not None)
+            except _RpcError:
+                raise
+            except Exception:
+                traceback.print_exc()
+                exit_code = 1
+        return {"exit_code": exit_code, "stdout": stdout.getvalue(), "stderr": stderr.getvalue()}
+
+
+def _error(request_id: Any, code: int, message: str) -> dict[str, Any]:
+    return {"jsonrpc": "2.0", "id": request_id, "error": {"code": code, "message": message}}
+
+
+def _is_running(repo_root: Path) -> bool:
+    try:
+        call(repo_root, "ping", timeout=2.0)
+    except (OSError, ValueError):
+        return False
+    return True
+
+
+def serve(repo_root: Path, *, idle_timeout: float = 0) -> int:
+    """Answer `grd info/run/log/next/promote` for `repo_root` over a Unix socket until stopped."""
+    if not hasattr(socket, "AF_UNIX") or not hasattr(os, "getuid"):
+        print("`grd serve` needs Unix domain sockets, which this platform lacks.", file=sys.stderr)
+        return 2
+    path = Path(socket_path(repo_root))
+    if _is_running(repo_root):
+        print(f"grd serve is already running on {path}", file=sys.stderr)
+        return 1
+    try:
+        if str(path.parent) == runtime_dir():
+            ensure_runtime_dir(str(path.parent))
+        else:
+            path.parent.mkdir(parents=True, exist_ok=True)
+    except OSError as exc:
+        print(f"grd serve: {exc}", file=sys.stderr)
+        return 1
+    if os.path.lexists(path):
+        if not owned_by_user(str(path)):
+            print(f"grd serve: {path} belongs to another user; not replacing it.", file=sys.stderr)
+            return 1
+        path.unlink()
+
+    tracing.set_default_dir(repo_root / ".grd" / tracing.TRACES_DIRNAME)
+    daemon = _Daemon(repo_root)
+    listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    previous = signal.signal(signal.SIGTERM, lambda *_: daemon.stopping.set())
+    try:
+        # Create the socket 0600 from the start rather than chmod-ing it after bind.
+        umask = os.umask(0o177)
+        try:
+            listener.bind(str(path))
+        finally:
+            os.umask(umask)
+        listener.listen()
+        print(f"grd serve: listening on {path}", flush=True)
+        daemon.run(listener, idle_timeout)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        signal.signal(signal.SIGTERM, previous)
+        listener.close()
+        path.unlink(missing_ok=True)
+    return 0
+
+
+def stop(repo_root: Path) -> int:
+    try:
+        call(repo_root, "shutdown", timeout=5.0)
+    except (OSError, ValueError):
+        print(f"No grd serve daemon is running for {repo_root}", file=sys.stderr)
+        return 1
+    print(f"Stopped grd serve for {repo_root}")
+    return 0
@@ -1,9 +1,12 @@
 from __future__ import annotations
 
 import argparse
+import json
 import sys
+from pathlib import Path
 
-from .installer import SKILL_TARGET_DIRS, VALID_TARGETS, install_targets
+from . import tracing
+from .installer import LINK_MODES, SKILL_STORE_DIR, SKILL_TARGET_DIRS, VALID_TARGETS, install_targets, plan_install
 
 
 def _parse_targets(raw_targets: list[str]) -> list[str]:
@@ -36,6 +39,46 @@ def build_parser() -> argparse.ArgumentParser:
             "Repeat or use comma-separated values."
         ),
     )
+    parser.add_argument(
+        "--link-mode",
+        choices=LINK_MODES,
+        default="copy",
+        help=(
+            f"How skill targets share files: copy each tree (default), or keep one copy in {SKILL_STORE_DIR} "
+            "and hardlink/reflink/symlink to it. Falls back to copying files the filesystem can't link."
+        ),
+    )
+    parser.add_argument(
+        "--dest-list",
+        metavar="SPEC",
+        help=(
+            "Install into many repositories: a file with one destination or glob per line "
+            "('-' for stdin), or a glob such as '~/src/*'."
+        ),
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        help="Worker processes for --dest-list (default: CPU count).",
+    )
+    parser.add_argument(
+        "--json",
+        action="store_true",
+        help="With --dest-list, print one JSON summary instead of per-destination lines.",
+    )
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Print the planned file operations as JSON and exit without changing anything.",
+    )
+    parser.add_argument(
+        "--trace",
+        action="store_true",
+        help=(
+            f"Record timing spans to DEST/.grd/{tracing.TRACES_DIRNAME}/ as Chrome trace JSON "
+            f"(or set {tracing.TRACE_ENV})."
+        ),
+    )
     parser.add_argument(
         "--list-targets",
         action="store_true",
@@ -55,21 +98,47 @@ def main() -> int:
         return 0
 
     targets = _parse_targets(args.target or [])
+    if args.trace:
+        tracing.enable()
+    tracing.set_default_dir(Path(args.dest).expanduser().resolve() / ".grd" / tracing.TRACES_DIRNAME)
+    if args.dest_list is not None:
+        from .fleet import main_for_dest_list
+
+        return main_for_dest_list(
+            parser, args, "install", targets, link_mode=args.link_mode, dry_run=args.dry_run
+        )
+
+    if args.dry_run:
+        try:
+            plan = plan_install(args.dest, targets, link_mode=args.link_mode)
+        except ValueError as exc:
+            parser.error(str(exc))
+            return 2
+        print(json.dumps(plan.to_dict(), indent=2))
+        return 0
 
     try:
-        result = install_targets(args.dest, targets)
+        result = install_targets(args.dest, targets, link_mode=args.link_mode)
     except ValueError as exc:
         parser.error(str(exc))
         return 2
 
     print(f"Installed get-research-done into {result.dest}")
     print("Installed targets:")
+    reports = {report.target: report for report in result.reports}
     for target in result.installed_targets:
+        report = reports.get(target)
+        counts = ""
+        if report is not None:
+            linked = f", {report.linked} linked" if report.linked else ""
+            counts = f" ({report.copied} copied{linked}, {report.skipped} unchanged)"
         if target == "runtime":
-            print("- runtime -> .grd/templates, .grd/workflows")
+            print(f"- runtime -> .grd/templates, .grd/workflows{counts}")
             continue
         if target in SKILL_TARGET_DIRS:
-            print(f"- {target} -> {SKILL_TARGET_DIRS[target]}")
+            print(f"- {target} -> {SKILL_TARGET_DIRS[target]}{counts}")
+    linked = f", {result.linked} linked" if result.linked else ""
+    print(f"Files: {result.copied} copied{linked}, {result.skipped} unchanged")
     return 0
 
 
@@ -1,10 +1,22 @@
 from __future__ import annotations
 
+import errno
+import hashlib
+import json
+import os
 import shutil
-from contextlib import contextmanager
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from importlib import resources
 from pathlib import Path
+from typing import TYPE_CHECKING, Iterator
+
+from .atomic import write_atomic
+from .tracing import span
+
+if TYPE_CHECKING:
+    from importlib.abc import Traversable
 
 
 SKILL_TARGET_DIRS = {
@@ -33,38 +45,269 @@ LEGACY_SKILL_BASENAMES = (
 
 VALID_TARGETS = ("runtime", "codex", "claude", "opencode", "gemini", "core", "all")
 SKILL_TARGET_ORDER = ("codex", "claude", "opencode", "gemini")
+RUNTIME_TARGET_DIRS = {
+    "templates": ".grd/templates",
+    "workflows": ".grd/workflows",
+}
+MANIFEST_RELATIVE_PATH = ".grd/install-manifest.json"
+_MANIFEST_VERSION = 1
+LINK_MODES = ("copy", "hardlink", "reflink", "symlink")
+# With a link mode, skills are copied once here and each skill target links to this copy.
+SKILL_STORE_DIR = ".grd/skills"
+_FICLONE = 0x40049409
+
+
+@dataclass(frozen=True)
+class TargetReport:
+    target: str
+    copied: int
+    skipped: int
+    linked: int = 0
 
 
 @dataclass(frozen=True)
 class InstallResult:
     dest: Path
     installed_targets: tuple[str, ...]
+    reports: tuple[TargetReport, ...] = ()
+    plan: InstallPlan | None = None
+
+    @property
+    def copied(self) -> int:
+        return sum(report.copied for report in self.reports)
+
+    @property
+    def skipped(self) -> int:
+        return sum(report.skipped for report in self.reports)
+
+    @property
+    def linked(self) -> int:
+        return sum(report.linked for report in self.reports)
 
 
 @dataclass(frozen=True)
 class UninstallResult:
     dest: Path
     removed_targets: tuple[str, ...]
+    plan: InstallPlan | None = None
 
 
-def _copy_tree_contents(source_dir: Path, dest_dir: Path) -> None:
-    dest_dir.mkdir(parents=True, exist_ok=True)
-    for item in source_dir.iterdir():
-        target = dest_dir / item.name
-        if item.is_dir():
-            shutil.copytree(item, target, dirs_exist_ok=True)
-        else:
-            shutil.copy2(item, target)
+@dataclass(frozen=True)
+class _SourceFile:
+    relative: str
+    path: Traversable
+    size: int
+    sha256: str
 
 
-def _copy_skill_dirs(source_dir: Path, dest_dir: Path) -> None:
-    dest_dir.mkdir(parents=True, exist_ok=True)
-    for item in source_dir.iterdir():
-        if not item.is_dir():
-            continue
-        if not item.name.startswith("grd-"):
+@dataclass(frozen=True)
+class PlannedOperation:
+    """One step of an install or uninstall; `path` is relative to the destination."""
+
+    action: str
+    target: str
+    path: str
+    mode: str = "copy"
+    source: _SourceFile | None = None
+    # What is copied or linked: the packaged asset, or the `.grd/skills` copy in a link mode.
+    link_source: Path | Traversable | None = None
+
+    def to_dict(self) -> dict[str, str]:
+        payload = {"action": self.action, "target": self.target, "path": self.path}
+        if self.source is not None:
+            payload["mode"] = self.mode
+        return payload
+
+
+@dataclass(frozen=True)
+class InstallPlan:
+    """Operations `install_targets`/`uninstall_targets` will perform, computed without writing.
+
+    Install actions are `create`, `overwrite`, `skip-identical`,
+    `remove-legacy` and `remove` (the `.grd/skills` store once no target links
+    into it); uninstall actions are `remove` and `remove-legacy`.
+    """
+
+    dest: Path
+    action: str
+    targets: tuple[str, ...]
+    operations: tuple[PlannedOperation, ...]
+    link_mode: str = "copy"
+
+    def counts(self) -> dict[str, int]:
+        counts: dict[str, int] = {}
+        for operation in self.operations:
+            counts[operation.action] = counts.get(operation.action, 0) + 1
+        return counts
+
+    def to_dict(self) -> dict[str, object]:
+        return {
+            "dest": str(self.dest),
+            "action": self.action,
+            "targets": list(self.targets),
+            "link_mode": self.link_mode,
+            "counts": self.counts(),
+            "operations": [operation.to_dict() for operation in self.operations],
+        }
+
+
+def _digest(resource: Path | Traversable) -> tuple[int, str]:
+    """Size and SHA-256 of a file or packaged resource, read in one pass."""
+    size = 0
+    digest = hashlib.sha256()
+    with resource.open("rb") as handle:
+        for chunk in iter(lambda: handle.read(1024 * 1024), b""):
+            size += len(chunk)
+            digest.update(chunk)
+    return size, digest.hexdigest()
+
+
+def _hash_file(path: Path) -> str:
+    return _digest(path)[1]
+
+
+def _iter_resources(item: Traversable, relative: str) -> Iterator[tuple[str, Traversable]]:
+    if item.is_file():
+        yield relative, item
+        return
+    for child in sorted(item.iterdir(), key=lambda child: child.name):
+        yield from _iter_resources(child, f"{relative}/{child.name}")
+
+
+def _walk_source(source_dir: Traversable, *, skills_only: bool = False) -> list[_SourceFile]:
+    """Files under `source_dir` (only `grd-*` skill directories with `skills_only`), hashed once.
+
+    `source_dir` may be a zip- or wheel-backed `Traversable`; files are read in place.
+    """
+    files: list[_SourceFile] = []
+    for item in sorted(source_dir.iterdir(), key=lambda item: item.name):
+        if skills_only and not (item.is_dir() and item.name.startswith("grd-")):
             continue
-        shutil.copytree(item, dest_dir / item.name, dirs_exist_ok=True)
+        for relative, resource in _iter_resources(item, item.name):
+            files.append(_SourceFile(relative, resource, *_digest(resource)))
+    return files
+
+
+def _copy_resource(source: Path | Traversable, target: Path) -> None:
+    """Copy a file or packaged resource to `target`, streaming resources that are not on disk."""
+    if isinstance(source, Path):
+        shutil.copy2(source, target)
+        return
+    with source.open("rb") as reader, target.open("wb") as writer:
+        shutil.copyfileobj(reader, writer, 1024 * 1024)
+
+
+def _is_linked(target: Path, source: Path, mode: str) -> bool:
+    try:
+        if mode == "symlink":
+            return target.is_symlink() and os.readlink(target) == os.path.relpath(source, target.parent)
+        if mode == "hardlink":
+            return not target.is_symlink() and os.path.samefile(target, source)
+    except OSError:
+        pass
+    return False
+
+
+def _is_current(
+    target: Path,
+    source: _SourceFile,
+    recorded: dict[str, object] | None,
+    mode: str,
+    link_source: Path | Traversable,
+) -> bool:
+    if _is_linked(target, link_source, mode):
+        return True
+    try:
+        stat = target.lstat()
+    except FileNotFoundError:
+        return False
+    # A link left by another mode is replaced, never treated as an up-to-date copy.
+    if target.is_symlink() or (recorded or {}).get("mode", "copy") != mode:
+        return False
+    if stat.st_size != source.size:
+        return False
+    if (
+        recorded is not None
+        and recorded.get("sha256") == source.sha256
+        and recorded.get("size") == stat.st_size
+        and recorded.get("mtime_ns") == stat.st_mtime_ns
+    ):
+        return True
+    # Unknown or touched since the last install (or a link mode fell back to a
+    # copy on this filesystem): compare contents.
+    return _hash_file(target) == source.sha256
+
+
+def _reflink(source: Path, target: Path) -> None:
+    """Clone `source` into a new file `target` sharing its data blocks (FICLONE / clonefile)."""
+    if sys.platform == "darwin":
+        import ctypes
+
+        libc = ctypes.CDLL(None, use_errno=True)
+        if libc.clonefile(os.fsencode(source), os.fsencode(target), 0) != 0:
+            code = ctypes.get_errno()
+            raise OSError(code, os.strerror(code), str(target))
+        return
+    try:
+        import fcntl
+    except ImportError:
+        raise OSError(errno.ENOTSUP, "reflink is not supported on this platform", str(target)) from None
+    with source.open("rb") as src, target.open("wb") as dst:
+        fcntl.ioctl(dst.fileno(), _FICLONE, src.fileno())
+    shutil.copystat(source, target)
+
+
+def _place(source: Path | Traversable, target: Path, mode: str) -> bool:
+    """Write `source` to `target` via a temp name and `os.replace`; True when it was linked.
+
+    Replacing (rather than writing in place) keeps an existing hard or symbolic
+    link's other end untouched. A link mode the filesystem rejects falls back
+    to a copy for this file.
+    """
+    target.parent.mkdir(parents=True, exist_ok=True)
+    tmp = target.with_name(f".{target.name}.{os.getpid()}.tmp")
+    tmp.unlink(missing_ok=True)
+    linked = False
+    try:
+        if mode != "copy":
+            try:
+                if mode == "symlink":
+                    os.symlink(os.path.relpath(source, target.parent), tmp)
+                elif mode == "hardlink":
+                    os.link(source, tmp)
+                else:
+                    _reflink(source, tmp)
+                linked = True
+            except OSError:
+                tmp.unlink(missing_ok=True)
+        if not linked:
+            _copy_resource(source, tmp)
+        os.replace(tmp, target)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+    return linked
+
+
+def _load_manifest(dest: Path) -> dict[str, object]:
+    try:
+        data = json.loads((dest / MANIFEST_RELATIVE_PATH).read_text(encoding="utf-8"))
+    except (FileNotFoundError, ValueError):
+        data = None
+    if not isinstance(data, dict) or data.get("version") != _MANIFEST_VERSION:
+        return {"version": _MANIFEST_VERSION, "targets": [], "files": {}}
+    if not isinstance(data.get("files"), dict) or not isinstance(data.get("targets"), list):
+        return {"version": _MANIFEST_VERSION, "targets": [], "files": {}}
+    return data
+
+
+def _write_manifest(dest: Path, manifest: dict[str, object]) -> None:
+    path = dest / MANIFEST_RELATIVE_PATH
+    if not manifest["files"]:
+        path.unlink(missing_ok=True)
+        return
+    path.parent.mkdir(parents=True, exist_ok=True)
+    write_atomic(path, (json.dumps(manifest, indent=2, sort_keys=True) + "\n").encode("utf-8"))
 
 
 def _remove_path(path: Path) -> None:
@@ -76,17 +319,6 @@ def _remove_path(path: Path) -> None:
     shutil.rmtree(path)
 
 
-def _remove_tree_contents(source_dir: Path, dest_dir: Path) -> None:
-    for item in source_dir.iterdir():
-        _remove_path(dest_dir / item.name)
-
-
-def _remove_legacy_skill_dirs(dest_dir: Path) -> None:
-    _remove_path(dest_dir / "_shared")
-    for basename in LEGACY_SKILL_BASENAMES:
-        _remove_path(dest_dir / f"grd-{basename}")
-
-
 def _prune_empty_dirs(start: Path, root: Path) -> None:
     current = start
     while current != root and current != current.parent:
@@ -159,59 +391,323 @@ def _normalize_uninstall_targets(
     return tuple(item for item in order if item in expanded)
 
 
-def _has_assets(base_dir: Path) -> bool:
-    return all((base_dir / name).is_dir() for name in ("skills", "templates", "workflows"))
+def _has_assets(base_dir: Path | Traversable) -> bool:
+    return all(base_dir.joinpath(name).is_dir() for name in ("skills", "templates", "workflows"))
+
 
+def _resolve_assets_dir() -> Path | Traversable:
+    """The packaged assets, or the repo checkout's copies in a source tree.
 
-@contextmanager
-def _resolve_assets_dir():
+    Assets are returned as a `Traversable` and read in place, so a package
+    imported from a zip or wheel is never extracted to a temp directory. From
+    site-packages or a checkout this is a plain `Path`.
+    """
     packaged_assets = resources.files("get_research_done").joinpath("assets")
-    try:
-        with resources.as_file(packaged_assets) as candidate:
-            if _has_assets(candidate):
-                yield candidate
-                return
-    except FileNotFoundError:
-        pass
+    if _has_assets(packaged_assets):
+        return packaged_assets
 
     repo_root = Path(__file__).resolve().parents[2]
     if _has_assets(repo_root):
-        yield repo_root
-        return
+        return repo_root
 
     raise FileNotFoundError(
         "Could not locate packaged assets (skills/templates/workflows)."
     )
 
 
-def install_targets(dest: str | Path, targets: list[str] | tuple[str, ...]) -> InstallResult:
+def _assets(assets_dir: str | Path | None) -> Path | Traversable:
+    return Path(assets_dir) if assets_dir is not None else _resolve_assets_dir()
+
+
+def _legacy_operations(dest: Path, target: str) -> list[PlannedOperation]:
+    relative_dir = SKILL_TARGET_DIRS[target]
+    names = ["_shared", *(f"grd-{basename}" for basename in LEGACY_SKILL_BASENAMES)]
+    return [
+        PlannedOperation("remove-legacy", target, f"{relative_dir}/{name}")
+        for name in names
+        if os.path.lexists(dest / relative_dir / name)
+    ]
+
+
+def _file_operations(
+    dest: Path,
+    target: str,
+    prefix: str,
+    files: list[_SourceFile],
+    recorded: dict[str, dict[str, object]],
+    *,
+    mode: str = "copy",
+    link_root: Path | None = None,
+    rewrite: frozenset[str] = frozenset(),
+) -> list[PlannedOperation]:
+    operations: list[PlannedOperation] = []
+    for source in files:
+        relative = f"{prefix}/{source.relative}"
+        path = dest / relative
+        link_source = link_root / source.relative if link_root is not None else source.path
+        if source.relative not in rewrite and _is_current(path, source, recorded.get(relative), mode, link_source):
+            action = "skip-identical"
+        else:
+            action = "overwrite" if os.path.lexists(path) else "create"
+        operations.append(PlannedOperation(action, target, relative, mode, source, link_source))
+    return operations
+
+
+def _drop_store(selected: tuple[str, ...], link_mode: str, manifest: dict[str, object]) -> bool:
+    """Whether the installed `.grd/skills` store is unused once `selected` is installed in `link_mode`."""
+    recorded: dict[str, dict[str, object]] = manifest["files"]
+    store_prefix = f"{SKILL_STORE_DIR}/"
+    if not any(path.startswith(store_prefix) for path in recorded):
+        return False
+    if link_mode != "copy" and any(target in SKILL_TARGET_DIRS for target in selected):
+        return False
+    others = tuple(
+        f"{SKILL_TARGET_DIRS[target]}/"
+        for target in manifest["targets"]
+        if target in SKILL_TARGET_DIRS and target not in selected
+    )
+    return not any(
+        path.startswith(others) and entry.get("mode", "copy") != "copy"
+        for path, entry in recorded.items()
+    )
+
+
+def _store_operations(dest: Path, recorded: dict[str, dict[str, object]]) -> list[PlannedOperation]:
+    store_prefix = f"{SKILL_STORE_DIR}/"
+    names = sorted({path[len(store_prefix):].split("/", 1)[0] for path in recorded if path.startswith(store_prefix)})
+    return [
+        PlannedOperation("remove", "skill-store", f"{SKILL_STORE_DIR}/{name}")
+        for name in names
+        if os.path.lexists(dest / SKILL_STORE_DIR / name)
+    ]
+
+
+def _plan_install(
+    dest: Path,
+    selected: tuple[str, ...],
+    link_mode: str,
+    assets_dir: Path | Traversable,
+    manifest: dict[str, object],
+) -> InstallPlan:
+    """Walk the packaged assets and the destination once and decide every write."""
+    recorded: dict[str, dict[str, object]] = manifest["files"]
+    installed_before = set(manifest["targets"])
+    skill_targets = [target for target in selected if target in SKILL_TARGET_DIRS]
+    operations: list[PlannedOperation] = []
+    if "runtime" in selected:
+        for name, prefix in RUNTIME_TARGET_DIRS.items():
+            files = _walk_source(assets_dir.joinpath(name))
+            operations += _file_operations(dest, "runtime", prefix, files, recorded)
+    if _drop_store(selected, link_mode, manifest):
+        # Switched back to copies everywhere; removed after the targets stop linking into it.
+        operations += _store_operations(dest, recorded)
+    if not skill_targets:
+        return InstallPlan(dest, "install", selected, tuple(operations), link_mode)
+
+    skills = _walk_source(assets_dir.joinpath("skills"), skills_only=True)
+    link_root = None
+    rewrite: frozenset[str] = frozenset()
+    if link_mode != "copy":
+        link_root = dest / SKILL_STORE_DIR
+        store = _file_operations(dest, "skill-store", SKILL_STORE_DIR, skills, recorded)
+        operations += store
+        if link_mode != "symlink":
+            # Rewriting a store file gives it a new inode; hard links and clones must follow.
+            prefix_len = len(SKILL_STORE_DIR) + 1
+            rewrite = frozenset(op.path[prefix_len:] for op in store if op.action != "skip-identical")
+    for target in skill_targets:
+        if target not in installed_before:
+            # Legacy skill names predate the manifest, so a target it lists is already clean.
+            operations += _legacy_operations(dest, target)
+        operations += _file_operations(
+            dest,
+            target,
+            SKILL_TARGET_DIRS[target],
+            skills,
+            recorded,
+            mode=link_mode,
+            link_root=link_root,
+            rewrite=rewrite,
+        )
+    return InstallPlan(dest, "install", selected, tuple(operations), link_mode)
+
+
+def plan_install(
+    dest: str | Path,
+    targets: list[str] | tuple[str, ...],
+    *,
+    link_mode: str = "copy",
+    assets_dir: str | Path | None = None,
+) -> InstallPlan:
+    """What `install_targets` would do, without writing anything."""
+    if link_mode not in LINK_MODES:
+        raise ValueError(f"Unknown link mode '{link_mode}'. Valid modes: {', '.join(LINK_MODES)}")
+    resolved_dest = Path(dest).expanduser().resolve()
+    selected = _normalize_targets(list(targets))
+    return _plan_install(resolved_dest, selected, link_mode, _assets(assets_dir), _load_manifest(resolved_dest))
+
+
+def _execute_target(
+    dest: Path,
+    target: str,
+    operations: list[PlannedOperation],
+) -> tuple[TargetReport, dict[str, dict[str, object]]]:
+    copied = skipped = linked = 0
+    entries: dict[str, dict[str, object]] = {}
+    with span("install.target", "install", target=target) as traced:
+        for operation in operations:
+            path = dest / operation.path
+            if operation.action in ("remove", "remove-legacy"):
+                _remove_path(path)
+                continue
+            if operation.action == "skip-identical":
+                skipped += 1
+            elif _place(operation.link_source, path, operation.mode):
+                linked += 1
+            else:
+                copied += 1
+            stat = path.stat()
+            entries[operation.path] = {
+                "sha256": operation.source.sha256,
+                "size": stat.st_size,
+                "mtime_ns": stat.st_mtime_ns,
+                "mode": operation.mode,
+            }
+        traced.set(copied=copied, skipped=skipped, linked=linked)
+    return TargetReport(target, copied, skipped, linked), entries
+
+
+def _execute_install(plan: InstallPlan) -> list[tuple[TargetReport, dict[str, dict[str, object]]]]:
+    by_target: dict[str, list[PlannedOperation]] = {}
+    for operation in plan.operations:
+        by_target.setdefault(operation.target, []).append(operation)
+    for target in plan.targets:
+        by_target.setdefault(target, [])
+    for target in SKILL_TARGET_DIRS:
+        if target in plan.targets:
+            (plan.dest / SKILL_TARGET_DIRS[target]).mkdir(parents=True, exist_ok=True)
+    results = []
+    store = by_target.pop("skill-store", [])
+    removals = [operation for operation in store if operation.action == "remove"]
+    store = [operation for operation in store if operation.action != "remove"]
+    if store:
+        # The store must be current before any target links into it.
+        results.append(_execute_target(plan.dest, "skill-store", store))
+    with ThreadPoolExecutor(max_workers=max(len(by_target), 1)) as pool:
+        futures = [pool.submit(_execute_target, plan.dest, target, ops) for target, ops in by_target.items()]
+        results.extend(future.result() for future in futures)
+    if removals:
+        # ... and may only go once no target links into it any more.
+        results.append(_execute_target(plan.dest, "skill-store", removals))
+    return results
+
+
+def install_targets(
+    dest: str | Path,
+    targets: list[str] | tuple[str, ...],
+    *,
+    link_mode: str = "copy",
+    assets_dir: str | Path | None = None,
+) -> InstallResult:
+    """Install `targets` into `dest`, writing only files that differ from the packaged assets.
+
+    The install is planned first (see `plan_install`) and the plan is then
+    executed without walking either tree again. `.grd/install-manifest.json`
+    records the hash, size and mtime of every installed file, so unchanged
+    files are skipped without being read. Targets are installed concurrently.
+    With a `link_mode` other than `copy`, skills are copied once into
+    `.grd/skills` and every skill target hard links, reflinks or symlinks to
+    those files (per-file fallback to a copy). Pass `assets_dir` to reuse an
+    already resolved asset tree.
+    """
+    if link_mode not in LINK_MODES:
+        raise ValueError(f"Unknown link mode '{link_mode}'. Valid modes: {', '.join(LINK_MODES)}")
     resolved_dest = Path(dest).expanduser().resolve()
     resolved_dest.mkdir(parents=True, exist_ok=True)
 
     selected = _normalize_targets(list(targets))
 
-    with _resolve_assets_dir() as assets_dir:
-        if "runtime" in selected:
-            _copy_tree_contents(
-                assets_dir / "templates",
-                resolved_dest / ".grd" / "templates",
-            )
-            _copy_tree_contents(
-                assets_dir / "workflows",
-                resolved_dest / ".grd" / "workflows",
-            )
-
-        for target, relative_path in SKILL_TARGET_DIRS.items():
-            if target not in selected:
-                continue
-            target_dir = resolved_dest / relative_path
-            _remove_legacy_skill_dirs(target_dir)
-            _copy_skill_dirs(
-                assets_dir / "skills",
-                target_dir,
-            )
+    with span("install", "install", dest=resolved_dest, targets=",".join(selected), link_mode=link_mode):
+        assets = _assets(assets_dir)
+        manifest = _load_manifest(resolved_dest)
+        with span("install.plan", "install"):
+            plan = _plan_install(resolved_dest, selected, link_mode, assets, manifest)
+        drop_store = _drop_store(selected, link_mode, manifest)
+        results = _execute_install(plan)
+
+    recorded: dict[str, dict[str, object]] = manifest["files"]
+    if drop_store:
+        for path in [path for path in recorded if path.startswith(f"{SKILL_STORE_DIR}/")]:
+            del recorded[path]
+        _prune_empty_dirs(resolved_dest / SKILL_STORE_DIR, resolved_dest)
+    for _, entries in results:
+        recorded.update(entries)
+    installed = set(manifest["targets"]) | set(selected)
+    manifest["targets"] = [target for target in ("runtime", *SKILL_TARGET_ORDER) if target in installed]
+    _write_manifest(resolved_dest, manifest)
+    order = {target: i for i, target in enumerate(("skill-store", *selected))}
+    reports = sorted((report for report, _ in results), key=lambda report: order.get(report.target, len(order)))
+    return InstallResult(
+        dest=resolved_dest,
+        installed_targets=selected,
+        reports=tuple(reports),
+        plan=plan,
+    )
 
-    return InstallResult(dest=resolved_dest, installed_targets=selected)
+
+def _uninstall_prefixes(removed: tuple[str, ...], drop_store: bool) -> list[str]:
+    prefixes = [SKILL_TARGET_DIRS[target] for target in removed if target in SKILL_TARGET_DIRS]
+    if "runtime" in removed:
+        prefixes.extend(RUNTIME_TARGET_DIRS.values())
+    if drop_store:
+        prefixes.append(SKILL_STORE_DIR)
+    return prefixes
+
+
+def _plan_uninstall(
+    dest: Path,
+    selected: tuple[str, ...],
+    assets_dir: Path | Traversable,
+    manifest: dict[str, object],
+) -> tuple[InstallPlan, bool]:
+    """Plan removals; also returns whether the `.grd/skills` store goes too."""
+    remaining = [target for target in manifest["targets"] if target not in selected]
+    drop_store = not any(target in SKILL_TARGET_DIRS for target in remaining)
+    sources = {"skills": sorted(item.name for item in assets_dir.joinpath("skills").iterdir())}
+    for name in RUNTIME_TARGET_DIRS:
+        sources[name] = sorted(item.name for item in assets_dir.joinpath(name).iterdir())
+
+    operations: list[PlannedOperation] = []
+
+    def remove(target: str, relative_dir: str, names: list[str]) -> None:
+        for name in names:
+            if os.path.lexists(dest / relative_dir / name):
+                operations.append(PlannedOperation("remove", target, f"{relative_dir}/{name}"))
+
+    for target in SKILL_TARGET_ORDER:
+        if target in selected:
+            remove(target, SKILL_TARGET_DIRS[target], sources["skills"])
+            operations.extend(_legacy_operations(dest, target))
+    if drop_store:
+        remove("skill-store", SKILL_STORE_DIR, sources["skills"])
+    if "runtime" in selected:
+        for name, relative_dir in RUNTIME_TARGET_DIRS.items():
+            remove("runtime", relative_dir, sources[name])
+    return InstallPlan(dest, "uninstall", selected, tuple(operations)), drop_store
+
+
+def plan_uninstall(
+    dest: str | Path,
+    targets: list[str] | tuple[str, ...],
+    *,
+    remove_runtime: bool = False,
+    assets_dir: str | Path | None = None,
+) -> InstallPlan:
+    """What `uninstall_targets` would remove, without touching disk."""
+    resolved_dest = Path(dest).expanduser().resolve()
+    selected = _normalize_uninstall_targets(list(targets), remove_runtime=remove_runtime)
+    plan, _ = _plan_uninstall(resolved_dest, selected, _assets(assets_dir), _load_manifest(resolved_dest))
+    return plan
 
 
 def uninstall_targets(
@@ -219,6 +715,7 @@ def uninstall_targets(
     targets: list[str] | tuple[str, ...],
     *,
     remove_runtime: bool = False,
+    assets_dir: str | Path | None = None,
 ) -> UninstallResult:
     resolved_dest = Path(dest).expanduser().resolve()
     selected = _normalize_uninstall_targets(
@@ -226,29 +723,24 @@ def uninstall_targets(
         remove_runtime=remove_runtime,
     )
 
-    with _resolve_assets_dir() as assets_dir:
-        if "runtime" in selected:
-            _remove_tree_contents(
-                assets_dir / "templates",
-                resolved_dest / ".grd" / "templates",
-            )
-            _remove_tree_contents(
-                assets_dir / "workflows",
-                resolved_dest / ".grd" / "workflows",
-            )
-            _prune_empty_dirs(resolved_dest / ".grd" / "templates", resolved_dest)
-            _prune_empty_dirs(resolved_dest / ".grd" / "workflows", resolved_dest)
-            _prune_empty_dirs(resolved_dest / ".grd", resolved_dest)
-
-        for target, relative_path in SKILL_TARGET_DIRS.items():
-            if target not in selected:
-                continue
-            target_dir = resolved_dest / relative_path
-            _remove_tree_contents(
-                assets_dir / "skills",
-                target_dir,
-            )
-            _remove_legacy_skill_dirs(target_dir)
-            _prune_empty_dirs(target_dir, resolved_dest)
-
-    return UninstallResult(dest=resolved_dest, removed_targets=selected)
+    with span("uninstall", "install", dest=resolved_dest, targets=",".join(selected)):
+        assets = _assets(assets_dir)
+        manifest = _load_manifest(resolved_dest)
+        plan, drop_store = _plan_uninstall(resolved_dest, selected, assets, manifest)
+        prefixes = _uninstall_prefixes(selected, drop_store)
+
+        # Drop the manifest entries first so pruning can remove an otherwise empty `.grd/`.
+        manifest["targets"] = [target for target in manifest["targets"] if target not in selected]
+        files: dict[str, object] = manifest["files"]
+        manifest["files"] = {
+            path: entry for path, entry in files.items() if not path.startswith(tuple(f"{p}/" for p in prefixes))
+        }
+        _write_manifest(resolved_dest, manifest)
+
+        # Linked files are unlinked, never followed, so the store survives for other targets.
+        for operation in plan.operations:
+            _remove_path(resolved_dest / operation.path)
+        for relative_dir in prefixes:
+            _prune_empty_dirs(resolved_dest / relative_dir, resolved_dest)
+
+    return UninstallResult(dest=resolved_dest, removed_targets=selected, plan=plan)
@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+import os
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None  # type: ignore[assignment]
+    import msvcrt
+
+
+DEFAULT_TIMEOUT = 10.0
+
+
+class LockTimeout(TimeoutError):
+    """Raised when another process holds the `.grd/` lock past the timeout."""
+
+
+class _HeldLock:
+    def __init__(self) -> None:
+        self.guard = threading.RLock()
+        self.fd: int | None = None
+        self.depth = 0
+
+
+_HELD: dict[str, _HeldLock] = {}
+_HELD_GUARD = threading.Lock()
+
+
+def default_timeout() -> float:
+    raw = os.environ.get("GRD_LOCK_TIMEOUT", "")
+    try:
+        return float(raw) if raw else DEFAULT_TIMEOUT
+    except ValueError:
+        return DEFAULT_TIMEOUT
+
+
+def _try_lock(fd: int) -> bool:
+    try:
+        if fcntl is not None:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        else:
+            os.lseek(fd, 0, os.SEEK_SET)
+            msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+    except OSError:
+        return False
+    return True
+
+
+def _unlock(fd: int) -> None:
+    if fcntl is not None:
+        fcntl.flock(fd, fcntl.LOCK_UN)
+    else:
+        os.lseek(fd, 0, os.SEEK_SET)
+        msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+
+
+@contextmanager
+def file_lock(path: Path, timeout: float | None = None) -> Iterator[None]:
+    """Hold an exclusive advisory lock on `path` for the duration of the block.
+
+    The lock is re-entrant within a thread, so locked helpers can call each
+    other. Other threads and processes wait up to `timeout` seconds.
+    """
+    timeout = default_timeout() if timeout is None else timeout
+    deadline = time.monotonic() + timeout
+    key = os.path.abspath(path)
+    with _HELD_GUARD:
+        held = _HELD.setdefault(key, _HeldLock())
+
+    if not held.guard.acquire(timeout=max(timeout, 0)):
+        raise LockTimeout(f"Timed out after {timeout:g}s waiting for lock: {path}")
+    try:
+        if held.depth == 0:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o644)
+            delay = 0.001
+            while not _try_lock(fd):
+                if time.monotonic() >= deadline:
+                    os.close(fd)
+                    raise LockTimeout(f"Timed out after {timeout:g}s waiting for lock: {path}")
+                time.sleep(delay)
+                delay = min(delay * 2, 0.05)
+            held.fd = fd
+        held.depth += 1
+        try:
+            yield
+        finally:
+            held.depth -= 1
+            if held.depth == 0 and held.fd is not None:
+                _unlock(held.fd)
+                os.close(held.fd)
+                held.fd = None
+    finally:
+        held.guard.release()
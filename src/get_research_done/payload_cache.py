@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from pathlib import Path
+
+from .atomic import write_atomic
+from .state import ResearchState, _has_content, _scan_frontmatter
+
+
+DEFAULT_MAX_BYTES = 4 * 1024 * 1024
+_VERSION = 2
+
+
+def _state_hash(rs: ResearchState) -> str:
+    # The payload only depends on the frontmatter (or, without one, on whether
+    # the file has content), so a large markdown body is never read.
+    raw, _ = _scan_frontmatter(rs.state_path)
+    if raw is None:
+        raw = b"markdown" if _has_content(rs.state_path) else b"empty"
+    return hashlib.sha256(raw).hexdigest()
+
+
+def _file_hash(path: Path) -> str:
+    digest = hashlib.sha256()
+    try:
+        with path.open("rb") as handle:
+            for chunk in iter(lambda: handle.read(1024 * 1024), b""):
+                digest.update(chunk)
+    except FileNotFoundError:
+        return ""
+    return digest.hexdigest()
+
+
+class PayloadCache:
+    """Content-addressed store of rendered `grd run` payloads.
+
+    Entries are keyed on the skill, the render options and hashes of STATE
+    frontmatter and ROADMAP, so a hit is always the exact output a fresh
+    render would produce. The directory is kept under `max_bytes` by evicting
+    the least recently used entries.
+    """
+
+    def __init__(self, directory: Path, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.directory = directory
+        self.max_bytes = max_bytes
+
+    def key(self, rs: ResearchState, *, skill: str, max_chars: int, as_json: bool) -> str:
+        material = [
+            _VERSION,
+            skill,
+            max_chars,
+            "json" if as_json else "markdown",
+            str(rs.root_dir),
+            str(rs.state_path),
+            _state_hash(rs),
+            _file_hash(rs.roadmap_path),
+        ]
+        return hashlib.sha256(json.dumps(material).encode("utf-8")).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}.txt"
+
+    def get(self, key: str) -> str | None:
+        path = self._path(key)
+        try:
+            text = path.read_text(encoding="utf-8")
+            os.utime(path)
+        except (OSError, ValueError):
+            return None
+        return text
+
+    def put(self, key: str, text: str) -> None:
+        path = self._path(key)
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            write_atomic(path, text.encode("utf-8"), durable=False)
+        except OSError:
+            # A read-only `.grd/` still renders correctly, just without reuse.
+            return
+        self._evict()
+
+    def _evict(self) -> None:
+        entries: list[tuple[int, int, Path]] = []
+        total = 0
+        for path in self.directory.glob("*.txt"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime_ns, stat.st_size, path))
+            total += stat.st_size
+        entries.sort()
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+
+    def clear(self) -> None:
+        for path in self.directory.glob("*.txt"):
+            path.unlink(missing_ok=True)
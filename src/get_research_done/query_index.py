@@ -0,0 +1,298 @@
+from __future__ import annotations
+
+import json
+import os
+import re
+import sqlite3
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any
+
+from .state import QUERY_KINDS, ResearchState, StateContractError, _read_frontmatter
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+CREATE TABLE IF NOT EXISTS sources (path TEXT PRIMARY KEY, size INTEGER NOT NULL, mtime_ns INTEGER NOT NULL);
+CREATE TABLE IF NOT EXISTS records (
+    id INTEGER PRIMARY KEY,
+    kind TEXT NOT NULL,
+    source TEXT NOT NULL,
+    created TEXT NOT NULL DEFAULT '',
+    title TEXT NOT NULL DEFAULT '',
+    body TEXT NOT NULL DEFAULT '',
+    phase_hint TEXT
+);
+CREATE INDEX IF NOT EXISTS records_kind_created ON records (kind, created);
+CREATE INDEX IF NOT EXISTS records_source ON records (source);
+CREATE TABLE IF NOT EXISTS tags (record_id INTEGER NOT NULL, tag TEXT NOT NULL);
+CREATE INDEX IF NOT EXISTS tags_tag ON tags (tag, record_id);
+CREATE TABLE IF NOT EXISTS artifacts (record_id INTEGER NOT NULL, artifact TEXT NOT NULL);
+CREATE INDEX IF NOT EXISTS artifacts_artifact ON artifacts (artifact, record_id);
+"""
+_RELATIVE_SINCE = re.compile(r"^(\d+)([hdw])$")
+
+
+def _parse_since(value: str) -> str:
+    """Accept `7d`/`12h`/`2w` or an ISO date/timestamp; return an ISO lower bound."""
+    match = _RELATIVE_SINCE.match(value.strip())
+    if match:
+        amount, unit = int(match.group(1)), match.group(2)
+        delta = {"h": timedelta(hours=amount), "d": timedelta(days=amount), "w": timedelta(weeks=amount)}[unit]
+        moment = datetime.now(timezone.utc).replace(microsecond=0) - delta
+        return moment.isoformat().replace("+00:00", "Z")
+    try:
+        datetime.fromisoformat(value.strip().replace("Z", "+00:00"))
+    except ValueError as exc:
+        raise StateContractError(f"Invalid --since value: {value!r} (use 7d, 12h, 2w or an ISO date).") from exc
+    return value.strip()
+
+
+def _fts_match(text: str) -> str:
+    return " ".join('"' + token.replace('"', '""') + '"' for token in text.split())
+
+
+def _as_list(value: Any) -> list[str]:
+    if isinstance(value, list):
+        return [str(item).strip() for item in value if str(item).strip()]
+    if value is None or not str(value).strip():
+        return []
+    return [str(value).strip()]
+
+
+class QueryIndex:
+    """SQLite index over `.grd/` events, hypotheses and run indexes.
+
+    `refresh()` is incremental: events are read from the last indexed byte
+    offset and markdown artifacts are re-read only when their size or mtime
+    changed.
+    """
+
+    def __init__(self, rs: ResearchState):
+        self.rs = rs
+        self.path = rs.research_dir / "index.sqlite"
+        rs.research_dir.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.executescript(_SCHEMA)
+        self.has_fts = self._ensure_fts()
+
+    def close(self) -> None:
+        self.conn.close()
+
+    def __enter__(self) -> QueryIndex:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    def _ensure_fts(self) -> bool:
+        try:
+            self.conn.execute("CREATE VIRTUAL TABLE IF NOT EXISTS records_fts USING fts5(title, body)")
+        except sqlite3.OperationalError:
+            return False
+        return True
+
+    def refresh(self) -> dict[str, int]:
+        """Bring the index up to date; return the number of records (re)indexed per kind."""
+        counts = {kind: 0 for kind in QUERY_KINDS}
+        self.conn.execute("BEGIN IMMEDIATE")
+        try:
+            self._refresh_events(counts)
+            self._refresh_markdown("hypothesis", self.rs.hypotheses_dir, counts)
+            self._refresh_markdown("run", self.rs.runs_dir, counts)
+        except BaseException:
+            self.conn.execute("ROLLBACK")
+            raise
+        self.conn.execute("COMMIT")
+        return counts
+
+    def _insert(
+        self,
+        kind: str,
+        source: str,
+        *,
+        created: str,
+        title: str,
+        body: str,
+        phase_hint: str | None = None,
+        tags: list[str] | None = None,
+        artifacts: list[str] | None = None,
+    ) -> None:
+        cursor = self.conn.execute(
+            "INSERT INTO records (kind, source, created, title, body, phase_hint) VALUES (?, ?, ?, ?, ?, ?)",
+            (kind, source, created, title, body, phase_hint),
+        )
+        record_id = cursor.lastrowid
+        if self.has_fts:
+            self.conn.execute(
+                "INSERT INTO records_fts (rowid, title, body) VALUES (?, ?, ?)",
+                (record_id, title, body),
+            )
+        self.conn.executemany("INSERT INTO tags VALUES (?, ?)", [(record_id, tag) for tag in tags or []])
+        self.conn.executemany(
+            "INSERT INTO artifacts VALUES (?, ?)", [(record_id, artifact) for artifact in artifacts or []]
+        )
+
+    def _delete_source(self, source: str) -> None:
+        ids = [row[0] for row in self.conn.execute("SELECT id FROM records WHERE source = ?", (source,))]
+        for table, column in (("tags", "record_id"), ("artifacts", "record_id"), ("records", "id")):
+            self.conn.executemany(f"DELETE FROM {table} WHERE {column} = ?", [(i,) for i in ids])
+        if self.has_fts:
+            self.conn.executemany("DELETE FROM records_fts WHERE rowid = ?", [(i,) for i in ids])
+        self.conn.execute("DELETE FROM sources WHERE path = ?", (source,))
+
+    def _refresh_events(self, counts: dict[str, int]) -> None:
+        events_path = self.rs.events_path
+        source = str(events_path)
+        row = self.conn.execute("SELECT value FROM meta WHERE key = 'events_offset'").fetchone()
+        offset = int(row[0]) if row else 0
+        try:
+            size = events_path.stat().st_size
+        except FileNotFoundError:
+            size = 0
+        if size < offset:
+            # The event log was replaced; start over.
+            self._delete_source(source)
+            offset = 0
+        if size == offset:
+            return
+
+        with events_path.open("rb") as handle:
+            handle.seek(offset)
+            for line in handle:
+                if not line.endswith(b"\n"):
+                    break
+                offset += len(line)
+                try:
+                    event = json.loads(line)
+                except ValueError:
+                    continue
+                kind = event.get("kind") if isinstance(event, dict) else None
+                entry = event.get("entry") if isinstance(event, dict) else None
+                if kind not in ("journal", "experiment") or not isinstance(entry, dict):
+                    continue
+                self._insert(
+                    kind,
+                    source,
+                    created=str(event.get("ts", "")),
+                    title=str(entry.get("what", "")),
+                    body="\n".join(f"{k}: {v}" for k, v in entry.items() if k != "artifacts"),
+                    artifacts=_as_list(entry.get("artifacts")),
+                )
+                counts[kind] += 1
+        self.conn.execute(
+            "INSERT OR REPLACE INTO meta (key, value) VALUES ('events_offset', ?)",
+            (str(offset),),
+        )
+
+    def _markdown_sources(self, kind: str, directory: Path) -> list[str]:
+        try:
+            entries = list(os.scandir(directory))
+        except FileNotFoundError:
+            return []
+        if kind == "hypothesis":
+            return [entry.path for entry in entries if entry.name.endswith(".md") and entry.is_file()]
+        return [os.path.join(entry.path, "0_INDEX.md") for entry in entries if entry.is_dir()]
+
+    def _refresh_markdown(self, kind: str, directory: Path, counts: dict[str, int]) -> None:
+        base = str(directory) + os.sep
+        known = {
+            row["path"]: (row["size"], row["mtime_ns"])
+            for row in self.conn.execute("SELECT path, size, mtime_ns FROM sources")
+            if row["path"].startswith(base)
+        }
+        seen: set[str] = set()
+        for source in self._markdown_sources(kind, directory):
+            try:
+                stat = os.stat(source)
+            except FileNotFoundError:
+                continue
+            seen.add(source)
+            if known.get(source) == (stat.st_size, stat.st_mtime_ns):
+                continue
+            self._delete_source(source)
+            path = Path(source)
+            frontmatter, _ = _read_frontmatter(path, allow_preamble=kind == "run")
+            if kind == "hypothesis":
+                created = str(frontmatter.get("created", ""))
+                phase_hint = str(frontmatter.get("phase_hint", "")) or None
+            else:
+                created = str(frontmatter.get("created_at", ""))
+                phase_hint = str(frontmatter.get("stage", "")) or None
+            self._insert(
+                kind,
+                source,
+                created=created,
+                title=str(frontmatter.get("title", "") or path.stem),
+                body=path.read_text(encoding="utf-8"),
+                phase_hint=phase_hint,
+                tags=_as_list(frontmatter.get("tags")),
+                artifacts=_as_list(frontmatter.get("artifacts")),
+            )
+            self.conn.execute(
+                "INSERT INTO sources (path, size, mtime_ns) VALUES (?, ?, ?)",
+                (source, stat.st_size, stat.st_mtime_ns),
+            )
+            counts[kind] += 1
+        for source in set(known) - seen:
+            self._delete_source(source)
+
+    def search(
+        self,
+        text: str = "",
+        *,
+        kind: str | None = None,
+        tag: str | None = None,
+        artifact: str | None = None,
+        phase: str | None = None,
+        since: str | None = None,
+        limit: int = 20,
+    ) -> list[dict[str, Any]]:
+        clauses: list[str] = []
+        params: list[Any] = []
+        if text.strip():
+            if self.has_fts:
+                clauses.append("r.id IN (SELECT rowid FROM records_fts WHERE records_fts MATCH ?)")
+                params.append(_fts_match(text))
+            else:
+                for token in text.split():
+                    clauses.append("(r.title LIKE ? OR r.body LIKE ?)")
+                    params.extend([f"%{token}%", f"%{token}%"])
+        if kind:
+            clauses.append("r.kind = ?")
+            params.append(kind)
+        if tag:
+            clauses.append("r.id IN (SELECT record_id FROM tags WHERE tag = ?)")
+            params.append(tag)
+        if artifact:
+            clauses.append("r.id IN (SELECT record_id FROM artifacts WHERE artifact LIKE ?)")
+            params.append(f"%{artifact}%")
+        if phase:
+            clauses.append("r.phase_hint = ?")
+            params.append(phase)
+        if since:
+            clauses.append("r.created >= ?")
+            params.append(_parse_since(since))
+
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        rows = self.conn.execute(
+            f"SELECT r.* FROM records r {where} ORDER BY r.created DESC, r.id DESC LIMIT ?",
+            (*params, max(1, limit)),
+        ).fetchall()
+
+        results: list[dict[str, Any]] = []
+        for row in rows:
+            tags = self.conn.execute("SELECT tag FROM tags WHERE record_id = ?", (row["id"],))
+            artifacts = self.conn.execute("SELECT artifact FROM artifacts WHERE record_id = ?", (row["id"],))
+            results.append(
+                {
+                    "kind": row["kind"],
+                    "created": row["created"],
+                    "title": row["title"],
+                    "source": row["source"],
+                    "phase_hint": row["phase_hint"],
+                    "tags": [r[0] for r in tags],
+                    "artifacts": [r[0] for r in artifacts],
+                }
+            )
+        return results
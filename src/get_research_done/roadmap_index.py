@@ -0,0 +1,181 @@
+from __future__ import annotations
+
+import io
+import re
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable
+
+from .frontmatter_cache import FrontmatterCache
+
+
+_HEADING = re.compile(rb"^(#{1,6})\s+(.*?)(?:\s+#+)?\s*$")
+_ITEM = re.compile(rb"^(\s*)(?:[-*+]|\d+[.)])\s+(?:\[([ xX])\]\s+)?(.*?)\s*$")
+_FIELD = re.compile(r"^([A-Za-z][\w ]*?):\s*(.*)$")
+# Template placeholders such as `[Milestone name]` are not real entries.
+_PLACEHOLDER = re.compile(r"^\[[^\]]*\]$")
+_DONE = {"done", "complete", "completed"}
+
+
+@dataclass(frozen=True)
+class RoadmapSection:
+    level: int
+    title: str
+    offset: int
+    end: int
+
+
+@dataclass(frozen=True)
+class Milestone:
+    title: str
+    status: str
+    offset: int
+
+
+@dataclass(frozen=True)
+class RoadmapIndex:
+    """Headings, milestones and next actions of a ROADMAP, from one pass over the file.
+
+    Section bodies are not kept; `read_section` seeks to the recorded byte range.
+    """
+
+    path: Path
+    size: int
+    first_line: str = ""
+    sections: tuple[RoadmapSection, ...] = ()
+    milestones: tuple[Milestone, ...] = ()
+    next_actions: tuple[str, ...] = ()
+
+    @property
+    def active_milestone(self) -> Milestone | None:
+        for milestone in self.milestones:
+            if milestone.status == "doing":
+                return milestone
+        for milestone in self.milestones:
+            if milestone.status not in _DONE:
+                return milestone
+        return None
+
+    def section(self, title: str) -> RoadmapSection | None:
+        wanted = title.strip().lower()
+        for section in self.sections:
+            if section.title.lower() == wanted:
+                return section
+        return None
+
+    def read_section(self, title: str) -> str:
+        section = self.section(title)
+        if section is None:
+            return ""
+        with self.path.open("rb") as handle:
+            handle.seek(section.offset)
+            return handle.read(section.end - section.offset).decode("utf-8", errors="replace")
+
+
+def _section_kind(title: str) -> str:
+    lowered = title.lower()
+    if lowered.startswith("milestone"):
+        return "milestones"
+    if "immediate" in lowered or lowered.startswith("next"):
+        return "next"
+    return ""
+
+
+def _status(value: str) -> str:
+    return value.strip().strip("[]").strip().lower()
+
+
+def parse_roadmap(path: Path) -> RoadmapIndex:
+    """Index `path`; a missing file yields an empty index with `size == 0`."""
+    try:
+        handle = path.open("rb")
+    except FileNotFoundError:
+        return RoadmapIndex(path=path, size=0)
+    with handle:
+        return _index_lines(path, handle)
+
+
+def parse_roadmap_text(text: str, path: Path) -> RoadmapIndex:
+    """Index ROADMAP markdown already in memory; `read_section` still reads `path`."""
+    return _index_lines(path, io.BytesIO(text.encode("utf-8")))
+
+
+def _index_lines(path: Path, lines: Iterable[bytes]) -> RoadmapIndex:
+    first_line = ""
+    sections: list[RoadmapSection] = []
+    open_sections: list[tuple[int, str, int]] = []
+    milestones: list[Milestone] = []
+    next_actions: list[str] = []
+    kind = ""
+    # The milestone being read; its `Status:` detail line may follow the title.
+    milestone: Milestone | None = None
+    offset = 0
+
+    def close_milestone() -> None:
+        nonlocal milestone
+        if milestone is not None and not _PLACEHOLDER.match(milestone.title):
+            milestones.append(milestone)
+        milestone = None
+
+    def close_sections(level: int, end: int) -> None:
+        while open_sections and open_sections[-1][0] >= level:
+            section_level, title, start = open_sections.pop()
+            sections.append(RoadmapSection(section_level, title, start, end))
+
+    for raw in lines:
+        line_offset = offset
+        offset += len(raw)
+        stripped = raw.strip()
+        if not stripped:
+            continue
+        if not first_line:
+            first_line = stripped.decode("utf-8", errors="replace")
+
+        heading = _HEADING.match(raw)
+        if heading:
+            close_milestone()
+            level = len(heading.group(1))
+            title = heading.group(2).decode("utf-8", errors="replace")
+            close_sections(level, line_offset)
+            open_sections.append((level, title, line_offset))
+            kind = _section_kind(title)
+            continue
+
+        item = _ITEM.match(raw)
+        if item is None or not kind:
+            continue
+        indent = len(item.group(1).expandtabs())
+        checkbox = item.group(2)
+        text = item.group(3).decode("utf-8", errors="replace")
+        if kind == "next":
+            if indent == 0 and text and not _PLACEHOLDER.match(text):
+                next_actions.append(text)
+            continue
+        if indent == 0:
+            close_milestone()
+            status = "" if checkbox is None else ("done" if checkbox.strip() else "todo")
+            milestone = Milestone(text, status, line_offset)
+            continue
+        detail = _FIELD.match(text)
+        if milestone is not None and detail and detail.group(1).strip().lower() == "status":
+            milestone = Milestone(milestone.title, _status(detail.group(2)), milestone.offset)
+
+    close_milestone()
+    close_sections(0, offset)
+    sections.sort(key=lambda section: section.offset)
+    return RoadmapIndex(
+        path=path,
+        size=offset,
+        first_line=first_line,
+        sections=tuple(sections),
+        milestones=tuple(milestones),
+        next_actions=tuple(next_actions),
+    )
+
+
+ROADMAP_CACHE = FrontmatterCache(maxsize=8)
+
+
+def load_roadmap_index(path: Path) -> RoadmapIndex:
+    """`parse_roadmap`, memoized on the file's path, size and mtime."""
+    return ROADMAP_CACHE.get(path, parse_roadmap)
@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+import re
+from typing import Any
+
+from .tracing import span
+
+# PyYAML is imported on first use so YAML-free commands (`grd next`,
+# `grd log`, `grd --help`) never load it.
+_yaml: Any = None
+_Loader: Any = None
+_Dumper: Any = None
+
+# Strings the emitter must double-quote. libyaml folds long double-quoted
+# scalars differently from the pure-Python emitter, so any document holding
+# one is dumped with `SafeDumper` to keep output byte-identical.
+_DOUBLE_QUOTED = re.compile(r"[^\n -~]| \n|\n ")
+
+
+def _load_yaml() -> Any:
+    global _yaml, _Loader, _Dumper
+    if _yaml is None:
+        import yaml
+
+        _Loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+        _Dumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+        _yaml = yaml
+    return _yaml
+
+
+def has_libyaml() -> bool:
+    yaml = _load_yaml()
+    return _Loader is not yaml.SafeLoader
+
+
+def _needs_pure_dumper(data: Any) -> bool:
+    stack = [data]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, str):
+            if _DOUBLE_QUOTED.search(item):
+                return True
+        elif isinstance(item, dict):
+            stack.extend(item.keys())
+            stack.extend(item.values())
+        elif isinstance(item, (list, tuple, set)):
+            stack.extend(item)
+    return False
+
+
+def safe_load(text: str) -> Any:
+    """`yaml.safe_load` using the libyaml loader when available."""
+    yaml = _load_yaml()
+    with span("yaml.load", "yaml", chars=len(text)):
+        return yaml.load(text, Loader=_Loader)
+
+
+def safe_dump(data: Any, **kwargs: Any) -> str:
+    """`yaml.safe_dump` using the libyaml dumper when output is identical."""
+    yaml = _load_yaml()
+    dumper = _Dumper
+    if dumper is not yaml.SafeDumper and (kwargs.get("allow_unicode") or _needs_pure_dumper(data)):
+        dumper = yaml.SafeDumper
+    with span("yaml.dump", "yaml"):
+        return yaml.dump(data, Dumper=dumper, **kwargs)
@@ -1,36 +1,190 @@
 from __future__ import annotations
 
+import json
 import os
 import re
+import shutil
+from collections import OrderedDict
+from contextlib import contextmanager
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterator
 
-import yaml
+from .atomic import atomic_replace
+from .entry_index import EntryIndex, IndexedEntry, heading_timestamp
+from .frontmatter_cache import FRONTMATTER_CACHE
+from .locking import file_lock
+from .roadmap_index import RoadmapIndex, load_roadmap_index, parse_roadmap_text
+from .serialization import safe_dump, safe_load
+from .tracing import span
 
 
 MODES = ("explore", "plan", "implement", "evaluate", "synthesize", "promote")
+QUERY_KINDS = ("journal", "experiment", "hypothesis", "run")
+COUNTER_KINDS = ("journal", "experiment", "hypothesis")
+# State keys the digest emits first; the rest follow in file order.
+DIGEST_PRIORITY = (
+    "objective",
+    "objectives",
+    "next_action",
+    "next_actions",
+    "active_run",
+    "active_run_id",
+    "run_id",
+    "current_phase",
+    "current_decision",
+    "stage",
+    "last_update",
+)
+_DIGEST_CACHE_SIZE = 32
+_DIGEST_CACHE: OrderedDict[tuple[Any, ...], str] = OrderedDict()
 
 
 class StateContractError(ValueError):
     """Raised when `.grd` state contract is missing or malformed."""
 
 
-def _parse_frontmatter(content: str) -> dict[str, Any]:
-    if not content.startswith("---"):
-        return {}
-    parts = content.split("---", 2)
-    if len(parts) < 3:
-        return {}
-    parsed = yaml.safe_load(parts[1]) or {}
-    return parsed if isinstance(parsed, dict) else {}
-
-
-def _load_markdown(path: Path) -> str:
-    if not path.exists():
-        return ""
-    return path.read_text(encoding="utf-8")
+def _scan_frontmatter(path: Path, *, allow_preamble: bool = False) -> tuple[bytes | None, int]:
+    """Stream `path` up to the closing `---`; return (raw frontmatter, body offset).
+
+    The markdown body is never read. With `allow_preamble`, blank and heading
+    lines before the opening delimiter are skipped (run `0_INDEX.md` layout).
+    A file without complete frontmatter yields `(None, 0)`.
+    """
+    try:
+        handle = path.open("rb")
+    except FileNotFoundError:
+        return None, 0
+    with handle:
+        line = handle.readline()
+        if allow_preamble:
+            while line and not line.startswith(b"---") and (not line.strip() or line.startswith(b"#")):
+                line = handle.readline()
+        if not line.startswith(b"---"):
+            return None, 0
+        chunks: list[bytes] = [line[3:]]
+        while True:
+            line = handle.readline()
+            if not line:
+                return None, 0
+            if line.rstrip() == b"---":
+                break
+            chunks.append(line)
+        return b"".join(chunks), handle.tell()
+
+
+def _read_frontmatter(path: Path, *, allow_preamble: bool = False) -> tuple[dict[str, Any], int]:
+    with span("read.frontmatter", "io", path=path.name):
+        raw, body_offset = _scan_frontmatter(path, allow_preamble=allow_preamble)
+    if raw is None:
+        return {}, 0
+    parsed = safe_load(raw.decode("utf-8")) or {}
+    return (parsed if isinstance(parsed, dict) else {}), body_offset
+
+
+def _has_content(path: Path) -> bool:
+    try:
+        with path.open("rb") as handle:
+            for chunk in iter(lambda: handle.read(65536), b""):
+                if chunk.strip():
+                    return True
+    except FileNotFoundError:
+        pass
+    return False
+
+
+def _copy_range(source: Any, dest: Any, offset: int) -> None:
+    """Copy `source` from `offset` to EOF onto the end of `dest`, in-kernel when possible."""
+    dest.flush()
+    if hasattr(os, "sendfile"):
+        size = os.fstat(source.fileno()).st_size
+        try:
+            while offset < size:
+                sent = os.sendfile(dest.fileno(), source.fileno(), offset, size - offset)
+                if sent == 0:
+                    break
+                offset += sent
+            dest.seek(0, os.SEEK_END)
+            return
+        except OSError:
+            pass
+    source.seek(offset)
+    shutil.copyfileobj(source, dest, 1024 * 1024)
+
+
+def _replace_with_body(path: Path, head: bytes, body_source: Path | None = None, body_offset: int = 0) -> None:
+    """Write `head` + the body of `body_source` (from `body_offset`) to `path` atomically."""
+    with span("write.replace", "io", path=path.name, head_bytes=len(head)), atomic_replace(path) as dest:
+        dest.write(head)
+        if body_source is not None:
+            try:
+                with body_source.open("rb") as source:
+                    _copy_range(source, dest, body_offset)
+            except FileNotFoundError:
+                pass
+
+
+def _stat_key(path: Path) -> tuple[str, int, int] | None:
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        return None
+    return str(path), stat.st_size, stat.st_mtime_ns
+
+
+def _digest_order(state: dict[str, Any]) -> list[Any]:
+    return [k for k in DIGEST_PRIORITY if k in state] + [k for k in state if k not in DIGEST_PRIORITY]
+
+
+def _digest_pieces(state: dict[str, Any]) -> Iterator[tuple[str, int]]:
+    """Yield (YAML text, items left after it) for `state` in digest priority order.
+
+    Lists and mappings are split per element, so a large value is serialized
+    only as far as the digest reads. Each piece is cut from a dump of
+    `{key: [item]}`/`{key: {k: v}}`, so it has the same bytes the element
+    would have in a dump of the whole state.
+    """
+    keys = _digest_order(state)
+    for position, key in enumerate(keys):
+        later = len(keys) - position - 1
+        value = state[key]
+        if isinstance(value, list) and value:
+            items: list[tuple[Any, Any]] = [(None, item) for item in value]
+        elif isinstance(value, dict) and value:
+            items = list(value.items())
+        else:
+            yield safe_dump({key: value}, sort_keys=False), later
+            continue
+        for index, (sub_key, item) in enumerate(items):
+            wrapped = {key: [item]} if sub_key is None else {key: {sub_key: item}}
+            text = safe_dump(wrapped, sort_keys=False)
+            if index:
+                text = text.split("\n", 1)[1]
+            yield text, later + len(items) - index - 1
+
+
+def _budgeted_state_yaml(state: dict[str, Any], budget: int | None) -> str:
+    """YAML for `state` of at most `budget` characters, cut only between items."""
+    if not state:
+        return "{}" if budget is None or budget >= 2 else ""
+    if budget is None:
+        return safe_dump({k: state[k] for k in _digest_order(state)}, sort_keys=False).strip()
+    emitted: list[str] = []
+    used = 0
+    for text, remaining in _digest_pieces(state):
+        # Each accepted piece reserves room for the marker that would follow it.
+        marker = f"# ... {remaining} more item(s) omitted\n" if remaining else ""
+        if used + len(text) + len(marker) > budget:
+            omitted = f"# ... {remaining + 1} more item(s) omitted\n"
+            # Always fits after an accepted piece (it is that piece's reserved
+            # marker); may not when not even the first piece fit.
+            if used + len(omitted) <= budget:
+                emitted.append(omitted)
+            break
+        emitted.append(text)
+        used += len(text)
+    return "".join(emitted).strip()
 
 
 def _slugify(text: str) -> str:
@@ -41,28 +195,43 @@ def _slugify(text: str) -> str:
 @dataclass(frozen=True)
 class GrdContext:
     state: dict[str, Any]
-    roadmap: str
+    # ROADMAP markdown passed as a `str` (the pre-index API) is indexed in `__post_init__`.
+    roadmap: RoadmapIndex
     repo_root: Path
+    # (path, size, mtime_ns) of the state and roadmap files; enables digest caching.
+    source_key: tuple[Any, ...] | None = None
+
+    def __post_init__(self) -> None:
+        if isinstance(self.roadmap, str):
+            path = Path(self.repo_root) / ".grd" / "ROADMAP.md"
+            object.__setattr__(self, "roadmap", parse_roadmap_text(self.roadmap, path))
 
     def to_markdown(self, max_chars: int = 2400) -> str:
-        roadmap_line = ""
-        for line in self.roadmap.splitlines():
-            if line.strip():
-                roadmap_line = line.strip()
-                break
-        body = [
-            "# GRD State Context",
-            "",
-            "## State",
-            yaml.safe_dump(self.state, sort_keys=False).strip() or "{}",
-            "",
-            "## Roadmap (excerpt)",
-            roadmap_line,
-            "",
-        ]
-        output = "\n".join(body)
+        """Bounded digest; state keys are emitted by `DIGEST_PRIORITY` until `max_chars` is reached."""
+        cache_key = (self.source_key, max_chars) if self.source_key is not None else None
+        if cache_key is not None and cache_key in _DIGEST_CACHE:
+            _DIGEST_CACHE.move_to_end(cache_key)
+            return _DIGEST_CACHE[cache_key]
+
+        head = "# GRD State Context\n\n## State\n"
+        tail = f"\n\n## Roadmap (excerpt)\n{self.roadmap.first_line}\n"
+        active = self.roadmap.active_milestone
+        if active is not None:
+            tail += f"- Active milestone: {active.title}" + (f" ({active.status})" if active.status else "") + "\n"
+        if self.roadmap.next_actions:
+            tail += f"- Next: {self.roadmap.next_actions[0]}\n"
+        budget = max(max_chars - len(head) - len(tail), 0) if max_chars else None
+        with span("render.digest", "render", max_chars=max_chars):
+            output = head + _budgeted_state_yaml(self.state, budget) + tail
         if max_chars and len(output) > max_chars:
-            return output[: max_chars - 3] + "..."
+            # The state YAML always fits its budget, so this only triggers when the
+            # heading and roadmap excerpt alone exceed `max_chars` (state is then empty).
+            output = output[: max(max_chars - 3, 0)] + "..."[: max_chars]
+
+        if cache_key is not None:
+            _DIGEST_CACHE[cache_key] = output
+            while len(_DIGEST_CACHE) > _DIGEST_CACHE_SIZE:
+                _DIGEST_CACHE.popitem(last=False)
         return output
 
     def to_dict(self, include_markdown: bool = False, max_chars: int = 2400) -> dict[str, Any]:
@@ -75,17 +244,63 @@ class GrdContext:
         return payload
 
 
+class StateTransaction:
+    """Changes staged inside `ResearchState.transaction()`.
+
+    Entries are validated when staged, so a bad payload raises before anything
+    is written. `promoted` holds the hypothesis records once the block exits.
+    """
+
+    def __init__(self, research_state: ResearchState):
+        self._rs = research_state
+        self.patches: dict[str, Any] = {}
+        self.journal: list[dict[str, Any]] = []
+        self.experiments: list[dict[str, Any]] = []
+        self.hypotheses: list[dict[str, Any]] = []
+        self.promoted: list[dict[str, Any]] = []
+
+    def update(self, patches: dict[str, Any]) -> None:
+        self.patches.update(patches)
+
+    def append_journal(self, entry: str | dict[str, Any]) -> None:
+        self.journal.append(self._rs._normalize_entry(entry, required=("what", "happened", "why")))
+
+    def append_experiment(self, entry: str | dict[str, Any]) -> None:
+        self.experiments.append(self._rs._normalize_entry(entry, required=("what", "happened", "why")))
+
+    def promote_hypothesis(self, entry: dict[str, Any]) -> None:
+        self.hypotheses.append(self._rs._normalize_hypothesis(entry))
+
+
 class ResearchState:
     """Persistent state + artifact helpers for `.grd/`."""
 
-    def __init__(self, root_dir: str | Path | None = None):
+    def __init__(
+        self,
+        root_dir: str | Path | None = None,
+        *,
+        disk_cache: bool | None = None,
+        lock_timeout: float | None = None,
+    ):
         self.root_dir = Path(root_dir or os.getcwd()).expanduser().resolve()
         self.research_dir = self.root_dir / ".grd"
+        if disk_cache is None:
+            disk_cache = os.environ.get("GRD_DISK_CACHE", "") == "1"
+        self.cache_dir = self.research_dir / "cache"
+        self.frontmatter_cache_path = self.cache_dir / "frontmatter.json" if disk_cache else None
         self.state_path = self._resolve_path("state.md", "STATE.md")
         self.roadmap_path = self._resolve_path("roadmap.md", "ROADMAP.md")
         self.journal_path = self.research_dir / "journal.md"
         self.experiments_path = self.research_dir / "experiments.md"
+        self.events_path = self.research_dir / "events.jsonl"
+        self.rendered_offset_path = self.research_dir / "events.offset"
+        self.counters_path = self.research_dir / "counters.json"
         self.hypotheses_dir = self.research_dir / "hypotheses"
+        # Outside `hypotheses/`, so writing it doesn't move the directory mtime it is stamped with.
+        self.hypothesis_catalog_path = self.research_dir / "hypotheses.catalog.json"
+        self.runs_dir = self.research_dir / "research" / "runs"
+        self.lock_path = self.research_dir / ".lock"
+        self.lock_timeout = lock_timeout
 
     def _resolve_path(self, lower: str, upper: str) -> Path:
         lower_path = self.research_dir / lower
@@ -99,65 +314,172 @@ class ResearchState:
     def _timestamp(self) -> str:
         return datetime.now(timezone.utc).replace(microsecond=0).isoformat().replace("+00:00", "Z")
 
+    @contextmanager
+    def lock(self) -> Iterator[None]:
+        """Exclusive cross-process lock over `.grd/` writes (re-entrant)."""
+        with file_lock(self.lock_path, self.lock_timeout):
+            yield
+
     def load(self) -> dict[str, Any]:
-        content = _load_markdown(self.state_path)
-        parsed = _parse_frontmatter(content)
+        return FRONTMATTER_CACHE.get(self.state_path, self._read_state, disk_path=self.frontmatter_cache_path)
+
+    def _read_state(self, path: Path) -> dict[str, Any]:
+        parsed, _ = _read_frontmatter(path)
         if parsed:
             return parsed
-        if content.strip():
+        if _has_content(path):
             return {
                 "state_format": "markdown",
-                "state_path": str(self.state_path),
+                "state_path": str(path),
             }
         return {}
 
     def update(self, patches: dict[str, Any]) -> dict[str, Any]:
-        state = dict(self.load())
-        state.update(patches)
-        state["last_update"] = datetime.now(timezone.utc).date().isoformat()
-
-        content = _load_markdown(self.state_path)
-        body = ""
-        if content.startswith("---"):
-            parts = content.split("---", 2)
-            if len(parts) >= 3:
-                body = parts[2]
-        else:
-            body = content
-
-        self.research_dir.mkdir(parents=True, exist_ok=True)
-        with self.state_path.open("w", encoding="utf-8") as handle:
-            handle.write("---\n")
-            handle.write(yaml.safe_dump(state, sort_keys=False, default_flow_style=False))
-            handle.write("---\n")
-            handle.write(body)
+        with self.lock(), span("state.update", "state", keys=len(patches)):
+            state = dict(self.load())
+            state.update(patches)
+            state["last_update"] = datetime.now(timezone.utc).date().isoformat()
+
+            _, body_offset = _scan_frontmatter(self.state_path)
+            head = "---\n" + safe_dump(state, sort_keys=False, default_flow_style=False) + "---\n"
+            _replace_with_body(self.state_path, head.encode("utf-8"), self.state_path, body_offset)
         return state
 
     def append_journal(self, entry: str | dict[str, Any]) -> None:
         normalized = self._normalize_entry(entry, required=("what", "happened", "why"))
-        self._append_markdown_entry(self.journal_path, normalized)
+        self._append_events([("journal", normalized)])
 
     def append_experiment(self, entry: str | dict[str, Any]) -> None:
         normalized = self._normalize_entry(entry, required=("what", "happened", "why"))
-        self._append_markdown_entry(self.experiments_path, normalized)
-
-    def _append_markdown_entry(self, path: Path, entry: dict[str, Any]) -> None:
-        self.research_dir.mkdir(parents=True, exist_ok=True)
-        if not path.exists():
-            path.write_text("", encoding="utf-8")
-        lines = [f"## {self._timestamp()}", ""]
-        for key, value in entry.items():
-            if key == "artifacts":
-                lines.append("- artifacts:")
-                for item in value:
-                    lines.append(f"  - {item}")
-                continue
-            lines.append(f"- {key}: {value if value is not None else ''}")
-        block = "\n".join(lines).rstrip() + "\n"
-        with path.open("a", encoding="utf-8") as handle:
-            if path.stat().st_size > 0:
-                handle.write("\n")
-            handle.write(block)
+        self._append_events([("experiment", normalized)])
+
+    def _append_events(self, events: list[tuple[str, dict[str, Any]]]) -> None:
+        if not events:
+            return
+        timestamp = self._timestamp()
+        payload = "".join(
+            json.dumps({"ts": timestamp, "kind": kind, "entry": entry}, ensure_ascii=False) + "\n"
+            for kind, entry in events
+        ).encode("utf-8")
+        with self.lock(), span("write.events", "io", events=len(events), bytes=len(payload)):
+            fd = os.open(self.events_path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+            try:
+                size_before = os.fstat(fd).st_size
+                if self._rendered_offset() > size_before:
+                    # The log was replaced; reset before this append can grow past the stale offset.
+                    _replace_with_body(self.rendered_offset_path, b"0\n")
+                view = memoryview(payload)
+                while view:
+                    view = view[os.write(fd, view):]
+                size_after = os.fstat(fd).st_size
+            finally:
+                os.close(fd)
+            counters = self._load_counters()
+            if counters is not None and counters["events_size"] == size_before:
+                for kind, _ in events:
+                    counters[kind] += 1
+                counters["events_size"] = size_after
+                self._write_counters(counters)
+
+    def _rendered_offset(self) -> int:
+        try:
+            return int(self.rendered_offset_path.read_text(encoding="utf-8").strip() or 0)
+        except (FileNotFoundError, ValueError):
+            return 0
+
+    def _unrendered_start(self, events_size: int) -> int:
+        """Offset of the first event not rendered yet in a log of `events_size` bytes."""
+        offset = self._rendered_offset()
+        # A log shorter than what was rendered was deleted, truncated or
+        # replaced (e.g. checked out from another branch); render it anew.
+        return 0 if offset > events_size else offset
+
+    def render(self) -> dict[str, int]:
+        """Append events not yet rendered to `journal.md` / `experiments.md`.
+
+        Rendering resumes from the byte offset stored in `events.offset`, so
+        each call only touches new events.
+        """
+        rendered = {"journal": 0, "experiment": 0}
+        try:
+            size = self.events_path.stat().st_size
+        except FileNotFoundError:
+            return rendered
+        if self._rendered_offset() == size:
+            return rendered
+
+        with self.lock(), span("render", "render") as traced:
+            offset = self._unrendered_start(self._events_size())
+            pending: dict[str, list[tuple[str, dict[str, Any]]]] = {"journal": [], "experiment": []}
+            with self.events_path.open("rb") as handle:
+                handle.seek(offset)
+                for line in handle:
+                    if not line.endswith(b"\n"):
+                        break
+                    offset += len(line)
+                    try:
+                        event = json.loads(line)
+                    except ValueError:
+                        continue
+                    if isinstance(event, dict) and event.get("kind") in pending:
+                        pending[event["kind"]].append((str(event.get("ts", "")), dict(event.get("entry") or {})))
+            self._append_markdown_entries(self.journal_path, pending["journal"])
+            self._append_markdown_entries(self.experiments_path, pending["experiment"])
+            _replace_with_body(self.rendered_offset_path, f"{offset}\n".encode("utf-8"))
+            traced.set(journal=len(pending["journal"]), experiment=len(pending["experiment"]))
+        return {kind: len(entries) for kind, entries in pending.items()}
+
+    def _append_markdown_entries(self, path: Path, entries: list[tuple[str, dict[str, Any]]]) -> None:
+        if not entries:
+            return
+        blocks: list[tuple[int, bytes]] = []
+        for created, entry in entries:
+            heading = f"## {created}"
+            lines = [heading, ""]
+            for key, value in entry.items():
+                if key == "artifacts":
+                    lines.append("- artifacts:")
+                    for item in value:
+                        lines.append(f"  - {item}")
+                    continue
+                lines.append(f"- {key}: {value if value is not None else ''}")
+            block = ("\n".join(lines).rstrip() + "\n").encode("utf-8")
+            blocks.append((heading_timestamp(heading.encode("utf-8")), block))
+
+        index = EntryIndex(path)
+        with self.lock(), span("write.markdown", "io", path=path.name, entries=len(blocks)):
+            before = index.snapshot()
+            indexed: list[IndexedEntry] = []
+            with path.open("ab") as handle:
+                offset = handle.tell()
+                payload = bytearray()
+                for timestamp, block in blocks:
+                    if offset > 0:
+                        payload += b"\n"
+                        offset += 1
+                    indexed.append(IndexedEntry(offset, timestamp))
+                    payload += block
+                    offset += len(block)
+                handle.write(payload)
+            index.record_append(before, indexed)
+
+    @contextmanager
+    def transaction(self) -> Iterator[StateTransaction]:
+        """Stage updates, log entries and promotions, then flush them together.
+
+        On a clean exit the state is written once, all log entries go to the
+        event log in one append and each hypothesis gets one file. Nothing is
+        written if the block raises.
+        """
+        tx = StateTransaction(self)
+        yield tx
+        with self.lock():
+            state = self.update(tx.patches) if tx.patches else self.load()
+            self._append_events(
+                [("journal", entry) for entry in tx.journal] + [("experiment", entry) for entry in tx.experiments]
+            )
+            for normalized in tx.hypotheses:
+                tx.promoted.append(self._write_hypothesis(normalized, state))
 
     def _normalize_entry(self, entry: str | dict[str, Any], required: tuple[str, ...]) -> dict[str, Any]:
         if isinstance(entry, str):
@@ -184,15 +506,14 @@ class ResearchState:
         return normalized
 
     def promote_hypothesis(self, entry: dict[str, Any]) -> dict[str, Any]:
-        normalized = self._normalize_hypothesis(entry)
+        return self._write_hypothesis(self._normalize_hypothesis(entry), self.load())
+
+    def _write_hypothesis(self, normalized: dict[str, Any], state: dict[str, Any]) -> dict[str, Any]:
         created = self._timestamp()
         stamp = created.replace("-", "").replace(":", "").replace("T", "-").replace("Z", "")
         slug = _slugify(normalized["title"])
 
         self.hypotheses_dir.mkdir(parents=True, exist_ok=True)
-        artifact_path = self.hypotheses_dir / f"{stamp}-{slug}.md"
-
-        state = self.load()
         phase_hint = str(state.get("current_phase", "unknown")) if isinstance(state, dict) else "unknown"
         record = {
             "title": normalized["title"],
@@ -205,10 +526,30 @@ class ResearchState:
             "happened": normalized["happened"],
             "why": normalized["why"],
             "notes": normalized.get("notes", ""),
-            "path": str(artifact_path),
+            "path": "",
         }
 
-        artifact_path.write_text(self.render_hypothesis_markdown(record), encoding="utf-8")
+        with self.lock():
+            dir_mtime_before = self._hypotheses_mtime()
+            artifact_path = self.hypotheses_dir / f"{stamp}-{slug}.md"
+            suffix = 2
+            while artifact_path.exists():
+                artifact_path = self.hypotheses_dir / f"{stamp}-{slug}-{suffix}.md"
+                suffix += 1
+            record["path"] = str(artifact_path)
+            with span("write.hypothesis", "io", path=artifact_path.name):
+                artifact_path.write_text(self.render_hypothesis_markdown(record), encoding="utf-8")
+            catalog = self._load_hypothesis_catalog(dir_mtime_before)
+            if catalog is None:
+                self.rebuild_hypothesis_catalog()
+            else:
+                catalog.append(self._catalog_entry(artifact_path, record))
+                self._write_hypothesis_catalog(catalog, self._hypotheses_mtime())
+            counters = self._load_counters()
+            if counters is not None and counters["hypotheses_mtime_ns"] == dir_mtime_before:
+                counters["hypothesis"] += 1
+                counters["hypotheses_mtime_ns"] = self._hypotheses_mtime()
+                self._write_counters(counters)
         return record
 
     def _normalize_hypothesis(self, entry: dict[str, Any]) -> dict[str, Any]:
@@ -246,6 +587,206 @@ class ResearchState:
             "artifacts": artifacts,
         }
 
+    def _catalog_entry(self, path: Path, frontmatter: dict[str, Any]) -> dict[str, Any]:
+        title = str(frontmatter.get("title") or path.stem)
+        return {
+            "file": path.name,
+            "title": title,
+            "slug": _slugify(title),
+            "created": str(frontmatter.get("created", "")),
+            "phase_hint": frontmatter.get("phase_hint", "unknown"),
+            "source_entry": frontmatter.get("source_entry"),
+            "tags": list(frontmatter.get("tags") or []),
+            "artifacts": list(frontmatter.get("artifacts") or []),
+        }
+
+    def _load_hypothesis_catalog(self, hypotheses_mtime: int) -> list[dict[str, Any]] | None:
+        """Catalog entries if written for `hypotheses/` at `hypotheses_mtime`; None when missing or stale."""
+        try:
+            data = json.loads(self.hypothesis_catalog_path.read_text(encoding="utf-8"))
+        except (FileNotFoundError, ValueError):
+            return None
+        if not isinstance(data, dict) or data.get("hypotheses_mtime_ns") != hypotheses_mtime:
+            return None
+        entries = data.get("hypotheses")
+        return entries if isinstance(entries, list) else None
+
+    def _write_hypothesis_catalog(self, entries: list[dict[str, Any]], hypotheses_mtime: int) -> None:
+        payload = {"version": 2, "hypotheses_mtime_ns": hypotheses_mtime, "hypotheses": entries}
+        _replace_with_body(
+            self.hypothesis_catalog_path,
+            (json.dumps(payload, ensure_ascii=False, indent=2) + "\n").encode("utf-8"),
+        )
+
+    def rebuild_hypothesis_catalog(self) -> list[dict[str, Any]]:
+        """Re-derive `hypotheses/_catalog.json` from the hypothesis files on disk.
+
+        The catalog is maintained by `promote_hypothesis` and rebuilt on read
+        when files were added or removed; rebuild it after editing a
+        hypothesis file in place.
+        """
+        if not self.hypotheses_dir.is_dir():
+            return []
+        with self.lock():
+            # Taken before the scan: a file added meanwhile leaves the catalog stale, not wrong.
+            hypotheses_mtime = self._hypotheses_mtime()
+            entries = [
+                self._catalog_entry(path, _read_frontmatter(path)[0])
+                for path in sorted(self.hypotheses_dir.glob("*.md"))
+            ]
+            self._write_hypothesis_catalog(entries, hypotheses_mtime)
+        return entries
+
+    def _hypothesis_catalog(self) -> list[dict[str, Any]]:
+        entries = self._load_hypothesis_catalog(self._hypotheses_mtime())
+        return self.rebuild_hypothesis_catalog() if entries is None else entries
+
+    def count_hypotheses(self) -> int:
+        return len(self._hypothesis_catalog())
+
+    def _count_hypothesis_files(self) -> int:
+        if not self.hypotheses_dir.is_dir():
+            return 0
+        return sum(1 for _ in self.hypotheses_dir.glob("*.md"))
+
+    def _hypotheses_mtime(self) -> int:
+        try:
+            return self.hypotheses_dir.stat().st_mtime_ns
+        except FileNotFoundError:
+            return 0
+
+    def _load_counters(self) -> dict[str, int] | None:
+        try:
+            data = json.loads(self.counters_path.read_text(encoding="utf-8"))
+        except (FileNotFoundError, ValueError):
+            return None
+        keys = (*COUNTER_KINDS, "events_size", "hypotheses_mtime_ns")
+        if not isinstance(data, dict) or not all(isinstance(data.get(k), int) for k in keys):
+            return None
+        return {k: data[k] for k in keys}
+
+    def _write_counters(self, counters: dict[str, int]) -> None:
+        payload = json.dumps({"version": 1, **counters}, indent=2) + "\n"
+        try:
+            _replace_with_body(self.counters_path, payload.encode("utf-8"))
+        except OSError:
+            # Read-only `.grd/`: counts stay correct, they are just recomputed.
+            pass
+
+    def recount(self) -> dict[str, int]:
+        """Rebuild `.grd/counters.json` from the rendered logs and hypothesis files."""
+        with self.lock(), span("recount", "state"):
+            self.render()
+            counters = {
+                "journal": EntryIndex(self.journal_path).count(),
+                "experiment": EntryIndex(self.experiments_path).count(),
+                "hypothesis": self._count_hypothesis_files(),
+                "events_size": self._rendered_offset(),
+                "hypotheses_mtime_ns": self._hypotheses_mtime(),
+            }
+            self._write_counters(counters)
+        return {k: counters[k] for k in COUNTER_KINDS}
+
+    def _count_events(self, offset: int, counters: dict[str, int]) -> int:
+        """Add journal/experiment events after byte `offset` to `counters`; return the offset counted up to."""
+        try:
+            handle = self.events_path.open("rb")
+        except FileNotFoundError:
+            return offset
+        with handle:
+            handle.seek(offset)
+            for line in handle:
+                if not line.endswith(b"\n"):
+                    break
+                offset += len(line)
+                try:
+                    event = json.loads(line)
+                except ValueError:
+                    continue
+                if isinstance(event, dict) and event.get("kind") in ("journal", "experiment"):
+                    counters[event["kind"]] += 1
+        return offset
+
+    def _caught_up_counters(self, events_size: int) -> dict[str, int] | None:
+        """Stored counters advanced over events and hypotheses added since; None when they need a recount."""
+        counters = self._load_counters()
+        if counters is None or counters["events_size"] > events_size:
+            return None
+        if counters["events_size"] < events_size:
+            counters["events_size"] = self._count_events(counters["events_size"], counters)
+        hypotheses_mtime = self._hypotheses_mtime()
+        if counters["hypotheses_mtime_ns"] != hypotheses_mtime:
+            counters["hypothesis"] = self._count_hypothesis_files()
+            counters["hypotheses_mtime_ns"] = hypotheses_mtime
+        return counters
+
+    def _events_size(self) -> int:
+        try:
+            return self.events_path.stat().st_size
+        except FileNotFoundError:
+            return 0
+
+    def counts(self) -> dict[str, int]:
+        """Journal, experiment and hypothesis totals, maintained in `.grd/counters.json`.
+
+        Appends and promotions bump the counters under the lock. Events or
+        hypothesis files written behind their back are caught up here from the
+        last counted event offset; `recount()` repairs anything else.
+        """
+        events_size = self._events_size()
+        counters = self._load_counters()
+        if (
+            counters is not None
+            and counters["events_size"] == events_size
+            and counters["hypotheses_mtime_ns"] == self._hypotheses_mtime()
+        ):
+            return {k: counters[k] for k in COUNTER_KINDS}
+
+        with self.lock():
+            counters = self._caught_up_counters(events_size)
+            if counters is None:
+                return self.recount()
+            self._write_counters(counters)
+        return {k: counters[k] for k in COUNTER_KINDS}
+
+    def maintained_counts(self) -> dict[str, int] | None:
+        """What `counts()` would report, without writing; None when `counters.json` is missing or unusable."""
+        counters = self._caught_up_counters(self._events_size())
+        return None if counters is None else {k: counters[k] for k in COUNTER_KINDS}
+
+    def count_on_disk(self) -> dict[str, int]:
+        """Totals recomputed from the files without writing anything (no render, no counters, no indexes).
+
+        Journal and experiment totals are the entries already rendered to
+        markdown plus the events not rendered yet.
+        """
+        totals = {
+            "journal": EntryIndex(self.journal_path).count(write=False),
+            "experiment": EntryIndex(self.experiments_path).count(write=False),
+            "hypothesis": self._count_hypothesis_files(),
+        }
+        self._count_events(self._unrendered_start(self._events_size()), totals)
+        return totals
+
+    def list_hypotheses(self, tag: str | None = None) -> list[dict[str, Any]]:
+        records: list[dict[str, Any]] = []
+        for entry in self._hypothesis_catalog():
+            if tag and tag not in entry.get("tags", []):
+                continue
+            records.append({**entry, "path": str(self.hypotheses_dir / entry["file"])})
+        return records
+
+    def list_runs(self) -> list[dict[str, Any]]:
+        if not self.runs_dir.is_dir():
+            return []
+        records: list[dict[str, Any]] = []
+        with span("read.runs", "io") as traced:
+            for path in sorted(self.runs_dir.glob("*/0_INDEX.md")):
+                frontmatter, _ = _read_frontmatter(path, allow_preamble=True)
+                records.append({**frontmatter, "path": str(path)})
+            traced.set(runs=len(records))
+        return records
+
     def render_hypothesis_markdown(self, record: dict[str, Any]) -> str:
         frontmatter = {
             "title": record["title"],
@@ -257,7 +798,7 @@ class ResearchState:
         }
         lines = [
             "---",
-            yaml.safe_dump(frontmatter, sort_keys=False, default_flow_style=False).rstrip(),
+            safe_dump(frontmatter, sort_keys=False, default_flow_style=False).rstrip(),
             "---",
             "",
             f"# {record['title']}",
@@ -309,10 +850,15 @@ class ResearchState:
 def load_context(root_dir: str | Path) -> GrdContext:
     repo_root = Path(root_dir).expanduser().resolve()
     rs = ResearchState(root_dir=repo_root)
+    source_key = (_stat_key(rs.state_path), _stat_key(rs.roadmap_path))
     state = rs.load()
     if not state:
         raise StateContractError("Missing or unreadable `.grd/state.md` or `.grd/STATE.md`.")
-    roadmap = _load_markdown(rs.roadmap_path)
-    if not roadmap:
+    with span("read.roadmap", "io"):
+        roadmap = load_roadmap_index(rs.roadmap_path)
+    if not roadmap.size:
         raise StateContractError("Missing `.grd/roadmap.md` or `.grd/ROADMAP.md`.")
-    return GrdContext(state=state, roadmap=roadmap, repo_root=repo_root)
+    if source_key != (_stat_key(rs.state_path), _stat_key(rs.roadmap_path)):
+        # Changed while we read it; don't let the digest cache pin a torn read.
+        source_key = None
+    return GrdContext(state=state, roadmap=roadmap, repo_root=repo_root, source_key=source_key)
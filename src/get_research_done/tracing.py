@@ -0,0 +1,183 @@
+from __future__ import annotations
+
+import atexit
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+# Opt-in span recording for `grd` / `grd-install`, written as Chrome
+# trace-event JSON (load it in chrome://tracing or https://ui.perfetto.dev).
+# When disabled, `span()` is one global lookup returning a shared no-op, so
+# call sites stay in hot paths unconditionally.
+
+TRACE_ENV = "GRD_TRACE"
+TRACES_DIRNAME = "traces"
+
+
+class _NullSpan:
+    __slots__ = ()
+
+    def __enter__(self) -> _NullSpan:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        return None
+
+    def set(self, **args: Any) -> None:
+        return None
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class _Span:
+    __slots__ = ("tracer", "name", "cat", "args", "start")
+
+    def __init__(self, tracer: Tracer, name: str, cat: str, args: dict[str, Any]):
+        self.tracer = tracer
+        self.name = name
+        self.cat = cat
+        self.args = args
+        self.start = 0
+
+    def __enter__(self) -> _Span:
+        self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type: type[BaseException] | None, *exc: object) -> None:
+        if exc_type is not None:
+            self.args["error"] = exc_type.__name__
+        self.tracer.record(self.name, self.cat, self.start, time.perf_counter_ns(), self.args)
+
+    def set(self, **args: Any) -> None:
+        """Attach results known only at the end of the span (sizes, counts)."""
+        self.args.update(args)
+
+
+class Tracer:
+    """Collects complete ("X") trace events for one process."""
+
+    def __init__(self, destination: Path | None = None):
+        # An explicit `*.json` destination is overwritten; anything else is a
+        # directory that gets one file per process.
+        self.destination = destination
+        self.default_dir: Path | None = None
+        self.events: list[dict[str, Any]] = []
+        self.pid = os.getpid()
+        self._perf_origin = time.perf_counter_ns()
+        self._wall_origin_us = time.time_ns() // 1000
+        self._lock = threading.Lock()
+        self._writes = 0
+
+    def span(self, name: str, cat: str, args: dict[str, Any]) -> _Span:
+        return _Span(self, name, cat, args)
+
+    def _ts(self, perf_ns: int) -> float:
+        # Wall-clock anchored, so traces from separate processes line up.
+        return self._wall_origin_us + (perf_ns - self._perf_origin) / 1000
+
+    def record(self, name: str, cat: str, start_ns: int, end_ns: int, args: dict[str, Any]) -> None:
+        event = {
+            "name": name,
+            "cat": cat,
+            "ph": "X",
+            "ts": self._ts(start_ns),
+            "dur": (end_ns - start_ns) / 1000,
+            "pid": self.pid,
+            "tid": threading.get_ident(),
+        }
+        if args:
+            event["args"] = {
+                key: value if isinstance(value, (int, float, bool)) else str(value) for key, value in args.items()
+            }
+        with self._lock:
+            self.events.append(event)
+
+    def pending(self) -> int:
+        return len(self.events)
+
+    def output_path(self) -> Path:
+        # Long-lived processes (`grd serve`) flush more than once; each write gets its own file.
+        suffix = f"-{self._writes}" if self._writes else ""
+        if self.destination is not None and self.destination.suffix == ".json":
+            return self.destination.with_name(f"{self.destination.stem}{suffix}.json")
+        directory = self.destination or self.default_dir or Path.cwd() / ".grd" / TRACES_DIRNAME
+        stamp = time.strftime("%Y%m%dT%H%M%S", time.gmtime(self._wall_origin_us / 1_000_000))
+        return directory / f"{stamp}-{self.pid}{suffix}.json"
+
+    def write(self, path: Path | None = None) -> Path | None:
+        """Write collected events as a Chrome trace file; None when nothing was recorded."""
+        import json
+
+        from .atomic import write_atomic
+
+        with self._lock:
+            events = list(self.events)
+            self.events.clear()
+        if not events:
+            return None
+        path = path or self.output_path()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        payload = {"traceEvents": events, "displayTimeUnit": "ms"}
+        write_atomic(path, json.dumps(payload).encode("utf-8"), durable=False)
+        self._writes += 1
+        return path
+
+
+_tracer: Tracer | None = None
+
+
+def span(name: str, cat: str = "grd", **args: Any) -> _Span | _NullSpan:
+    """Context manager timing one operation; a shared no-op unless tracing is enabled."""
+    tracer = _tracer
+    if tracer is None:
+        return _NULL_SPAN
+    return tracer.span(name, cat, args)
+
+
+def enabled() -> bool:
+    return _tracer is not None
+
+
+def enable(destination: str | os.PathLike[str] | None = None) -> Tracer:
+    """Start recording spans; they are written at exit (or by `flush`)."""
+    global _tracer
+    if _tracer is None:
+        _tracer = Tracer(Path(destination).expanduser() if destination else None)
+        atexit.register(flush)
+    return _tracer
+
+
+def set_default_dir(directory: Path) -> None:
+    """Where traces go when no destination was given (the CLIs pass `<repo>/.grd/traces`)."""
+    if _tracer is not None:
+        _tracer.default_dir = directory
+
+
+def pending() -> int:
+    """Events recorded but not yet written; 0 when tracing is off."""
+    tracer = _tracer
+    return tracer.pending() if tracer is not None else 0
+
+
+def flush() -> Path | None:
+    tracer = _tracer
+    if tracer is None:
+        return None
+    try:
+        return tracer.write()
+    except OSError:
+        # Tracing must never turn a successful command into a failed one.
+        return None
+
+
+def _enable_from_env() -> None:
+    value = os.environ.get(TRACE_ENV, "")
+    if value in ("", "0"):
+        return
+    enable(None if value == "1" else value)
+
+
+_enable_from_env()
@@ -1,9 +1,12 @@
 from __future__ import annotations
 
 import argparse
+import json
 import sys
+from pathlib import Path
 
-from .installer import SKILL_TARGET_DIRS, uninstall_targets
+from . import tracing
+from .installer import SKILL_TARGET_DIRS, plan_uninstall, uninstall_targets
 
 UNINSTALL_TARGETS = ("codex", "claude", "opencode", "gemini", "all", "core")
 
@@ -46,6 +49,37 @@ def build_parser() -> argparse.ArgumentParser:
         action="store_true",
         help="Also remove .grd/templates and .grd/workflows files managed by get-research-done.",
     )
+    parser.add_argument(
+        "--dest-list",
+        metavar="SPEC",
+        help=(
+            "Uninstall into many repositories: a file with one destination or glob per line "
+            "('-' for stdin), or a glob such as '~/src/*'."
+        ),
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        help="Worker processes for --dest-list (default: CPU count).",
+    )
+    parser.add_argument(
+        "--json",
+        action="store_true",
+        help="With --dest-list, print one JSON summary instead of per-destination lines.",
+    )
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Print the planned file operations as JSON and exit without changing anything.",
+    )
+    parser.add_argument(
+        "--trace",
+        action="store_true",
+        help=(
+            f"Record timing spans to DEST/.grd/{tracing.TRACES_DIRNAME}/ as Chrome trace JSON "
+            f"(or set {tracing.TRACE_ENV})."
+        ),
+    )
     parser.add_argument(
         "--list-targets",
         action="store_true",
@@ -66,6 +100,24 @@ def main() -> int:
         return 0
 
     targets = _parse_targets(args.target or [])
+    if args.trace:
+        tracing.enable()
+    tracing.set_default_dir(Path(args.dest).expanduser().resolve() / ".grd" / tracing.TRACES_DIRNAME)
+    if args.dest_list is not None:
+        from .fleet import main_for_dest_list
+
+        return main_for_dest_list(
+            parser, args, "uninstall", targets, remove_runtime=args.include_runtime, dry_run=args.dry_run
+        )
+
+    if args.dry_run:
+        try:
+            plan = plan_uninstall(args.dest, targets, remove_runtime=args.include_runtime)
+        except ValueError as exc:
+            parser.error(str(exc))
+            return 2
+        print(json.dumps(plan.to_dict(), indent=2))
+        return 0
 
     try:
         result = uninstall_targets(